@@ -47,6 +47,7 @@ def get_db_connection(retries: int = 3):
             conn = sqlite3.connect(DB_PATH, timeout=10.0)
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA foreign_keys = ON")
+            _register_functions(conn)
             return conn
         except sqlite3.OperationalError as e:
             if "locked" in str(e) and attempt < retries - 1:
@@ -60,6 +61,14 @@ def get_db_connection(retries: int = 3):
     raise sqlite3.OperationalError("Database is locked after multiple retries")
 
 
+def _register_functions(conn):
+    """SQL functions the schema's triggers rely on"""
+    # Imported here: the services package imports this module
+    from app.services.schedule_service import sql_habit_is_due
+
+    conn.create_function("habit_is_due", 3, sql_habit_is_due, deterministic=True)
+
+
 def init_db():
     """Initialize database with schema."""
     conn = get_db_connection()
@@ -1,6 +1,7 @@
 """
 Database schema definitions - FIXED
 """
+import sqlite3
 
 
 def create_habits_table(cursor):
@@ -74,6 +75,12 @@ def create_deleted_habits_table(cursor):
         )
     """)
 
+    # Add reminder_times if it doesn't exist, so a restore brings them back
+    try:
+        cursor.execute("ALTER TABLE deleted_habits ADD COLUMN reminder_times TEXT")
+    except:
+        pass
+
 
 def create_settings_table(cursor):
     """Create settings table"""
@@ -118,6 +125,41 @@ def create_goals_table(cursor):
         )
     """)
 
+    # Add expired_at if it doesn't exist; goals from before then get the
+    # 30-day deadline the goals view assumed for them. Only the ALTER is
+    # expected to fail (column already there); the backfill must not.
+    migrating = False
+    try:
+        cursor.execute("ALTER TABLE goals ADD COLUMN expired_at TEXT")
+        migrating = True
+    except sqlite3.OperationalError:
+        pass
+    if migrating:
+        cursor.execute("""
+            UPDATE goals
+            SET deadline = date(COALESCE(created_at, start_date), '+30 days')
+            WHERE deadline IS NULL
+        """)
+        rebuild_goal_progress(cursor)
+
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_goals_open_deadline ON goals(is_completed, deadline)"
+    )
+
+
+def create_habit_reminders_table(cursor):
+    """Create per-habit reminder times table"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS habit_reminders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            habit_id INTEGER NOT NULL,
+            reminder_time TEXT NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (habit_id) REFERENCES habits (id) ON DELETE CASCADE,
+            UNIQUE(habit_id, reminder_time)
+        )
+    """)
+
 
 def create_achievements_table(cursor):
     """Create achievements table"""
@@ -136,6 +178,16 @@ def create_achievements_table(cursor):
     """)
 
 
+def create_meta_table(cursor):
+    """Create key/value table for internal bookkeeping (not user settings)"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS app_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    """)
+
+
 def create_profile_table(cursor):
     """Create user profile table"""
     cursor.execute("""
@@ -173,6 +225,580 @@ def create_notifications_table(cursor):
         )
     """)
 
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_notifications_read_created ON notifications(is_read, created_at)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_notifications_created ON notifications(created_at)"
+    )
+
+    # One-row unread counter kept exact by triggers, so the badge is O(1)
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'notification_counts'"
+    )
+    exists = cursor.fetchone() is not None
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS notification_counts (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            unread INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_notification_counts_insert
+        AFTER INSERT ON notifications
+        WHEN COALESCE(NEW.is_read, 0) = 0
+        BEGIN
+            UPDATE notification_counts SET unread = unread + 1 WHERE id = 1;
+        END
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_notification_counts_delete
+        AFTER DELETE ON notifications
+        WHEN COALESCE(OLD.is_read, 0) = 0
+        BEGIN
+            UPDATE notification_counts SET unread = unread - 1 WHERE id = 1;
+        END
+    """)
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_notification_counts_read
+        AFTER UPDATE OF is_read ON notifications
+        WHEN COALESCE(OLD.is_read, 0) <> COALESCE(NEW.is_read, 0)
+        BEGIN
+            UPDATE notification_counts
+            SET unread = unread + CASE WHEN COALESCE(NEW.is_read, 0) = 0 THEN 1 ELSE -1 END
+            WHERE id = 1;
+        END
+    """)
+
+    if not exists:
+        cursor.execute("""
+            INSERT INTO notification_counts (id, unread)
+            SELECT 1, COUNT(*) FROM notifications WHERE COALESCE(is_read, 0) = 0
+        """)
+
+
+# Recount of every habit's due days from {since}; used for full rebuilds
+DAILY_SUMMARY_RECOUNT_SQL = """
+    UPDATE daily_summary
+    SET active_habit_count = (
+            SELECT COUNT(*) FROM habits h
+            WHERE habit_is_due(h.frequency, h.created_at, daily_summary.day)
+        ),
+        due_completed_count = (
+            SELECT COUNT(*) FROM habit_logs l
+            JOIN habits h ON h.id = l.habit_id
+            WHERE l.completed_date = daily_summary.day
+              AND habit_is_due(h.frequency, h.created_at, daily_summary.day)
+        )
+    WHERE day >= {since};
+    UPDATE daily_summary
+    SET perfect_day = (active_habit_count > 0
+                       AND due_completed_count >= active_habit_count)
+    WHERE day >= {since};
+"""
+
+# 1 if the log's habit is due on the log's day; 0 once the habit is gone
+LOG_DUE_SQL = """
+    COALESCE((SELECT habit_is_due(h.frequency, h.created_at, {log}.completed_date)
+              FROM habits h WHERE h.id = {log}.habit_id), 0)
+"""
+
+# Habits due on a day, per their recurrence schedule
+DUE_HABITS_SQL = """
+    (SELECT COUNT(*) FROM habits WHERE habit_is_due(frequency, created_at, {day}))
+"""
+
+# Adds {sign} times one habit's due days (and its completions on them) to
+# the summary; only that habit's own date range and schedule are read
+HABIT_DUE_DELTA_SQL = """
+    UPDATE daily_summary
+    SET active_habit_count = active_habit_count {sign} 1,
+        due_completed_count = due_completed_count {sign} EXISTS (
+            SELECT 1 FROM habit_logs l
+            WHERE l.habit_id = {habit}.id AND l.completed_date = daily_summary.day
+        )
+    WHERE day >= date({habit}.created_at)
+      AND habit_is_due({habit}.frequency, {habit}.created_at, day);
+"""
+
+
+def create_daily_summary_table(cursor):
+    """
+    Create per-day completion summary kept exact by triggers.
+
+    active_habit_count is the number of habits due that day and
+    due_completed_count the completions of those habits; a day is perfect
+    when every due habit was completed. Due days come from the
+    habit_is_due() SQL function, which database.get_db_connection()
+    registers from ScheduleService, so the triggers only run on the app's
+    own connections.
+    """
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'daily_summary'"
+    )
+    exists = cursor.fetchone() is not None
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS daily_summary (
+            day TEXT PRIMARY KEY,
+            completed_count INTEGER NOT NULL DEFAULT 0,
+            active_habit_count INTEGER NOT NULL DEFAULT 0,
+            due_completed_count INTEGER NOT NULL DEFAULT 0,
+            perfect_day INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+    # Summaries from before schedules were counted are recomputed, with
+    # their old triggers replaced
+    migrating = False
+    if exists:
+        try:
+            cursor.execute(
+                "ALTER TABLE daily_summary ADD COLUMN due_completed_count INTEGER NOT NULL DEFAULT 0"
+            )
+            migrating = True
+        except:
+            pass
+    if migrating:
+        for trigger in (
+            "trg_daily_summary_log_insert",
+            "trg_daily_summary_log_delete",
+            "trg_daily_summary_log_update",
+        ):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+    # Habit triggers used to recount every habit on every day; they are
+    # replaced by ones applying only the changed habit's difference
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' "
+        "AND name = 'trg_daily_summary_habit_remove'"
+    )
+    if cursor.fetchone() is None:
+        for trigger in (
+            "trg_daily_summary_habit_insert",
+            "trg_daily_summary_habit_delete",
+            "trg_daily_summary_habit_schedule",
+        ):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+    def add_log(log):
+        return f"""
+            INSERT OR IGNORE INTO daily_summary (day, active_habit_count)
+            VALUES ({log}.completed_date, {DUE_HABITS_SQL.format(day=f"{log}.completed_date")});
+            UPDATE daily_summary
+            SET completed_count = completed_count + 1,
+                due_completed_count = due_completed_count + {LOG_DUE_SQL.format(log=log)}
+            WHERE day = {log}.completed_date;"""
+
+    def remove_log(log):
+        return f"""
+            UPDATE daily_summary
+            SET completed_count = completed_count - 1,
+                due_completed_count = due_completed_count - {LOG_DUE_SQL.format(log=log)}
+            WHERE day = {log}.completed_date;"""
+
+    def refresh_perfect(day):
+        return f"""
+            UPDATE daily_summary
+            SET perfect_day = (active_habit_count > 0
+                               AND due_completed_count >= active_habit_count)
+            WHERE day = {day};"""
+
+    def refresh_perfect_from(since):
+        return f"""
+            UPDATE daily_summary
+            SET perfect_day = (active_habit_count > 0
+                               AND due_completed_count >= active_habit_count)
+            WHERE day >= date({since});"""
+
+    # A day's row is created by its first completion
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_daily_summary_log_insert
+        AFTER INSERT ON habit_logs
+        BEGIN
+            {add_log("NEW")}
+            {refresh_perfect("NEW.completed_date")}
+        END
+    """)
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_daily_summary_log_delete
+        AFTER DELETE ON habit_logs
+        BEGIN
+            {remove_log("OLD")}
+            {refresh_perfect("OLD.completed_date")}
+        END
+    """)
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_daily_summary_log_update
+        AFTER UPDATE OF completed_date ON habit_logs
+        WHEN OLD.completed_date <> NEW.completed_date
+        BEGIN
+            {remove_log("OLD")}
+            {refresh_perfect("OLD.completed_date")}
+            {add_log("NEW")}
+            {refresh_perfect("NEW.completed_date")}
+        END
+    """)
+
+    # Habit changes add or take away only that habit's due days. A deleted
+    # habit is taken away before its logs are cascaded, while they can still
+    # be seen; the log triggers then find no habit and leave the due counts.
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_daily_summary_habit_insert
+        AFTER INSERT ON habits
+        BEGIN
+            {HABIT_DUE_DELTA_SQL.format(sign="+", habit="NEW")}
+            {refresh_perfect_from("NEW.created_at")}
+        END
+    """)
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_daily_summary_habit_remove
+        BEFORE DELETE ON habits
+        BEGIN
+            {HABIT_DUE_DELTA_SQL.format(sign="-", habit="OLD")}
+            {refresh_perfect_from("OLD.created_at")}
+        END
+    """)
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_daily_summary_habit_schedule
+        AFTER UPDATE OF frequency, created_at ON habits
+        WHEN OLD.frequency IS NOT NEW.frequency OR OLD.created_at IS NOT NEW.created_at
+        BEGIN
+            {HABIT_DUE_DELTA_SQL.format(sign="-", habit="OLD")}
+            {HABIT_DUE_DELTA_SQL.format(sign="+", habit="NEW")}
+            {refresh_perfect_from("MIN(date(OLD.created_at), date(NEW.created_at))")}
+        END
+    """)
+
+    # Runs of perfect days read only the perfect rows
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_daily_summary_perfect
+        ON daily_summary(day) WHERE perfect_day = 1
+    """)
+
+    if not exists or migrating:
+        rebuild_daily_summary(cursor)
+
+
+def rebuild_daily_summary(cursor):
+    """Recompute daily_summary from habit_logs and habits"""
+    cursor.execute("DELETE FROM daily_summary")
+    cursor.execute("""
+        INSERT INTO daily_summary (day, completed_count)
+        SELECT completed_date, COUNT(*)
+        FROM habit_logs
+        GROUP BY completed_date
+    """)
+    for statement in DAILY_SUMMARY_RECOUNT_SQL.format(since="''").split(";"):
+        if statement.strip():
+            cursor.execute(statement)
+
+
+# Completion goals count logs from their start date through their deadline
+GOAL_LOG_IN_RANGE_SQL = """
+    goals.habit_id = {log}.habit_id
+    AND goals.is_completed = 0
+    AND goals.goal_type LIKE '%completions%'
+    AND {log}.completed_date >= date(goals.start_date)
+    AND (goals.deadline IS NULL OR {log}.completed_date <= date(goals.deadline))
+"""
+
+
+def create_goal_progress_triggers(cursor):
+    """Keep completion goal counters in step with habit_logs"""
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_goal_progress_log_insert'"
+    )
+    exists = cursor.fetchone() is not None
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_goal_progress_log_insert
+        AFTER INSERT ON habit_logs
+        BEGIN
+            UPDATE goals SET current_value = current_value + 1
+            WHERE {GOAL_LOG_IN_RANGE_SQL.format(log="NEW")};
+        END
+    """)
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_goal_progress_log_delete
+        AFTER DELETE ON habit_logs
+        BEGIN
+            UPDATE goals SET current_value = MAX(current_value - 1, 0)
+            WHERE {GOAL_LOG_IN_RANGE_SQL.format(log="OLD")};
+        END
+    """)
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_goal_progress_log_update
+        AFTER UPDATE OF completed_date ON habit_logs
+        WHEN OLD.completed_date <> NEW.completed_date
+        BEGIN
+            UPDATE goals SET current_value = MAX(current_value - 1, 0)
+            WHERE {GOAL_LOG_IN_RANGE_SQL.format(log="OLD")};
+            UPDATE goals SET current_value = current_value + 1
+            WHERE {GOAL_LOG_IN_RANGE_SQL.format(log="NEW")};
+        END
+    """)
+
+    if not exists:
+        rebuild_goal_progress(cursor)
+
+
+def rebuild_goal_progress(cursor, goal_id=None):
+    """
+    Recount active completion goals from habit_logs.
+    Only counters that drifted are written; returns how many were fixed.
+    """
+    count_sql = f"""
+        SELECT COUNT(*) FROM habit_logs l
+        WHERE {GOAL_LOG_IN_RANGE_SQL.format(log="l")}
+    """
+    sql = f"""
+        UPDATE goals SET current_value = ({count_sql})
+        WHERE is_completed = 0
+          AND goal_type LIKE '%completions%'
+          AND current_value IS NOT ({count_sql})
+    """
+    if goal_id is None:
+        cursor.execute(sql)
+    else:
+        cursor.execute(sql + " AND id = ?", (goal_id,))
+    return cursor.rowcount
+
+
+# Week rollups start on Monday; 'weekday 0' moves to the coming Sunday
+WEEK_START_SQL = "date({}, 'weekday 0', '-6 days')"
+MONTH_START_SQL = "date({}, 'start of month')"
+
+
+def create_rollup_tables(cursor):
+    """Create weekly/monthly rollup tables, invalidated by triggers"""
+    # Rollups computed before possible counts followed schedules are dropped
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_rollup_habit_schedule'"
+    )
+    outdated = cursor.fetchone() is None
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS period_rollup (
+            granularity TEXT NOT NULL,
+            period_start TEXT NOT NULL,
+            computed_through TEXT NOT NULL,
+            completed_count INTEGER NOT NULL DEFAULT 0,
+            possible_count INTEGER NOT NULL DEFAULT 0,
+            perfect_days INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (granularity, period_start)
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS category_rollup (
+            granularity TEXT NOT NULL,
+            period_start TEXT NOT NULL,
+            category TEXT NOT NULL,
+            completed_count INTEGER NOT NULL DEFAULT 0,
+            possible_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (granularity, period_start, category)
+        )
+    """)
+
+    # A change drops the affected rollup rows; missing rows, and rows of
+    # periods that were still running when computed, are recomputed the
+    # next time a trend covering them is read.
+    def drop_periods(day):
+        week = WEEK_START_SQL.format(day)
+        month = MONTH_START_SQL.format(day)
+        return "\n".join(
+            f"""
+            DELETE FROM {table}
+            WHERE (granularity = 'week' AND period_start = {week})
+               OR (granularity = 'month' AND period_start = {month});"""
+            for table in ("period_rollup", "category_rollup")
+        )
+
+    def drop_periods_from(day):
+        week = WEEK_START_SQL.format(day)
+        month = MONTH_START_SQL.format(day)
+        return "\n".join(
+            f"""
+            DELETE FROM {table}
+            WHERE (granularity = 'week' AND period_start >= {week})
+               OR (granularity = 'month' AND period_start >= {month});"""
+            for table in ("period_rollup", "category_rollup")
+        )
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_rollup_log_insert
+        AFTER INSERT ON habit_logs
+        BEGIN
+            {drop_periods("NEW.completed_date")}
+        END
+    """)
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_rollup_log_delete
+        AFTER DELETE ON habit_logs
+        BEGIN
+            {drop_periods("OLD.completed_date")}
+        END
+    """)
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_rollup_log_update
+        AFTER UPDATE OF completed_date ON habit_logs
+        BEGIN
+            {drop_periods("OLD.completed_date")}
+            {drop_periods("NEW.completed_date")}
+        END
+    """)
+
+    # Habits change the possible count of every period after their creation
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_rollup_habit_insert
+        AFTER INSERT ON habits
+        BEGIN
+            {drop_periods_from("NEW.created_at")}
+        END
+    """)
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_rollup_habit_delete
+        AFTER DELETE ON habits
+        BEGIN
+            {drop_periods_from("OLD.created_at")}
+        END
+    """)
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_rollup_habit_category
+        AFTER UPDATE OF category ON habits
+        BEGIN
+            {drop_periods_from("OLD.created_at")}
+        END
+    """)
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_rollup_habit_schedule
+        AFTER UPDATE OF frequency, created_at ON habits
+        WHEN OLD.frequency IS NOT NEW.frequency OR OLD.created_at IS NOT NEW.created_at
+        BEGIN
+            {drop_periods_from("MIN(date(OLD.created_at), date(NEW.created_at))")}
+        END
+    """)
+
+    if outdated:
+        clear_rollups(cursor)
+
+
+def refresh_rollup_periods(cursor, granularity, periods):
+    """
+    Recompute rollup rows for (period_start, period_end) pairs of one
+    granularity. period_end is clipped to today for the current period
+    and stored as computed_through.
+    """
+    cursor.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS rollup_refresh (period_start TEXT, period_end TEXT)"
+    )
+    cursor.execute("DELETE FROM rollup_refresh")
+    cursor.executemany("INSERT INTO rollup_refresh VALUES (?, ?)", periods)
+
+    for table in ("period_rollup", "category_rollup"):
+        cursor.execute(
+            f"""
+            DELETE FROM {table}
+            WHERE granularity = ?
+              AND period_start IN (SELECT period_start FROM rollup_refresh)
+        """,
+            (granularity,),
+        )
+
+    # Possible completions per period and habit, counted from the compiled
+    # schedule masks rather than by testing each day in SQL
+    from app.models.habit import Habit
+    from app.services.schedule_service import get_schedule_service
+    from app.utils.dates import parse_date
+
+    schedule_service = get_schedule_service()
+    cursor.execute("SELECT * FROM habits")
+    habits = [Habit.from_db_row(row) for row in cursor.fetchall()]
+    possible_rows = []
+    for period_start, period_end in periods:
+        start, end = parse_date(period_start), parse_date(period_end)
+        for habit in habits:
+            if parse_date(habit.created_at) <= end:
+                possible_rows.append(
+                    (period_start, habit.id, schedule_service.count_due_days(habit, start, end))
+                )
+
+    cursor.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS rollup_possible (
+            period_start TEXT,
+            habit_id INTEGER,
+            possible INTEGER,
+            PRIMARY KEY (period_start, habit_id)
+        )
+    """)
+    cursor.execute("DELETE FROM rollup_possible")
+    cursor.executemany("INSERT INTO rollup_possible VALUES (?, ?, ?)", possible_rows)
+
+    cursor.execute(
+        """
+        INSERT INTO period_rollup
+            (granularity, period_start, computed_through,
+             completed_count, possible_count, perfect_days)
+        SELECT
+            ?,
+            p.period_start,
+            p.period_end,
+            COALESCE((SELECT SUM(d.completed_count) FROM daily_summary d
+                      WHERE d.day BETWEEN p.period_start AND p.period_end), 0),
+            COALESCE((SELECT SUM(r.possible) FROM rollup_possible r
+                      WHERE r.period_start = p.period_start), 0),
+            COALESCE((SELECT SUM(d.perfect_day) FROM daily_summary d
+                      WHERE d.day BETWEEN p.period_start AND p.period_end), 0)
+        FROM rollup_refresh p
+    """,
+        (granularity,),
+    )
+
+    cursor.execute(
+        """
+        INSERT INTO category_rollup
+            (granularity, period_start, category, completed_count, possible_count)
+        SELECT
+            ?,
+            p.period_start,
+            COALESCE(h.category, 'General'),
+            SUM((SELECT COUNT(*) FROM habit_logs l
+                 WHERE l.habit_id = h.id
+                   AND l.completed_date BETWEEN p.period_start AND p.period_end)),
+            SUM(r.possible)
+        FROM rollup_refresh p
+        JOIN rollup_possible r ON r.period_start = p.period_start
+        JOIN habits h ON h.id = r.habit_id
+        GROUP BY p.period_start, COALESCE(h.category, 'General')
+    """,
+        (granularity,),
+    )
+
+    cursor.execute("DELETE FROM rollup_refresh")
+    cursor.execute("DELETE FROM rollup_possible")
+
+
+def clear_rollups(cursor):
+    """Drop all rollup rows so they are recomputed on demand"""
+    cursor.execute("DELETE FROM period_rollup")
+    cursor.execute("DELETE FROM category_rollup")
+
 
 def create_tables(cursor):
     """Create all database tables"""
@@ -181,6 +807,11 @@ def create_tables(cursor):
     create_deleted_habits_table(cursor)
     create_settings_table(cursor)
     create_goals_table(cursor)
+    create_habit_reminders_table(cursor)
     create_achievements_table(cursor)
+    create_meta_table(cursor)
     create_profile_table(cursor)
     create_notifications_table(cursor)
+    create_daily_summary_table(cursor)
+    create_goal_progress_triggers(cursor)
+    create_rollup_tables(cursor)
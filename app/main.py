@@ -61,7 +61,13 @@ def main():
     window.showMaximized()
 
     # Start event loop
-    sys.exit(app.exec())
+    exit_code = app.exec()
+
+    # Let queued notifications reach the database before exiting
+    from app.services.notification_service import get_notification_service
+
+    get_notification_service().flush(timeout=2)
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,17 @@
 """
 Goal Model
 """
+from datetime import date, datetime, timedelta
+
+# Goals without an explicit deadline run this many days from creation
+DEFAULT_GOAL_DAYS = 30
 
 class Goal:
     """Goal model class"""
     
     def __init__(self, id=None, habit_id=None, goal_type=None, target_value=0, 
                  current_value=0, is_completed=False, created_at=None, completed_date=None,
-                 description=None, start_date=None):
+                 description=None, start_date=None, deadline=None, expired_at=None):
         self.id = id
         self.habit_id = habit_id
         self.goal_type = goal_type
@@ -18,6 +22,48 @@ class Goal:
         self.completed_date = completed_date
         self.description = description
         self.start_date = start_date
+        self.deadline = deadline
+        self.expired_at = expired_at
+
+    @classmethod
+    def from_db_row(cls, row):
+        keys = row.keys()
+        return cls(
+            id=row["id"],
+            habit_id=row["habit_id"],
+            goal_type=row["goal_type"],
+            target_value=row["target_value"],
+            current_value=row["current_value"],
+            is_completed=bool(row["is_completed"]),
+            created_at=row["created_at"],
+            completed_date=row["completed_date"] if "completed_date" in keys and row["completed_date"] else None,
+            description=row["description"] if "description" in keys else None,
+            start_date=row["start_date"] if "start_date" in keys else None,
+            deadline=row["deadline"] if "deadline" in keys else None,
+            expired_at=row["expired_at"] if "expired_at" in keys else None,
+        )
+
+    @property
+    def is_expired(self) -> bool:
+        """Whether the deadline sweep closed this goal unachieved"""
+        return bool(self.expired_at) and not self.is_completed
+
+    def get_progress_percentage(self) -> int:
+        """Progress towards the target, 0-100"""
+        if not self.target_value or self.target_value <= 0:
+            return 0
+        return min(100, int(self.current_value / self.target_value * 100))
+
+    def get_deadline(self) -> date:
+        """Deadline date, defaulting to DEFAULT_GOAL_DAYS after creation"""
+        if self.deadline:
+            return datetime.strptime(self.deadline[:10], "%Y-%m-%d").date()
+        start = self.created_at or self.start_date
+        if start:
+            start_day = datetime.strptime(start[:10], "%Y-%m-%d").date()
+        else:
+            start_day = date.today()
+        return start_day + timedelta(days=DEFAULT_GOAL_DAYS)
     
     def __repr__(self):
         return f"Goal(id={self.id}, habit_id={self.habit_id}, type={self.goal_type})"
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+Recurrence rule model for custom habit schedules
+
+A rule is stored in the habit's ``frequency`` column as a compact string.
+The legacy values ``daily`` and ``weekly`` keep working; ``weekly`` is due
+once a week, on the weekday the habit was created (the same as
+``days:<that weekday>``). Custom patterns are ``;``-separated tokens,
+e.g. ``days:0,2,4;every:2;except:2026-12-25``.
+
+    days:<weekday,...>   due on these weekdays (Monday = 0)
+    every:<n>            due every n days, counted from the habit's creation
+    monthly:<day>        due on this day of the month (clamped to month end)
+    except:<date,...>    never due on these dates
+
+All tokens must hold for a day to be due.
+"""
+
+import calendar
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import FrozenSet, Optional
+
+from app.utils.constants import FREQUENCY_DAILY, FREQUENCY_WEEKLY
+from app.utils.dates import format_date
+
+ALL_WEEKDAYS = 0b1111111
+WEEKDAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """Compact recurrence model for a habit schedule"""
+
+    weekdays: int = ALL_WEEKDAYS
+    interval_days: int = 1
+    month_day: Optional[int] = None
+    exclusions: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def from_frequency(cls, frequency, anchor: date) -> "RecurrenceRule":
+        """Parse a frequency string; unknown values fall back to daily"""
+        value = (frequency or "").strip().lower()
+
+        if value == FREQUENCY_WEEKLY:
+            return cls(weekdays=1 << anchor.weekday())
+        if value in ("", FREQUENCY_DAILY) or ":" not in value:
+            return cls()
+
+        weekdays = ALL_WEEKDAYS
+        interval_days = 1
+        month_day = None
+        exclusions = set()
+
+        try:
+            for token in value.split(";"):
+                key, _, arg = token.partition(":")
+                key = key.strip()
+                if key == "days":
+                    weekdays = 0
+                    for day in arg.split(","):
+                        weekdays |= 1 << (int(day) % 7)
+                elif key == "every":
+                    interval_days = max(1, int(arg))
+                elif key == "monthly":
+                    month_day = min(max(1, int(arg)), 31)
+                elif key == "except":
+                    exclusions.update(d.strip() for d in arg.split(",") if d.strip())
+        except ValueError:
+            return cls()
+
+        return cls(
+            weekdays=weekdays or ALL_WEEKDAYS,
+            interval_days=interval_days,
+            month_day=month_day,
+            exclusions=frozenset(exclusions),
+        )
+
+    def to_frequency(self) -> str:
+        """Serialize the rule back to its frequency string"""
+        tokens = []
+        if self.weekdays != ALL_WEEKDAYS:
+            days = [str(i) for i in range(7) if self.weekdays >> i & 1]
+            tokens.append(f"days:{','.join(days)}")
+        if self.interval_days > 1:
+            tokens.append(f"every:{self.interval_days}")
+        if self.month_day:
+            tokens.append(f"monthly:{self.month_day}")
+        if self.exclusions:
+            tokens.append(f"except:{','.join(sorted(self.exclusions))}")
+        return ";".join(tokens) or FREQUENCY_DAILY
+
+    def describe(self) -> str:
+        """Human readable summary, e.g. 'Mon, Wed, Fri' or 'Weekly on Mon'"""
+        parts = []
+        if bin(self.weekdays).count("1") == 1:
+            parts.append(f"Weekly on {WEEKDAY_NAMES[self.weekdays.bit_length() - 1]}")
+        elif self.weekdays == 0b0011111:
+            parts.append("Weekdays")
+        elif self.weekdays == 0b1100000:
+            parts.append("Weekends")
+        elif self.weekdays != ALL_WEEKDAYS:
+            parts.append(
+                ", ".join(WEEKDAY_NAMES[i] for i in range(7) if self.weekdays >> i & 1)
+            )
+        if self.interval_days > 1:
+            parts.append(f"every {self.interval_days} days")
+        if self.month_day:
+            parts.append(f"monthly on day {self.month_day}")
+        return " • ".join(parts) or "Daily"
+
+    def is_due(self, day: date, anchor: date) -> bool:
+        """Check a single day against the rule"""
+        if not self.weekdays >> day.weekday() & 1:
+            return False
+        if self.interval_days > 1 and (day - anchor).days % self.interval_days:
+            return False
+        if self.month_day:
+            last_day = calendar.monthrange(day.year, day.month)[1]
+            if day.day != min(self.month_day, last_day):
+                return False
+        return format_date(day) not in self.exclusions
+
+
+@lru_cache(maxsize=1024)
+def compile_year_mask(rule: RecurrenceRule, year: int, anchor: date) -> int:
+    """
+    Compile a rule into a bitmask of due days for one year.
+    Bit i is set when day i of the year (Jan 1 = bit 0) is due.
+    """
+    start = date(year, 1, 1)
+    days_in_year = 366 if calendar.isleap(year) else 365
+
+    if rule == RecurrenceRule():
+        return (1 << days_in_year) - 1
+
+    mask = 0
+    for offset in range(days_in_year):
+        if rule.is_due(start + timedelta(days=offset), anchor):
+            mask |= 1 << offset
+    return mask
+
+
+def day_of_year_index(day: date) -> int:
+    """Zero-based index of a date within its year"""
+    return day.timetuple().tm_yday - 1
+
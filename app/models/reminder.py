@@ -0,0 +1,30 @@
+"""
+Habit reminder model
+"""
+
+from dataclasses import dataclass
+from datetime import time
+from typing import Optional
+
+
+@dataclass
+class HabitReminder:
+    """A daily reminder time for one habit"""
+
+    id: Optional[int]
+    habit_id: int
+    reminder_time: str
+
+    @staticmethod
+    def from_db_row(row) -> "HabitReminder":
+        """Create HabitReminder instance from database row"""
+        return HabitReminder(
+            id=row["id"],
+            habit_id=row["habit_id"],
+            reminder_time=row["reminder_time"],
+        )
+
+    def get_time(self) -> time:
+        """Reminder time of day"""
+        hour, minute = map(int, self.reminder_time.split(":"))
+        return time(hour, minute)
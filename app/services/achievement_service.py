@@ -2,9 +2,117 @@
 Service for managing achievements - SIMPLIFIED
 """
 
+from dataclasses import dataclass
 from datetime import datetime
+import hashlib
+import json
+from typing import Callable, List, Optional, Tuple
 from app.db.database import get_db_connection
 from app.models.achievement import Achievement, ACHIEVEMENT_DEFINITIONS
+from app.services.cache_service import get_cache_service
+from app.utils.dates import get_today
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Domain events achievement rules subscribe to
+COMPLETION_ADDED = "completion_added"
+COMPLETION_REMOVED = "completion_removed"
+HABIT_CREATED = "habit_created"
+HABIT_UPDATED = "habit_updated"
+GOAL_CREATED = "goal_created"
+GOAL_COMPLETED = "goal_completed"
+
+
+@dataclass(frozen=True)
+class AchievementRule:
+    """
+    Unlocks an achievement when metric(service, habit_id) reaches its
+    requirement. Evaluated only for the events it subscribes to; a
+    habit_id of None means "across all habits".
+    """
+
+    achievement_id: str
+    events: Tuple[str, ...]
+    metric: Callable[["AchievementService", Optional[int]], int]
+
+
+def _build_rules() -> List[AchievementRule]:
+    """Rules for the achievement definitions, by category or id"""
+    rules = []
+    for definition in ACHIEVEMENT_DEFINITIONS:
+        achievement_id = definition["id"]
+        if definition["category"] == "streak":
+            rules.append(
+                AchievementRule(
+                    achievement_id,
+                    (COMPLETION_ADDED,),
+                    lambda service, habit_id: service.habit_metric(habit_id, "current_streak"),
+                )
+            )
+        elif definition["category"] == "completion":
+            rules.append(
+                AchievementRule(
+                    achievement_id,
+                    (COMPLETION_ADDED,),
+                    lambda service, habit_id: service.habit_metric(habit_id, "total_completions"),
+                )
+            )
+        elif definition["category"] == "consistency":
+            rules.append(
+                AchievementRule(
+                    achievement_id,
+                    # A schedule change can turn past days perfect
+                    (COMPLETION_ADDED, HABIT_UPDATED),
+                    lambda service, habit_id: service.longest_perfect_run(),
+                )
+            )
+        elif achievement_id == "early_bird":
+            rules.append(
+                AchievementRule(
+                    achievement_id,
+                    (COMPLETION_ADDED,),
+                    lambda service, habit_id: service.logged_in_hours(habit_id, 0, 6),
+                )
+            )
+        elif achievement_id == "night_owl":
+            rules.append(
+                AchievementRule(
+                    achievement_id,
+                    (COMPLETION_ADDED,),
+                    lambda service, habit_id: service.logged_in_hours(habit_id, 22, 24),
+                )
+            )
+        elif achievement_id == "habit_creator":
+            rules.append(
+                AchievementRule(
+                    achievement_id,
+                    (HABIT_CREATED,),
+                    lambda service, habit_id: service.count_rows("habits"),
+                )
+            )
+        elif achievement_id == "goal_setter":
+            rules.append(
+                AchievementRule(
+                    achievement_id,
+                    (GOAL_CREATED,),
+                    lambda service, habit_id: service.count_rows("goals"),
+                )
+            )
+        elif achievement_id == "goal_achiever":
+            rules.append(
+                AchievementRule(
+                    achievement_id,
+                    (GOAL_COMPLETED,),
+                    lambda service, habit_id: service.count_rows(
+                        "goals", "is_completed = 1"
+                    ),
+                )
+            )
+    return rules
+
+
+RULES = _build_rules()
 
 
 class AchievementService:
@@ -12,29 +120,66 @@ class AchievementService:
 
     def __init__(self):
         self.initialize_achievements()
+        self.requirements = {d["id"]: d["requirement"] for d in ACHIEVEMENT_DEFINITIONS}
+        self.names = {d["id"]: d["name"] for d in ACHIEVEMENT_DEFINITIONS}
+        self.rules_by_event = {}
+        for rule in RULES:
+            for event in rule.events:
+                self.rules_by_event.setdefault(event, []).append(rule)
+        self._habit_cache = {}
 
     def initialize_achievements(self):
-        """Initialize achievement definitions in database"""
+        """
+        Sync achievement definitions into the database.
+        Skipped unless the definitions changed since the last sync; then
+        one upsert adds new ones and updates changed metadata, keeping
+        unlock state, and definitions no longer declared are removed.
+        """
+        definitions_hash = hashlib.sha256(
+            json.dumps(ACHIEVEMENT_DEFINITIONS, sort_keys=True).encode()
+        ).hexdigest()
+
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        for achievement_def in ACHIEVEMENT_DEFINITIONS:
-            cursor.execute(
-                """
-                INSERT OR IGNORE INTO achievements 
-                (id, name, description, icon, category, requirement, rarity)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    achievement_def["id"],
-                    achievement_def["name"],
-                    achievement_def["description"],
-                    achievement_def["icon"],
-                    achievement_def["category"],
-                    achievement_def["requirement"],
-                    achievement_def["rarity"],
-                ),
-            )
+        cursor.execute(
+            "SELECT value FROM app_meta WHERE key = 'achievement_definitions_hash'"
+        )
+        row = cursor.fetchone()
+        if row and row["value"] == definitions_hash:
+            conn.close()
+            return
+
+        cursor.executemany(
+            """
+            INSERT INTO achievements
+            (id, name, description, icon, category, requirement, rarity)
+            VALUES (:id, :name, :description, :icon, :category, :requirement, :rarity)
+            ON CONFLICT(id) DO UPDATE SET
+                name = excluded.name,
+                description = excluded.description,
+                icon = excluded.icon,
+                category = excluded.category,
+                requirement = excluded.requirement,
+                rarity = excluded.rarity
+        """,
+            ACHIEVEMENT_DEFINITIONS,
+        )
+
+        ids = [d["id"] for d in ACHIEVEMENT_DEFINITIONS]
+        cursor.execute(
+            f"DELETE FROM achievements WHERE id NOT IN ({', '.join('?' for _ in ids)})",
+            ids,
+        )
+
+        cursor.execute(
+            """
+            INSERT INTO app_meta (key, value)
+            VALUES ('achievement_definitions_hash', ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+        """,
+            (definitions_hash,),
+        )
 
         conn.commit()
         conn.close()
@@ -86,58 +231,180 @@ class AchievementService:
 
             conn.commit()
             conn.close()
+            get_cache_service().bump_version()
             return True
 
         conn.close()
         return False
 
+    def handle_event(self, event: str, habit_id: Optional[int] = None) -> List[str]:
+        """
+        Evaluate the rules subscribed to an event, for the affected habit
+        only, and unlock what they earned. Returns the unlocked names.
+        """
+        try:
+            locked = self._get_locked_ids()
+            rules = [
+                rule
+                for rule in self.rules_by_event.get(event, [])
+                if rule.achievement_id in locked
+            ]
+            return self._evaluate(rules, habit_id)
+        except Exception as e:
+            logger.error(f"Error handling achievement event {event}: {e}")
+            return []
+
     def check_and_unlock_achievements(self):
         """Check all conditions and unlock achievements"""
-        from app.services.habit_service import get_habit_service
-        from app.services.streak_service import get_streak_service
-
-        habit_service = get_habit_service()
-        streak_service = get_streak_service()
-
-        newly_unlocked = []
-        habits = habit_service.get_all_habits()
-
-        # Check streak achievements
-        max_streak = 0
-        for habit in habits:
-            streak_info = streak_service.get_streak_info(habit.id)
-            current_streak = streak_info["current_streak"]
-            max_streak = max(max_streak, current_streak)
-
-        if max_streak >= 7 and self.unlock_achievement("streak_7"):
-            newly_unlocked.append("Week Warrior")
-        if max_streak >= 30 and self.unlock_achievement("streak_30"):
-            newly_unlocked.append("Monthly Master")
-        if max_streak >= 100 and self.unlock_achievement("streak_100"):
-            newly_unlocked.append("Century Champion")
-        if max_streak >= 365 and self.unlock_achievement("streak_365"):
-            newly_unlocked.append("Year Legend")
-
-        # Check completion achievements
-        max_completions = 0
-        for habit in habits:
-            completions = habit_service.get_habit_completions(habit.id)
-            max_completions = max(max_completions, len(completions))
-
-        if max_completions >= 10 and self.unlock_achievement("complete_10"):
-            newly_unlocked.append("Getting Started")
-        if max_completions >= 50 and self.unlock_achievement("complete_50"):
-            newly_unlocked.append("Habit Builder")
-        if max_completions >= 100 and self.unlock_achievement("complete_100"):
-            newly_unlocked.append("Century Club")
-        if max_completions >= 500 and self.unlock_achievement("complete_500"):
-            newly_unlocked.append("Master of Habits")
-
-        # Check habit creator
-        if len(habits) >= 5 and self.unlock_achievement("habit_creator"):
-            newly_unlocked.append("Habit Creator")
-
-        return newly_unlocked
+        locked = self._get_locked_ids()
+        return self._evaluate(
+            [rule for rule in RULES if rule.achievement_id in locked], None
+        )
+
+    def habit_metric(self, habit_id: Optional[int], name: str) -> int:
+        """current_streak or total_completions of a habit, or the max over all habits"""
+        if habit_id is None:
+            from app.services.stats_service import get_stats_service
+
+            overview = get_stats_service().get_overview()
+            return {
+                "current_streak": overview["max_current_streak"],
+                "total_completions": overview["max_total_completions"],
+            }[name]
+
+        key = (get_cache_service().habit_version(habit_id), get_today())
+        cached = self._habit_cache.get(habit_id)
+        if cached is None or cached[0] != key:
+            from app.services.streak_service import get_streak_service
+
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT completed_date FROM habit_logs WHERE habit_id = ?", (habit_id,)
+            )
+            completions = [row["completed_date"] for row in cursor.fetchall()]
+            conn.close()
+
+            cached = (
+                key,
+                {
+                    "current_streak": get_streak_service().current_streak_from_completions(
+                        completions
+                    ),
+                    "total_completions": len(completions),
+                },
+            )
+            self._habit_cache[habit_id] = cached
+
+        return cached[1][name]
+
+    def longest_perfect_run(self) -> int:
+        """Most consecutive days on which every active habit was completed"""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        # Consecutive days share the same (day - row number) offset
+        cursor.execute("""
+            SELECT COALESCE(MAX(run), 0) FROM (
+                SELECT COUNT(*) AS run
+                FROM (
+                    SELECT julianday(day) - ROW_NUMBER() OVER (ORDER BY day) AS island
+                    FROM daily_summary
+                    WHERE perfect_day = 1
+                )
+                GROUP BY island
+            )
+        """)
+        run = cursor.fetchone()[0]
+        conn.close()
+        return run
+
+    def logged_in_hours(self, habit_id: Optional[int], start: int, end: int) -> int:
+        """
+        1 if a completion was logged, on the day it counts for, between
+        local hours start and end. For a habit only its log for today is
+        checked, since a new completion is the only one that can change it.
+        """
+        # created_at is stored in UTC; 'localtime' makes this unindexable,
+        # so the habit check narrows to one row by (habit_id, completed_date)
+        hour = "CAST(strftime('%H', created_at, 'localtime') AS INTEGER)"
+        sql = f"""
+            SELECT EXISTS (
+                SELECT 1 FROM habit_logs
+                WHERE created_at IS NOT NULL
+                  AND date(created_at, 'localtime') = completed_date
+                  AND {hour} >= ? AND {hour} < ?
+                  {{}}
+            )
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        if habit_id is None:
+            cursor.execute(sql.format(""), (start, end))
+        else:
+            cursor.execute(
+                sql.format(
+                    "AND habit_id = ? AND completed_date = date('now', 'localtime')"
+                ),
+                (start, end, habit_id),
+            )
+        found = cursor.fetchone()[0]
+        conn.close()
+        return found
+
+    def count_rows(self, table: str, where: str = "1") -> int:
+        """Row count of a table, for count-based rules"""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE {where}")
+        count = cursor.fetchone()[0]
+        conn.close()
+        return count
+
+    def _evaluate(self, rules, habit_id) -> List[str]:
+        """Run rules and persist the ones that pass in one write"""
+        earned = [
+            rule.achievement_id
+            for rule in rules
+            if rule.metric(self, habit_id) >= self.requirements[rule.achievement_id]
+        ]
+        return self._unlock_many(earned)
+
+    def _get_locked_ids(self) -> frozenset:
+        """Ids of achievements still locked, cached until the data changes"""
+
+        def load():
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT id FROM achievements WHERE is_unlocked = 0")
+            ids = frozenset(row["id"] for row in cursor.fetchall())
+            conn.close()
+            return ids
+
+        return get_cache_service().get_or_compute(("locked_achievements",), load)
+
+    def _unlock_many(self, achievement_ids) -> List[str]:
+        """Unlock achievements in one transaction, returning their names"""
+        if not achievement_ids:
+            return []
+
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        unlocked_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        cursor.executemany(
+            """
+            UPDATE achievements
+            SET is_unlocked = 1, unlocked_date = ?
+            WHERE id = ? AND is_unlocked = 0
+        """,
+            [(unlocked_date, achievement_id) for achievement_id in achievement_ids],
+        )
+
+        conn.commit()
+        conn.close()
+
+        get_cache_service().bump_version()
+        return [self.names[achievement_id] for achievement_id in achievement_ids]
 
     def get_achievement_stats(self):
         """Get achievement statistics"""
@@ -161,6 +428,15 @@ class AchievementService:
         }
 
 
+def publish_event(event: str, habit_id: Optional[int] = None) -> List[str]:
+    """Let achievement rules subscribed to event react to a change"""
+    try:
+        return get_achievement_service().handle_event(event, habit_id)
+    except Exception as e:
+        logger.error(f"Error publishing achievement event {event}: {e}")
+        return []
+
+
 # Global service instance
 _achievement_service_instance = None
 
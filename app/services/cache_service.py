@@ -0,0 +1,79 @@
+"""
+Cache service - memoizes computed results against a data version
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class CacheService:
+    """
+    LRU result cache keyed on a data version.
+    Every write path bumps the version, so cached results are only reused
+    while the data they were computed from is unchanged.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._reset_version = 0
+        self._habit_versions: Dict[int, int] = {}
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def bump_version(self, habit_id: int = None):
+        """
+        Record a data change. Pass the habit that changed, or nothing when
+        the whole dataset changed (import, clear all).
+        """
+        self.version += 1
+        if habit_id is None:
+            self._reset_version = self.version
+            self._habit_versions.clear()
+        else:
+            self._habit_versions[habit_id] = self.version
+
+    def habit_version(self, habit_id: int) -> int:
+        """Version at which a habit's data last changed"""
+        return self._habit_versions.get(habit_id, self._reset_version)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached result for key at the current version"""
+        versioned_key = (key, self.version)
+        if versioned_key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(versioned_key)
+            return self._entries[versioned_key]
+
+        self.misses += 1
+        value = compute()
+        self._entries[versioned_key] = value
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Drop every cached result"""
+        self._entries.clear()
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get hit/miss counters and current size"""
+        return {
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+        }
+
+
+# Global service instance
+_cache_service_instance = None
+
+
+def get_cache_service() -> CacheService:
+    """Get global cache service instance"""
+    global _cache_service_instance
+    if _cache_service_instance is None:
+        _cache_service_instance = CacheService()
+    return _cache_service_instance
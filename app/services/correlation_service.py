@@ -0,0 +1,119 @@
+"""
+Correlation service - which habits get completed on the same days
+"""
+
+from datetime import timedelta
+from typing import Dict, List
+import numpy as np
+from app.services.cache_service import get_cache_service
+from app.services.habit_service import get_habit_service
+from app.services.stats_service import load_completion_log, completion_matrix
+from app.utils.dates import parse_date, get_today
+
+# Pairs need this many shared tracked days before they are reported
+MIN_SHARED_DAYS = 14
+
+
+class CorrelationService:
+    """Service for habit co-completion analysis"""
+
+    def __init__(self):
+        self.habit_service = get_habit_service()
+
+    def get_co_completion(self, days: int = 365) -> Dict:
+        """
+        Get the habits x habits co-completion matrix over the last N days.
+        Returns habits, phi (correlation, -1..1), together (days both were
+        completed) and shared (days both were tracked). Cached until the
+        data changes.
+        """
+        today = parse_date(get_today())
+        return get_cache_service().get_or_compute(
+            ("co_completion", days, today),
+            lambda: self._compute(days, today),
+        )
+
+    def get_top_pairs(self, days: int = 365, limit: int = 3) -> Dict[str, List[Dict]]:
+        """Strongest positive ("together") and negative ("apart") pairs"""
+        result = self.get_co_completion(days)
+        phi, shared = result["phi"], result["shared"]
+        habits = result["habits"]
+
+        upper = np.triu(np.ones_like(phi, dtype=bool), k=1) & (shared >= MIN_SHARED_DAYS)
+        rows, cols = np.nonzero(upper)
+        values = phi[rows, cols]
+        order = np.argsort(values)
+
+        def pairs(indices):
+            return [
+                {
+                    "first": habits[rows[k]],
+                    "second": habits[cols[k]],
+                    "phi": float(values[k]),
+                    "together": int(result["together"][rows[k], cols[k]]),
+                }
+                for k in indices
+            ]
+
+        return {
+            "together": pairs([k for k in order[::-1][:limit] if values[k] > 0]),
+            "apart": pairs([k for k in order[:limit] if values[k] < 0]),
+        }
+
+    def _compute(self, days: int, today) -> Dict:
+        habits = self.habit_service.get_all_habits()
+        n = len(habits)
+        if n == 0:
+            empty = np.zeros((0, 0))
+            return {"habits": [], "phi": empty, "together": empty, "shared": empty}
+
+        index, log_days = load_completion_log(habits)
+        done = completion_matrix(index, log_days, n, today, days).astype(np.float32)
+
+        # Days each habit was tracked: from its creation through today
+        first = today - timedelta(days=days - 1)
+        created = np.array(
+            [(parse_date(habit.created_at) - first).days for habit in habits]
+        )
+        tracked = (np.arange(days)[None, :] >= created[:, None]).astype(np.float32)
+        done *= tracked
+
+        # One product gives every pairwise count:
+        #   X X^T  both done    X A^T  i done while j tracked
+        #   A A^T  both tracked
+        stacked = np.vstack((done, tracked))
+        gram = (stacked @ stacked.T).astype(np.float64)
+        both = gram[:n, :n]
+        i_done = gram[:n, n:]
+        j_done = i_done.T
+        shared = gram[n:, n:]
+
+        # Phi coefficient of the two habits' 2x2 table over shared days
+        numerator = shared * both - i_done * j_done
+        spread = i_done * (shared - i_done) * j_done * (shared - j_done)
+        phi = np.divide(
+            numerator,
+            np.sqrt(np.maximum(spread, 0)),
+            out=np.zeros_like(numerator),
+            where=spread > 0,
+        )
+        np.fill_diagonal(phi, 1.0)
+
+        return {
+            "habits": habits,
+            "phi": phi,
+            "together": both.astype(np.int64),
+            "shared": shared.astype(np.int64),
+        }
+
+
+# Global service instance
+_correlation_service_instance = None
+
+
+def get_correlation_service() -> CorrelationService:
+    """Get global correlation service instance"""
+    global _correlation_service_instance
+    if _correlation_service_instance is None:
+        _correlation_service_instance = CorrelationService()
+    return _correlation_service_instance
@@ -0,0 +1,347 @@
+"""
+Forecast service - per-habit completion trends and probabilities
+"""
+
+from collections import OrderedDict
+from datetime import timedelta
+import threading
+from typing import Dict, List, Optional
+import numpy as np
+from app.services.cache_service import get_cache_service
+from app.services.habit_service import get_habit_service
+from app.services.schedule_service import get_schedule_service
+from app.services.stats_service import (
+    load_completion_log,
+    completion_matrix,
+    streak_lengths,
+)
+from app.utils.dates import parse_date, get_today, format_date
+
+# Days of history the forecast looks at (whole weeks, so weekdays balance)
+HISTORY_DAYS = 364
+# Weight of a day halves every this many days in the weighted rate
+EWMA_HALFLIFE_DAYS = 14
+# Window of the rolling rate, and how many of its points the slope uses
+ROLLING_DAYS = 30
+SLOPE_POINTS = 30
+# Pseudo-observations pulling sparse rates towards their prior
+RATE_PRIOR_WEIGHT = 1.0
+WEEKDAY_PRIOR_WEIGHT = 4.0
+
+# Goal simulation: trials per goal, days of recent behaviour it samples
+# from, and how far ahead it looks for an ETA
+GOAL_TRIALS = 2000
+GOAL_HISTORY_DAYS = 56
+GOAL_HORIZON_DAYS = 365
+
+# Forecasts kept per cache (habits, goals); least recently used go first
+FORECAST_CACHE_ENTRIES = 512
+
+
+class ForecastService:
+    """
+    Service for habit trend signals
+
+    Forecasts are computed for many habits at once from the completion
+    matrix and cached per habit in a bounded LRU; a write only recomputes
+    the habits whose data version changed. Goal forecasts are computed on
+    a worker thread, so their cache is only touched under a lock.
+    """
+
+    def __init__(self, max_entries: int = FORECAST_CACHE_ENTRIES):
+        self.habit_service = get_habit_service()
+        self.schedule_service = get_schedule_service()
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[int, tuple]" = OrderedDict()
+        self._goal_cache: "OrderedDict[int, tuple]" = OrderedDict()
+        self._goal_lock = threading.Lock()
+
+    def get_forecasts(self, habits=None) -> Dict[int, Dict]:
+        """Get forecasts for habits (default: all), keyed by habit id"""
+        if habits is None:
+            habits = self.habit_service.get_all_habits()
+            # Every habit is here, so anything else cached was deleted
+            live = {habit.id for habit in habits}
+            for habit_id in [h for h in self._cache if h not in live]:
+                del self._cache[habit_id]
+
+        today = format_date(parse_date(get_today()))
+        cache_service = get_cache_service()
+
+        def key(habit):
+            return (cache_service.habit_version(habit.id), today, habit.frequency)
+
+        result = {}
+        stale = []
+        for habit in habits:
+            cached = self._lookup(self._cache, habit.id, key(habit))
+            if cached is None:
+                stale.append(habit)
+            else:
+                result[habit.id] = cached[1]
+        if stale:
+            for habit, forecast in zip(stale, self._compute(stale)):
+                self._store(self._cache, habit.id, (key(habit), forecast))
+                result[habit.id] = forecast
+
+        return {habit.id: result[habit.id] for habit in habits}
+
+    def get_forecast(self, habit_id: int) -> Optional[Dict]:
+        """Get the forecast for one habit"""
+        habit = self.habit_service.get_habit_by_id(habit_id)
+        if not habit:
+            return None
+        return self.get_forecasts([habit])[habit_id]
+
+    def get_goal_forecasts(self, goals) -> Dict[int, Optional[Dict]]:
+        """
+        Simulate active goals and return their forecasts keyed by goal id.
+        Each has probability (of reaching the target by the deadline),
+        eta (median date the target is reached, None if unlikely within
+        the horizon) and eta_days. Slow for many goals; call it off the UI
+        thread and use get_cached_goal_forecasts on it.
+        """
+        keys = {goal.id: self._goal_key(goal) for goal in goals}
+        result = {}
+        stale = []
+        with self._goal_lock:
+            for goal in goals:
+                cached = self._lookup(self._goal_cache, goal.id, keys[goal.id])
+                if cached is None:
+                    stale.append(goal)
+                else:
+                    result[goal.id] = cached[1]
+
+        # Simulating is slow, so it runs without holding the lock; results
+        # are stored under the keys they were computed for
+        if stale:
+            forecasts = self._compute_goals(stale)
+            with self._goal_lock:
+                for goal, forecast in zip(stale, forecasts):
+                    self._store(self._goal_cache, goal.id, (keys[goal.id], forecast))
+                    result[goal.id] = forecast
+
+        return {goal.id: result[goal.id] for goal in goals}
+
+    def get_cached_goal_forecasts(self, goals) -> Dict[int, Optional[Dict]]:
+        """Goal forecasts that are still current, without computing any"""
+        keys = {goal.id: self._goal_key(goal) for goal in goals}
+        result = {}
+        with self._goal_lock:
+            for goal in goals:
+                cached = self._lookup(self._goal_cache, goal.id, keys[goal.id])
+                if cached is not None:
+                    result[goal.id] = cached[1]
+        return result
+
+    def _lookup(self, cache, item_id, key):
+        """The (key, forecast) cached for item_id if still current, else None"""
+        cached = cache.get(item_id)
+        if cached is None:
+            return None
+        if cached[0] != key:
+            # Outdated versions are never asked for again
+            cache.pop(item_id, None)
+            return None
+        cache.move_to_end(item_id)
+        return cached
+
+    def _store(self, cache, item_id, entry):
+        cache[item_id] = entry
+        cache.move_to_end(item_id)
+        while len(cache) > self.max_entries:
+            cache.popitem(last=False)
+
+    def _goal_key(self, goal):
+        return (
+            get_cache_service().habit_version(goal.habit_id),
+            get_today(),
+            goal.goal_type,
+            goal.current_value,
+            goal.target_value,
+            goal.get_deadline(),
+        )
+
+    def _compute_goals(self, goals) -> List[Optional[Dict]]:
+        """Monte Carlo forecasts for a list of goals"""
+        today = parse_date(get_today())
+        wanted = {goal.habit_id for goal in goals}
+        habits = [h for h in self.habit_service.get_all_habits() if h.id in wanted]
+        position = {habit.id: i for i, habit in enumerate(habits)}
+        n = len(habits)
+
+        index, days = load_completion_log(habits)
+        done = completion_matrix(index, days, n, today, GOAL_HISTORY_DAYS + 1)
+        streak, _ = streak_lengths(index, days, n, today)
+        completed_today = done[:, -1]
+
+        # Per-weekday completion rates over the recent tracked days,
+        # smoothed towards each habit's overall rate
+        start = today - timedelta(days=GOAL_HISTORY_DAYS)
+        created = np.array(
+            [(parse_date(habit.created_at) - start).days for habit in habits]
+        )
+        tracked = np.arange(GOAL_HISTORY_DAYS)[None, :] >= created[:, None]
+        hits = (done[:, :-1] & tracked).astype(np.float64)
+        weekday = (start.weekday() + np.arange(GOAL_HISTORY_DAYS)) % 7
+        overall = (hits.sum(axis=1) + 1.0) / (tracked.sum(axis=1) + 2.0)
+        weekday_rate = np.stack(
+            [
+                (hits[:, weekday == w].sum(axis=1) + WEEKDAY_PRIOR_WEIGHT * overall)
+                / (tracked[:, weekday == w].sum(axis=1) + WEEKDAY_PRIOR_WEIGHT)
+                for w in range(7)
+            ],
+            1,
+        )
+
+        forecasts = []
+        for goal in goals:
+            i = position.get(goal.habit_id)
+            if i is None:
+                forecasts.append(None)
+                continue
+
+            deadline_days = (goal.get_deadline() - today).days
+            horizon = max(GOAL_HORIZON_DAYS, deadline_days + 1)
+
+            # Simulated days start today, or tomorrow if today is already done
+            offsets = np.arange(horizon) + int(completed_today[i])
+            p = weekday_rate[i, (today.weekday() + offsets) % 7]
+            rng = np.random.default_rng([goal.id, today.toordinal()])
+            draws = rng.random((GOAL_TRIALS, horizon)) < p
+            count = np.cumsum(draws, axis=1)
+
+            if "streak" in goal.goal_type.lower():
+                # The run since the last miss, carrying the current streak
+                # until the first miss
+                at_miss = np.maximum.accumulate(np.where(draws, 0, count), axis=1)
+                missed = np.logical_or.accumulate(~draws, axis=1)
+                progress = count - at_miss + np.where(missed, 0, streak[i])
+            else:
+                progress = goal.current_value + count
+
+            reached = progress >= goal.target_value
+            hit = reached.any(axis=1)
+            eta_days = np.where(hit, offsets[reached.argmax(axis=1)], np.inf)
+            median = float(np.median(eta_days))
+
+            forecasts.append(
+                {
+                    "goal_id": goal.id,
+                    "probability": float(np.mean(eta_days <= deadline_days)),
+                    "eta_days": int(median) if np.isfinite(median) else None,
+                    "eta": format_date(today + timedelta(days=int(median)))
+                    if np.isfinite(median)
+                    else None,
+                }
+            )
+
+        return forecasts
+
+    def _compute(self, habits) -> List[Dict]:
+        """Compute forecasts for a list of habits in one vectorized pass"""
+        today = parse_date(get_today())
+        tomorrow = today + timedelta(days=1)
+        start = today - timedelta(days=HISTORY_DAYS)
+        n = len(habits)
+
+        index, days = load_completion_log(habits)
+        done = completion_matrix(index, days, n, today, HISTORY_DAYS + 1)
+        due = np.stack(
+            [
+                self.schedule_service.get_window_array(habit, start, today)
+                for habit in habits
+            ]
+        )
+
+        # Today is still in progress, so rates use the days before it
+        hits = (done & due)[:, :-1].astype(np.float64)
+        expected = due[:, :-1].astype(np.float64)
+        completed_today = done[:, -1]
+        due_today = due[:, -1]
+        due_tomorrow = np.array(
+            [self.schedule_service.is_due(habit, tomorrow) for habit in habits]
+        )
+
+        # Exponentially weighted rate over due days, yesterday weighted 1
+        age = np.arange(HISTORY_DAYS - 1, -1, -1)
+        weights = 0.5 ** (age / EWMA_HALFLIFE_DAYS)
+        ewma = (hits @ weights + 0.5 * RATE_PRIOR_WEIGHT) / (
+            expected @ weights + RATE_PRIOR_WEIGHT
+        )
+
+        # Rolling 30-day rate for each of the last SLOPE_POINTS days
+        hit_sums = np.concatenate((np.zeros((n, 1)), np.cumsum(hits, axis=1)), axis=1)
+        due_sums = np.concatenate(
+            (np.zeros((n, 1)), np.cumsum(expected, axis=1)), axis=1
+        )
+        ends = np.arange(HISTORY_DAYS - SLOPE_POINTS + 1, HISTORY_DAYS + 1)
+        window_hits = hit_sums[:, ends] - hit_sums[:, ends - ROLLING_DAYS]
+        window_due = due_sums[:, ends] - due_sums[:, ends - ROLLING_DAYS]
+        valid = window_due > 0
+        rolling = np.divide(
+            window_hits, window_due, out=np.zeros_like(window_hits), where=valid
+        )
+
+        # Least-squares slope over the valid points, per habit
+        x = np.arange(SLOPE_POINTS, dtype=np.float64)
+        count = valid.sum(axis=1)
+        safe_count = np.maximum(count, 1)
+        x_mean = (valid * x).sum(axis=1) / safe_count
+        r_mean = (valid * rolling).sum(axis=1) / safe_count
+        dx = (x - x_mean[:, None]) * valid
+        variance = (dx * dx).sum(axis=1)
+        slope = np.divide(
+            (dx * (rolling - r_mean[:, None])).sum(axis=1),
+            variance,
+            out=np.zeros(n),
+            where=(count >= 2) & (variance > 0),
+        )
+
+        # Weekday-specific rates, smoothed towards the weighted rate
+        weekday = (np.arange(start.weekday(), start.weekday() + HISTORY_DAYS)) % 7
+        weekday_hits = np.stack([hits[:, weekday == w].sum(axis=1) for w in range(7)], 1)
+        weekday_due = np.stack(
+            [expected[:, weekday == w].sum(axis=1) for w in range(7)], 1
+        )
+        weekday_rate = (weekday_hits + ewma[:, None] * WEEKDAY_PRIOR_WEIGHT) / (
+            weekday_due + WEEKDAY_PRIOR_WEIGHT
+        )
+
+        def probability(day, is_due):
+            p = 0.5 * ewma + 0.5 * weekday_rate[:, day.weekday()]
+            return np.where(is_due, np.clip(p, 0.0, 1.0), 0.0)
+
+        probability_today = np.where(
+            completed_today, 1.0, probability(today, due_today)
+        )
+        probability_tomorrow = probability(tomorrow, due_tomorrow)
+
+        return [
+            {
+                "habit_id": habit.id,
+                "ewma_rate": float(ewma[i] * 100),
+                "rate_30d": float(rolling[i, -1] * 100),
+                "completions_30d": int(window_hits[i, -1]),
+                "expected_30d": int(window_due[i, -1]),
+                "trend_per_week": float(slope[i] * 7 * 100),
+                "due_today": bool(due_today[i]),
+                "completed_today": bool(completed_today[i]),
+                "due_tomorrow": bool(due_tomorrow[i]),
+                "probability_today": float(probability_today[i]),
+                "probability_tomorrow": float(probability_tomorrow[i]),
+            }
+            for i, habit in enumerate(habits)
+        ]
+
+
+# Global service instance
+_forecast_service_instance = None
+
+
+def get_forecast_service() -> ForecastService:
+    """Get global forecast service instance"""
+    global _forecast_service_instance
+    if _forecast_service_instance is None:
+        _forecast_service_instance = ForecastService()
+    return _forecast_service_instance
@@ -3,8 +3,12 @@ Goal Service - Handles all goal-related operations - FULLY FIXED
 """
 
 from app.db.database import get_db_connection
-from app.models.goal import Goal
-from datetime import datetime
+from app.db.schema import rebuild_goal_progress
+from app.services.achievement_service import publish_event, GOAL_CREATED, GOAL_COMPLETED
+from app.models.goal import Goal, DEFAULT_GOAL_DAYS
+from app.models.habit import Habit
+from datetime import datetime, timedelta
+from app.utils.dates import parse_date, get_today
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,8 +24,8 @@ class GoalService:
         """Redundant: Table is created by init_db() in main.py"""
         pass
 
-    def create_goal(self, habit_id, goal_type, target_value):
-        """Create a new goal"""
+    def create_goal(self, habit_id, goal_type, target_value, description=None, deadline=None):
+        """Create a new goal, due DEFAULT_GOAL_DAYS from today unless a deadline is given"""
         try:
             if not habit_id:
                 return None
@@ -35,21 +39,31 @@ class GoalService:
 
             created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             start_date = datetime.now().strftime("%Y-%m-%d")
-            description = f"{goal_type.replace('_', ' ').title()} for Habit {habit_id}"
+            if not description:
+                description = f"{goal_type.replace('_', ' ').title()} for Habit {habit_id}"
+            if not deadline:
+                deadline = (
+                    datetime.now().date() + timedelta(days=DEFAULT_GOAL_DAYS)
+                ).strftime("%Y-%m-%d")
 
             cursor.execute(
                 """
-                INSERT INTO goals (habit_id, goal_type, target_value, current_value, is_completed, created_at, description, start_date)
-                VALUES (?, ?, ?, 0, 0, ?, ?, ?)
+                INSERT INTO goals (habit_id, goal_type, target_value, current_value, is_completed, created_at, description, start_date, deadline)
+                VALUES (?, ?, ?, 0, 0, ?, ?, ?, ?)
             """,
-                (habit_id, goal_type, target_value, created_at, description, start_date),
+                (habit_id, goal_type, target_value, created_at, description, start_date, deadline),
             )
 
             goal_id = cursor.lastrowid
 
+            # Completion goals start from the logs already in their range
+            rebuild_goal_progress(cursor, goal_id)
+
             conn.commit()
             conn.close()
 
+            publish_event(GOAL_CREATED, habit_id)
+
             return goal_id
 
         except Exception as e:
@@ -60,7 +74,7 @@ class GoalService:
             return None
 
     def get_all_goals(self, include_completed=False):
-        """Get all goals - FIXED"""
+        """Get all goals; without include_completed, only active (not expired) ones"""
         try:
             conn = get_db_connection()
             cursor = conn.cursor()
@@ -69,7 +83,7 @@ class GoalService:
                 cursor.execute("SELECT * FROM goals ORDER BY created_at DESC")
             else:
                 cursor.execute(
-                    "SELECT * FROM goals WHERE is_completed = 0 ORDER BY created_at DESC"
+                    "SELECT * FROM goals WHERE is_completed = 0 AND expired_at IS NULL ORDER BY created_at DESC"
                 )
 
             rows = cursor.fetchall()
@@ -77,18 +91,7 @@ class GoalService:
 
             goals = []
             for row in rows:
-                goal = Goal(
-                    id=row["id"],
-                    habit_id=row["habit_id"],
-                    goal_type=row["goal_type"],
-                    target_value=row["target_value"],
-                    current_value=row["current_value"],
-                    is_completed=bool(row["is_completed"]),
-                    created_at=row["created_at"],
-                    completed_date=row["completed_date"] if "completed_date" in row.keys() and row["completed_date"] else None,
-                    description=row["description"] if "description" in row.keys() else None,
-                    start_date=row["start_date"] if "start_date" in row.keys() else None
-                )
+                goal = Goal.from_db_row(row)
                 goals.append(goal)
 
             return goals
@@ -111,18 +114,7 @@ class GoalService:
             conn.close()
 
             if row:
-                return Goal(
-                    id=row["id"],
-                    habit_id=row["habit_id"],
-                    goal_type=row["goal_type"],
-                    target_value=row["target_value"],
-                    current_value=row["current_value"],
-                    is_completed=bool(row["is_completed"]),
-                    created_at=row["created_at"],
-                    completed_date=row["completed_date"] if "completed_date" in row.keys() and row["completed_date"] else None,
-                    description=row["description"] if "description" in row.keys() else None,
-                    start_date=row["start_date"] if "start_date" in row.keys() else None
-                )
+                return Goal.from_db_row(row)
 
             return None
         except Exception as e:
@@ -142,7 +134,7 @@ class GoalService:
                 )
             else:
                 cursor.execute(
-                    "SELECT * FROM goals WHERE habit_id = ? AND is_completed = 0 ORDER BY created_at DESC",
+                    "SELECT * FROM goals WHERE habit_id = ? AND is_completed = 0 AND expired_at IS NULL ORDER BY created_at DESC",
                     (habit_id,),
                 )
 
@@ -151,18 +143,7 @@ class GoalService:
 
             goals = []
             for row in rows:
-                goal = Goal(
-                    id=row["id"],
-                    habit_id=row["habit_id"],
-                    goal_type=row["goal_type"],
-                    target_value=row["target_value"],
-                    current_value=row["current_value"],
-                    is_completed=bool(row["is_completed"]),
-                    created_at=row["created_at"],
-                    completed_date=row["completed_date"] if "completed_date" in row.keys() and row["completed_date"] else None,
-                    description=row["description"] if "description" in row.keys() else None,
-                    start_date=row["start_date"] if "start_date" in row.keys() else None
-                )
+                goal = Goal.from_db_row(row)
                 goals.append(goal)
 
             return goals
@@ -170,6 +151,115 @@ class GoalService:
             logger.error(f"Error getting goals by habit: {e}")
             return []
 
+    def get_goals_with_habits(self, include_completed=False):
+        """
+        Get goals together with their habits in one query.
+        Returns dicts with goal, habit, days_left (until the deadline,
+        negative once passed) and progress (percent, 0-100).
+        """
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+
+            cursor.execute(
+                f"""
+                SELECT g.*,
+                    h.name AS habit_name,
+                    h.description AS habit_description,
+                    h.category AS habit_category,
+                    h.frequency AS habit_frequency,
+                    h.created_at AS habit_created_at,
+                    CAST(
+                        julianday(COALESCE(
+                            date(g.deadline),
+                            date(COALESCE(g.created_at, g.start_date), ?)
+                        )) - julianday(date('now', 'localtime'))
+                    AS INTEGER) AS days_left
+                FROM goals g
+                JOIN habits h ON h.id = g.habit_id
+                {"" if include_completed else "WHERE g.is_completed = 0 AND g.expired_at IS NULL"}
+                ORDER BY g.created_at DESC
+            """,
+                (f"+{DEFAULT_GOAL_DAYS} days",),
+            )
+            rows = cursor.fetchall()
+            conn.close()
+
+            result = []
+            for row in rows:
+                goal = Goal.from_db_row(row)
+                habit = Habit(
+                    id=row["habit_id"],
+                    name=row["habit_name"],
+                    description=row["habit_description"] or "",
+                    category=row["habit_category"] or "General",
+                    frequency=row["habit_frequency"],
+                    created_at=row["habit_created_at"],
+                )
+                result.append(
+                    {
+                        "goal": goal,
+                        "habit": habit,
+                        "days_left": row["days_left"],
+                        "progress": goal.get_progress_percentage(),
+                    }
+                )
+
+            return result
+        except Exception as e:
+            logger.error(f"Error getting goals with habits: {e}")
+            return []
+
+    def sweep_deadlines(self, soon_days=3):
+        """
+        Mark active goals past their deadline as expired and collect the
+        ones due within soon_days, from one range query on the deadline
+        index. Returns {"expired": [...], "due_soon": [...]} of dicts with
+        id, goal_type, target_value, current_value, deadline and habit_name,
+        or None if the sweep failed.
+        """
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+
+            today = datetime.now().strftime("%Y-%m-%d")
+            horizon = (datetime.now().date() + timedelta(days=soon_days)).strftime(
+                "%Y-%m-%d"
+            )
+
+            cursor.execute(
+                """
+                SELECT g.id, g.goal_type, g.target_value, g.current_value,
+                       g.deadline, h.name AS habit_name
+                FROM goals g
+                JOIN habits h ON h.id = g.habit_id
+                WHERE g.is_completed = 0
+                  AND g.deadline <= ?
+                  AND g.expired_at IS NULL
+                ORDER BY g.deadline
+            """,
+                (horizon,),
+            )
+            rows = [dict(row) for row in cursor.fetchall()]
+
+            expired = [row for row in rows if row["deadline"] < today]
+            due_soon = [row for row in rows if row["deadline"] >= today]
+
+            if expired:
+                expired_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                cursor.executemany(
+                    "UPDATE goals SET expired_at = ? WHERE id = ?",
+                    [(expired_at, row["id"]) for row in expired],
+                )
+
+            conn.commit()
+            conn.close()
+
+            return {"expired": expired, "due_soon": due_soon}
+        except Exception as e:
+            logger.error(f"Error sweeping goal deadlines: {e}")
+            return None
+
     def update_goal_progress(self, goal_id, current_value):
         """Update goal progress"""
         try:
@@ -235,36 +325,191 @@ class GoalService:
             return False
 
     def check_and_update_goals(self, habit_id):
-        """Check and update all active goals for a habit"""
+        """
+        Check and update all active goals for a habit.
+        The streak is computed once, completion counters are read as kept
+        by triggers, all goals are written in one transaction, and
+        notifications go out after commit.
+        """
         try:
             from app.services.streak_service import get_streak_service
-            from app.services.habit_service import get_habit_service
             from app.services.notification_service import get_notification_service
 
-            goals = self.get_goals_by_habit(habit_id, include_completed=False)
-            streak_service = get_streak_service()
-            habit_service = get_habit_service()
+            conn = get_db_connection()
+            cursor = conn.cursor()
+
+            cursor.execute(
+                """
+                SELECT g.id, g.goal_type, g.target_value, g.current_value,
+                       h.name AS habit_name
+                FROM goals g
+                JOIN habits h ON h.id = g.habit_id
+                WHERE g.habit_id = ? AND g.is_completed = 0 AND g.expired_at IS NULL
+                  AND (g.deadline IS NULL OR date(g.deadline) >= date('now', 'localtime'))
+            """,
+                (habit_id,),
+            )
+            goals = cursor.fetchall()
+
+            if not goals:
+                conn.close()
+                return
+
+            streak = None
+            completed_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            updates = []
+            newly_completed = []
 
             for goal in goals:
-                if "streak" in goal.goal_type.lower():
-                    streak_info = streak_service.get_streak_info(habit_id)
-                    current_value = streak_info.get("current_streak", 0)
-                elif "completions" in goal.goal_type.lower():
-                    completions = habit_service.get_habit_completions(habit_id)
-                    current_value = len(completions)
+                goal_type = goal["goal_type"].lower()
+                if "streak" in goal_type:
+                    if streak is None:
+                        cursor.execute(
+                            "SELECT completed_date FROM habit_logs WHERE habit_id = ?",
+                            (habit_id,),
+                        )
+                        streak = get_streak_service().current_streak_from_completions(
+                            [row["completed_date"] for row in cursor.fetchall()]
+                        )
+                    current_value = streak
                 else:
-                    current_value = goal.current_value
+                    # Completion counters are kept current by triggers
+                    current_value = goal["current_value"]
+
+                is_completed = current_value >= goal["target_value"]
+                updates.append(
+                    (
+                        current_value,
+                        int(is_completed),
+                        completed_date if is_completed else None,
+                        goal["id"],
+                    )
+                )
+                if is_completed:
+                    newly_completed.append(goal)
+
+            cursor.executemany(
+                """
+                UPDATE goals
+                SET current_value = ?, is_completed = ?,
+                    completed_date = COALESCE(?, completed_date)
+                WHERE id = ?
+            """,
+                updates,
+            )
 
-                self.update_goal_progress(goal.id, current_value)
+            conn.commit()
+            conn.close()
 
-                if current_value >= goal.target_value:
-                    if self.complete_goal(goal.id):
-                        get_notification_service().send_goal_completed(
-                            goal.goal_type, goal.target_value
-                        )
+            for goal in newly_completed:
+                get_notification_service().send_goal_completed(
+                    goal["goal_type"], goal["target_value"], goal["habit_name"]
+                )
+            if newly_completed:
+                publish_event(GOAL_COMPLETED, habit_id)
         except Exception as e:
             logger.error(f"Error checking and updating goals: {e}")
 
+    def update_all_goals_progress(self):
+        """
+        Refresh progress of every active goal.
+        Completion counters are verified with one set-based recount and
+        streaks come from one batch computation; all goals are written in
+        one transaction.
+        """
+        try:
+            from app.services.habit_service import get_habit_service
+            from app.services.notification_service import get_notification_service
+            from app.services.stats_service import load_completion_log, streak_lengths
+
+            conn = get_db_connection()
+            cursor = conn.cursor()
+
+            # Verify the trigger-maintained counters before using them
+            drifted = rebuild_goal_progress(cursor)
+            if drifted:
+                logger.warning(f"Rebuilt {drifted} drifted goal counters")
+
+            cursor.execute(
+                """
+                SELECT g.id, g.habit_id, g.goal_type, g.target_value, g.current_value,
+                       h.name AS habit_name
+                FROM goals g
+                JOIN habits h ON h.id = g.habit_id
+                WHERE g.is_completed = 0 AND g.expired_at IS NULL
+                  AND (g.deadline IS NULL OR date(g.deadline) >= date('now', 'localtime'))
+            """
+            )
+            goals = cursor.fetchall()
+
+            if not goals:
+                conn.commit()
+                conn.close()
+                return
+
+            streak_habits = {
+                goal["habit_id"] for goal in goals if "streak" in goal["goal_type"].lower()
+            }
+            streaks = {}
+            if streak_habits:
+                habits = [
+                    habit
+                    for habit in get_habit_service().get_all_habits()
+                    if habit.id in streak_habits
+                ]
+                index, days = load_completion_log(habits)
+                current, _ = streak_lengths(
+                    index, days, len(habits), parse_date(get_today())
+                )
+                streaks = {habit.id: int(current[i]) for i, habit in enumerate(habits)}
+
+            completed_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            updates = []
+            newly_completed = []
+
+            for goal in goals:
+                goal_type = goal["goal_type"].lower()
+                if "streak" in goal_type:
+                    current_value = streaks.get(goal["habit_id"], 0)
+                else:
+                    current_value = goal["current_value"]
+
+                is_completed = current_value >= goal["target_value"]
+                if current_value == goal["current_value"] and not is_completed:
+                    continue
+                updates.append(
+                    (
+                        current_value,
+                        int(is_completed),
+                        completed_date if is_completed else None,
+                        goal["id"],
+                    )
+                )
+                if is_completed:
+                    newly_completed.append(goal)
+
+            cursor.executemany(
+                """
+                UPDATE goals
+                SET current_value = ?, is_completed = ?,
+                    completed_date = COALESCE(?, completed_date)
+                WHERE id = ?
+            """,
+                updates,
+            )
+
+            conn.commit()
+            conn.close()
+
+            for goal in newly_completed:
+                get_notification_service().send_goal_completed(
+                    goal["goal_type"], goal["target_value"], goal["habit_name"]
+                )
+            if newly_completed:
+                publish_event(GOAL_COMPLETED)
+        except Exception as e:
+            logger.error(f"Error updating all goals progress: {e}")
+
 
 # Singleton instance
 _goal_service_instance = None
@@ -5,6 +5,15 @@ Service layer for habit-related operations - FIXED
 from datetime import datetime
 from app.db.database import get_db_connection
 from app.models.habit import Habit
+from app.services.cache_service import get_cache_service
+from app.services.reminder_service import get_reminder_service
+from app.services.achievement_service import (
+    publish_event,
+    COMPLETION_ADDED,
+    COMPLETION_REMOVED,
+    HABIT_CREATED,
+    HABIT_UPDATED,
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -33,6 +42,9 @@ class HabitService:
         conn.commit()
         conn.close()
 
+        get_cache_service().bump_version(habit_id)
+        publish_event(HABIT_CREATED, habit_id)
+
         return habit_id
 
     def get_all_habits(self, category=None):
@@ -93,9 +105,13 @@ class HabitService:
             query = f"UPDATE habits SET {', '.join(updates)} WHERE id = ?"
             cursor.execute(query, params)
             conn.commit()
+            get_cache_service().bump_version(habit_id)
 
         conn.close()
 
+        if updates:
+            publish_event(HABIT_UPDATED, habit_id)
+
     def hard_delete_habit(self, habit_id, save_to_trash=True):
         """Delete a habit (optionally save to trash first)"""
         if save_to_trash:
@@ -110,8 +126,11 @@ class HabitService:
                 cursor.execute(
                     """
                     INSERT INTO deleted_habits 
-                    (original_habit_id, name, description, category, frequency, created_at, completion_count)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    (original_habit_id, name, description, category, frequency, created_at,
+                     completion_count, reminder_times)
+                    VALUES (?, ?, ?, ?, ?, ?, ?,
+                            (SELECT group_concat(reminder_time, ',')
+                             FROM habit_reminders WHERE habit_id = ?))
                 """,
                     (
                         habit.id,
@@ -121,6 +140,7 @@ class HabitService:
                         habit.frequency,
                         habit.created_at,
                         completion_count,
+                        habit.id,
                     ),
                 )
 
@@ -135,6 +155,8 @@ class HabitService:
         conn.commit()
         conn.close()
 
+        get_cache_service().bump_version(habit_id)
+
     def mark_habit_complete(self, habit_id, date=None, notes=""):
         """Mark a habit as complete for a specific date"""
         if date is None:
@@ -154,17 +176,21 @@ class HabitService:
 
             conn.commit()
             conn.close()
-
-            from app.services.goal_service import get_goal_service
-
-            get_goal_service().check_and_update_goals(habit_id)
-
-            return True
         except Exception as e:
             conn.close()
             logger.error(f"Error marking complete: {e}")
             return False
 
+        # The completion is saved; follow-up work can't change the result
+        get_cache_service().bump_version(habit_id)
+
+        from app.services.goal_service import get_goal_service
+
+        get_goal_service().check_and_update_goals(habit_id)
+        publish_event(COMPLETION_ADDED, habit_id)
+
+        return True
+
     def unmark_habit_complete(self, habit_id, date=None):
         """Remove completion for a specific date"""
         if date is None:
@@ -184,6 +210,8 @@ class HabitService:
         conn.commit()
         conn.close()
 
+        get_cache_service().bump_version(habit_id)
+
         try:
             from app.services.goal_service import get_goal_service
 
@@ -191,6 +219,8 @@ class HabitService:
         except Exception as e:
             logger.error(f"Error updating goals on unmark: {e}")
 
+        publish_event(COMPLETION_REMOVED, habit_id)
+
     def is_habit_completed_today(self, habit_id):
         """Check if habit is completed today"""
         today = datetime.now().strftime("%Y-%m-%d")
@@ -296,14 +326,22 @@ class HabitService:
                 ),
             )
 
+            habit_id = cursor.lastrowid
+
             cursor.execute(
                 "DELETE FROM deleted_habits WHERE id = ?", (deleted_habit_id,)
             )
 
             conn.commit()
+            get_cache_service().bump_version(habit_id)
+            publish_event(HABIT_CREATED, habit_id)
 
         conn.close()
 
+        # The delete cascaded the reminders away; bring them back too
+        if deleted and deleted["reminder_times"]:
+            get_reminder_service().set_reminders(habit_id, deleted["reminder_times"].split(","))
+
     def empty_trash(self):
         """Permanently delete all habits in trash"""
         conn = get_db_connection()
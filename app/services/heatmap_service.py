@@ -0,0 +1,120 @@
+"""
+Heatmap service - per-day completion intensity for a calendar year
+"""
+
+import calendar
+from datetime import date
+from typing import List
+import numpy as np
+from app.db.database import get_db_connection
+from app.services.cache_service import get_cache_service
+from app.utils.dates import parse_date, get_today, format_date
+
+
+class HeatmapService:
+    """Service for calendar heatmap data"""
+
+    def get_year_intensity(self, year: int, habit_id: int = None) -> np.ndarray:
+        """
+        Get one value per day of the year (Jan 1 = index 0).
+        All habits: share of active habits completed that day (0-1).
+        One habit: 1.0 when completed, 0.0 when not.
+        Days before tracking started or after today are NaN.
+        """
+        today = parse_date(get_today())
+        return get_cache_service().get_or_compute(
+            ("heatmap", year, habit_id, today if year == today.year else None),
+            lambda: self._compute_year_intensity(year, habit_id, today),
+        )
+
+    def get_available_years(self) -> List[int]:
+        """Years from the first habit's creation through the current year"""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT MIN(date(created_at)) AS first FROM habits")
+        row = cursor.fetchone()
+
+        conn.close()
+
+        current = parse_date(get_today()).year
+        first = parse_date(row["first"]).year if row and row["first"] else current
+        return list(range(min(first, current), current + 1))
+
+    def _compute_year_intensity(self, year: int, habit_id, today: date) -> np.ndarray:
+        start = date(year, 1, 1)
+        end = date(year, 12, 31)
+        days_in_year = 366 if calendar.isleap(year) else 365
+
+        grid = np.full(days_in_year, np.nan, dtype=np.float32)
+
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        if habit_id is None:
+            cursor.execute("SELECT MIN(date(created_at)) AS first FROM habits")
+            row = cursor.fetchone()
+            first = row["first"] if row else None
+
+            cursor.execute(
+                """
+                SELECT day, due_completed_count, active_habit_count FROM daily_summary
+                WHERE day BETWEEN ? AND ?
+            """,
+                (format_date(start), format_date(end)),
+            )
+            rows = [
+                (
+                    row["day"],
+                    row["due_completed_count"] / row["active_habit_count"]
+                    if row["active_habit_count"]
+                    else 0.0,
+                )
+                for row in cursor.fetchall()
+            ]
+        else:
+            cursor.execute(
+                "SELECT date(created_at) AS first FROM habits WHERE id = ?",
+                (habit_id,),
+            )
+            row = cursor.fetchone()
+            first = row["first"] if row else None
+
+            cursor.execute(
+                """
+                SELECT completed_date FROM habit_logs
+                WHERE habit_id = ? AND completed_date BETWEEN ? AND ?
+            """,
+                (habit_id, format_date(start), format_date(end)),
+            )
+            rows = [(row["completed_date"], 1.0) for row in cursor.fetchall()]
+
+        conn.close()
+
+        if first is None:
+            return grid
+
+        # Tracked range of this year: creation (or Jan 1) through today
+        first_index = (max(parse_date(first), start) - start).days
+        last_index = (min(today, end) - start).days
+        if first_index <= last_index:
+            grid[first_index : last_index + 1] = 0.0
+
+        for day, value in rows:
+            index = (parse_date(day) - start).days
+            if 0 <= index < days_in_year:
+                grid[index] = value
+
+        return grid
+
+
+# Global service instance
+_heatmap_service_instance = None
+
+
+def get_heatmap_service() -> HeatmapService:
+    """Get global heatmap service instance"""
+    global _heatmap_service_instance
+    if _heatmap_service_instance is None:
+        _heatmap_service_instance = HeatmapService()
+    return _heatmap_service_instance
@@ -0,0 +1,289 @@
+"""
+Notification dispatcher - delivers notifications off the GUI thread
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List
+import logging
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# A batch is sent once this many notifications are waiting, or once the
+# first one has waited BATCH_WAIT_SECONDS for company
+BATCH_SIZE = 20
+BATCH_WAIT_SECONDS = 0.05
+
+
+@dataclass
+class PendingNotification:
+    title: str
+    message: str
+    type: str = "reminder"
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    enqueued: float = field(default_factory=time.monotonic)
+
+
+def deliver_desktop(title: str, message: str) -> bool:
+    """Show a desktop notification with the platform's notifier"""
+    try:
+        if sys.platform == "linux":
+            result = subprocess.run(
+                [
+                    "notify-send",
+                    "--app-name=Growthly",
+                    "--icon=dialog-information",
+                    title,
+                    message,
+                ],
+                check=False,
+                capture_output=True,
+                text=True,
+            )
+
+            if result.returncode == 0:
+                logger.info(f"✅ Notification sent: {title}")
+                return True
+            logger.error(f"❌ notify-send failed: {result.stderr}")
+            return False
+
+        elif sys.platform == "darwin":
+            subprocess.run(
+                [
+                    "osascript",
+                    "-e",
+                    f'display notification "{message}" with title "{title}"',
+                ],
+                check=False,
+                capture_output=True,
+            )
+            return True
+
+        elif sys.platform == "win32":
+            from win10toast import ToastNotifier
+
+            toaster = ToastNotifier()
+            toaster.show_toast(title, message, duration=5, threaded=True)
+            return True
+
+    except Exception as e:
+        logger.error(f"❌ Notification error: {e}")
+    return False
+
+
+class NotificationDispatcher:
+    """
+    Queue drained by one background worker thread
+
+    Each batch is persisted with one write and then shown on the
+    desktop, so a slow notification daemon never blocks the caller.
+
+    Usage:
+        dispatcher = NotificationDispatcher(deliver_desktop, save_batch)
+        dispatcher.submit(PendingNotification("Title", "Message"))
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[str, str], bool],
+        persist: Callable[[List[PendingNotification]], None],
+    ):
+        self.deliver = deliver
+        self.persist = persist
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stats = {
+            "submitted": 0,
+            "delivered": 0,
+            "failed": 0,
+            "persisted": 0,
+            "persist_failures": 0,
+            "batches": 0,
+        }
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def submit(self, notification: PendingNotification):
+        """Queue a notification; returns immediately"""
+        with self._lock:
+            self._stats["submitted"] += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="notification-dispatcher", daemon=True
+                )
+                self._thread.start()
+        self._queue.put(notification)
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until everything queued so far is handled"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def get_stats(self) -> Dict:
+        """Delivery counters and latency (queue to desktop) in milliseconds"""
+        with self._lock:
+            stats = dict(self._stats)
+            finished = stats["delivered"] + stats["failed"]
+            stats["pending"] = self._queue.unfinished_tasks
+            stats["avg_latency_ms"] = (
+                self._latency_total / finished * 1000 if finished else 0.0
+            )
+            stats["max_latency_ms"] = self._latency_max * 1000
+        return stats
+
+    def _next_batch(self) -> List[PendingNotification]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + BATCH_WAIT_SECONDS
+        while len(batch) < BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=max(remaining, 0)))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                try:
+                    self.persist(batch)
+                    persisted, persist_failed = len(batch), 0
+                except Exception as e:
+                    logger.error(f"❌ Error saving notifications: {e}")
+                    persisted, persist_failed = 0, len(batch)
+
+                for notification in batch:
+                    ok = self.deliver(notification.title, notification.message)
+                    latency = time.monotonic() - notification.enqueued
+                    with self._lock:
+                        self._stats["delivered" if ok else "failed"] += 1
+                        self._latency_total += latency
+                        self._latency_max = max(self._latency_max, latency)
+
+                with self._lock:
+                    self._stats["batches"] += 1
+                    self._stats["persisted"] += persisted
+                    self._stats["persist_failures"] += persist_failed
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+# Notifications with the same key arriving within this window are merged
+COALESCE_WINDOW_SECONDS = 2.0
+# An identical notification within this long of the last one is dropped
+DEDUPE_SECONDS = 600
+# At most this many notifications go out per minute; later groups wait
+# (and keep absorbing new arrivals) until a slot frees up
+MAX_PER_MINUTE = 6
+
+
+@dataclass
+class _Group:
+    items: List[PendingNotification]
+    summarize: Callable[[List[PendingNotification]], tuple]
+    timer: threading.Timer = None
+
+
+class NotificationCoalescer:
+    """
+    Merges bursts before they reach the dispatcher
+
+    Notifications sharing a key within COALESCE_WINDOW_SECONDS become one,
+    using the group's summarize(items) -> (title, message) when there is
+    more than one distinct item. Identical repeats are dropped unless added
+    with dedupe=False, and the per-minute rate is capped.
+    """
+
+    def __init__(self, submit: Callable[[PendingNotification], None]):
+        self.submit = submit
+        self._lock = threading.Lock()
+        self._groups: Dict = {}
+        self._recent: Dict[tuple, float] = {}
+        self._sent_times: List[float] = []
+        self.stats = {"coalesced": 0, "deduplicated": 0, "deferred": 0}
+
+    def add(self, notification: PendingNotification, key=None, summarize=None, dedupe=True):
+        """
+        Queue a notification under key (default: its exact text). Without
+        dedupe it is a distinct event and never dropped as a repeat.
+        """
+        identity = (notification.title, notification.message)
+        with self._lock:
+            now = time.monotonic()
+            if dedupe and now - self._recent.get(identity, -DEDUPE_SECONDS) < DEDUPE_SECONDS:
+                self.stats["deduplicated"] += 1
+                return
+
+            key = key if key is not None else identity
+            group = self._groups.get(key)
+            if group is not None:
+                if dedupe and identity in {(n.title, n.message) for n in group.items}:
+                    self.stats["deduplicated"] += 1
+                else:
+                    group.items.append(notification)
+                    self.stats["coalesced"] += 1
+                return
+
+            group = _Group([notification], summarize or (lambda items: identity))
+            self._groups[key] = group
+            self._schedule(key, group, COALESCE_WINDOW_SECONDS)
+
+    def flush(self):
+        """Send every pending group now, ignoring the window and rate cap"""
+        with self._lock:
+            keys = list(self._groups)
+        for key in keys:
+            self._release(key, force=True)
+
+    def _schedule(self, key, group, delay):
+        group.timer = threading.Timer(delay, self._release, (key,))
+        group.timer.daemon = True
+        group.timer.start()
+
+    def _release(self, key, force=False):
+        with self._lock:
+            group = self._groups.get(key)
+            if group is None:
+                return
+
+            now = time.monotonic()
+            self._sent_times = [t for t in self._sent_times if now - t < 60]
+            if not force and len(self._sent_times) >= MAX_PER_MINUTE:
+                self.stats["deferred"] += 1
+                self._schedule(key, group, 60 - (now - self._sent_times[0]))
+                return
+
+            del self._groups[key]
+            if group.timer is not None:
+                group.timer.cancel()
+            self._sent_times.append(now)
+
+            first = group.items[0]
+            if len(group.items) == 1:
+                notification = first
+            else:
+                title, message = group.summarize(group.items)
+                notification = PendingNotification(
+                    title, message, first.type, enqueued=first.enqueued
+                )
+            for item in group.items:
+                self._recent[(item.title, item.message)] = now
+            self._recent = {
+                identity: sent
+                for identity, sent in self._recent.items()
+                if now - sent < DEDUPE_SECONDS
+            }
+
+        self.submit(notification)
@@ -2,94 +2,110 @@
 Notification service - FIXED daily reminder
 """
 
-import sys
-import subprocess
 from app.db.database import get_db_connection
+from app.services.notification_dispatcher import (
+    NotificationCoalescer,
+    NotificationDispatcher,
+    PendingNotification,
+    deliver_desktop,
+)
 from app.services.settings_service import get_settings_service
+from datetime import datetime, timedelta
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Notifications older than this, or beyond the newest MAX_NOTIFICATIONS,
+# are pruned by the dispatcher thread at most every PRUNE_INTERVAL_SECONDS
+RETENTION_DAYS = 90
+MAX_NOTIFICATIONS = 500
+PRUNE_INTERVAL_SECONDS = 3600
+
 
 class NotificationService:
     """Service for desktop notifications"""
 
     def __init__(self):
         self.settings_service = get_settings_service()
-
-    def send_notification(self, title, message):
-        """Send a desktop notification"""
+        self.dispatcher = NotificationDispatcher(deliver_desktop, self._save_batch)
+        self.coalescer = NotificationCoalescer(self.dispatcher.submit)
+        self._last_prune = None
+
+    def send_notification(
+        self, title, message, type="reminder", key=None, summarize=None, dedupe=True
+    ):
+        """
+        Send a desktop notification and keep it for in-app display.
+        Notifications sharing a key are merged into one, using
+        summarize(items) -> (title, message). With dedupe, identical
+        repeats are dropped; pass dedupe=False for events that can
+        legitimately recur. The rest is queued to the background dispatcher.
+        """
         if not self.settings_service.is_notifications_enabled():
             logger.info("❌ Notifications disabled in settings")
             return False
 
-        try:
-            if sys.platform == "linux":
-                result = subprocess.run(
-                    [
-                        "notify-send",
-                        "--app-name=Growthly",
-                        "--icon=dialog-information",
-                        title,
-                        message,
-                    ],
-                    check=False,
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.returncode == 0:
-                    logger.info(f"✅ Notification sent: {title}")
-                    return True
-                else:
-                    logger.error(f"❌ notify-send failed: {result.stderr}")
-                    return False
-
-            elif sys.platform == "darwin":
-                subprocess.run(
-                    [
-                        "osascript",
-                        "-e",
-                        f'display notification "{message}" with title "{title}"',
-                    ],
-                    check=False,
-                    capture_output=True,
-                )
-                return True
-
-            elif sys.platform == "win32":
-                try:
-                    from win10toast import ToastNotifier
-
-                    toaster = ToastNotifier()
-                    toaster.show_toast(title, message, duration=5, threaded=True)
-                    return True
-                except Exception:
-                    return False
-
-        except Exception as e:
-            logger.error(f"❌ Notification error: {e}")
-            return False
-        finally:
-            # Always save to database for in-app display, even if desktop fails
-            self.save_to_db(title, message)
-
-    def save_to_db(self, title, message, type="reminder"):
-        """Save notification to database"""
+        self.coalescer.add(PendingNotification(title, message, type), key, summarize, dedupe)
+        return True
+
+    def flush(self, timeout=None):
+        """Send anything held for coalescing and wait for it to be delivered"""
+        self.coalescer.flush()
+        return self.dispatcher.flush(timeout)
+
+    def get_delivery_stats(self):
+        """Dispatcher and coalescing counters, plus delivery latency"""
+        stats = self.dispatcher.get_stats()
+        stats.update(self.coalescer.stats)
+        return stats
+
+    def _save_batch(self, notifications):
+        """Save a batch of notifications in one transaction"""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            "INSERT INTO notifications (title, message, type, created_at) VALUES (?, ?, ?, ?)",
+            [(n.title, n.message, n.type, n.created_at) for n in notifications],
+        )
+
+        # Runs on the dispatcher thread, so retention never costs the UI
+        now = time.monotonic()
+        if self._last_prune is None or now - self._last_prune >= PRUNE_INTERVAL_SECONDS:
+            self._prune(cursor)
+            self._last_prune = now
+
+        conn.commit()
+        conn.close()
+        logger.info(f"📦 Saved {len(notifications)} notification(s) to DB")
+
+    def prune_notifications(self):
+        """Apply the age and count retention limits now"""
         try:
             conn = get_db_connection()
             cursor = conn.cursor()
-            from datetime import datetime
-            now = datetime.now().isoformat()
-            cursor.execute(
-                "INSERT INTO notifications (title, message, type, created_at) VALUES (?, ?, ?, ?)",
-                (title, message, type, now),
-            )
+            removed = self._prune(cursor)
             conn.commit()
             conn.close()
-            logger.info(f"📦 Saved notification to DB: {title}")
+            return removed
         except Exception as e:
-            logger.error(f"❌ Error saving notification: {e}")
+            logger.error(f"❌ Error pruning notifications: {e}")
+            return 0
+
+    def _prune(self, cursor):
+        cutoff = (datetime.now() - timedelta(days=RETENTION_DAYS)).isoformat()
+        cursor.execute(
+            """
+            DELETE FROM notifications
+            WHERE created_at < ?
+               OR created_at < (
+                   SELECT created_at FROM notifications
+                   ORDER BY created_at DESC LIMIT 1 OFFSET ?
+               )
+        """,
+            (cutoff, MAX_NOTIFICATIONS - 1),
+        )
+        return cursor.rowcount
 
     def get_all_notifications(self, limit=50):
         """Get all notifications from database"""
@@ -111,10 +127,9 @@ class NotificationService:
         try:
             conn = get_db_connection()
             cursor = conn.cursor()
-            cursor.execute(
-                "SELECT COUNT(*) FROM notifications WHERE is_read = 0"
-            )
-            count = cursor.fetchone()[0]
+            cursor.execute("SELECT unread FROM notification_counts WHERE id = 1")
+            row = cursor.fetchone()
+            count = row[0] if row else 0
             conn.close()
             return count
         except Exception as e:
@@ -157,19 +172,27 @@ class NotificationService:
 
         # Import here to avoid circular dependency
         from app.services.habit_service import get_habit_service
+        from app.services.forecast_service import get_forecast_service
 
-        habit_service = get_habit_service()
-
-        habits = habit_service.get_all_habits()
-        logger.debug(f"📋 Total habits: {len(habits)}")
+        habits = get_habit_service().get_all_habits()
+        forecasts = get_forecast_service().get_forecasts(habits)
 
         incomplete = [
-            h for h in habits if not habit_service.is_habit_completed_today(h.id)
+            h
+            for h in habits
+            if forecasts[h.id]["due_today"] and not forecasts[h.id]["completed_today"]
         ]
         logger.debug(f"⏳ Incomplete habits: {len(incomplete)}")
 
         count = len(incomplete)
 
+        # The pending habit least likely to get done today
+        at_risk = min(
+            incomplete,
+            key=lambda h: forecasts[h.id]["probability_today"],
+            default=None,
+        )
+
         # Goals check
         from app.services.goal_service import get_goal_service
         goal_service = get_goal_service()
@@ -187,6 +210,8 @@ class NotificationService:
         else:
             title = "Daily Reminder 📋"
             notif_msg = f"You have {count} incomplete habit{'s' if count > 1 else ''} today."
+            if at_risk and forecasts[at_risk.id]["probability_today"] < 0.5:
+                notif_msg += f" Don't let {at_risk.name} slip!"
             if goal_count > 0:
                 notif_msg += f" Plus {goal_count} goal{'s' if goal_count > 1 else ''} in progress!"
             message = notif_msg
@@ -201,7 +226,16 @@ class NotificationService:
 
         title = "Habit Completed! ✅"
         message = f"Great job on '{habit_name}'!"
-        return self.send_notification(title, message)
+        return self.send_notification(
+            title,
+            message,
+            key="habit_completed",
+            dedupe=False,
+            summarize=lambda items: (
+                "Habits Completed! ✅",
+                f"Great job on {len(items)} habits!",
+            ),
+        )
 
     def send_streak_milestone(self, habit_name, streak):
         """Send notification for streak milestones"""
@@ -210,20 +244,93 @@ class NotificationService:
 
         title = "Streak Milestone! 🔥"
         message = f"{streak} day streak on '{habit_name}'!"
-        return self.send_notification(title, message)
-
-    def send_goal_completed(self, goal_type, target):
+        return self.send_notification(
+            title,
+            message,
+            key="streak_milestone",
+            dedupe=False,
+            summarize=lambda items: (
+                "Streak Milestones! 🔥",
+                f"{len(items)} new streak milestones!",
+            ),
+        )
+
+    def send_goal_completed(self, goal_type, target, habit_name=None):
         """Send notification when a goal is achieved"""
         if not self.settings_service.is_notifications_enabled():
             return False
 
         title = "Goal Achieved! 🏆"
         goal_name = goal_type.replace("_", " ").title()
-        message = f"Congratulations! You've reached your {target} {goal_name} target!"
-        return self.send_notification(title, message)
+        message = f"Congratulations! You've reached your {target} {goal_name} target"
+        message += f" for '{habit_name}'!" if habit_name else "!"
+        return self.send_notification(
+            title,
+            message,
+            key="goal_completed",
+            dedupe=False,
+            summarize=lambda items: (
+                "Goals Achieved! 🏆",
+                f"Congratulations! {len(items)} goals achieved!",
+            ),
+        )
 
         return False
 
+    def send_habit_reminders(self, habits):
+        """Send one reminder for habits whose reminder time has come"""
+        if not self.settings_service.is_notifications_enabled():
+            return False
+        if not habits:
+            return False
+
+        title = "Habit Reminder ⏰"
+        if len(habits) == 1:
+            message = f"Time for '{habits[0].name}'!"
+        else:
+            names = ", ".join(h.name for h in habits[:3])
+            if len(habits) > 3:
+                names += f" and {len(habits) - 3} more"
+            message = f"{len(habits)} habits are waiting: {names}."
+        return self.send_notification(
+            title,
+            message,
+            key="habit_reminder",
+            summarize=lambda items: (
+                "Habit Reminders ⏰",
+                f"{len(items)} reminders for habits still to do today.",
+            ),
+        )
+
+    def send_goal_deadlines(self, expired, due_soon):
+        """Send one summary of expired goals and goals due soon"""
+        if not self.settings_service.is_notifications_enabled():
+            return False
+        if not expired and not due_soon:
+            return False
+
+        def describe(goals):
+            names = ", ".join(
+                f"{g['habit_name']} ({g['current_value']}/{g['target_value']})"
+                for g in goals[:3]
+            )
+            if len(goals) > 3:
+                names += f" and {len(goals) - 3} more"
+            return names
+
+        parts = []
+        if expired:
+            parts.append(
+                f"{len(expired)} goal{'s' if len(expired) > 1 else ''} expired: {describe(expired)}."
+            )
+        if due_soon:
+            parts.append(
+                f"{len(due_soon)} goal{'s' if len(due_soon) > 1 else ''} due soon: {describe(due_soon)}."
+            )
+
+        title = "Goal Deadlines ⏰"
+        return self.send_notification(title, " ".join(parts))
+
 
 # Global service instance
 _notification_service_instance = None
@@ -0,0 +1,157 @@
+"""
+Reminder service - per-habit reminder times
+"""
+
+from datetime import datetime
+import logging
+from typing import List
+from app.db.database import get_db_connection
+from app.models.habit import Habit
+from app.models.reminder import HabitReminder
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_reminder_time(value) -> str:
+    """Validate a reminder time and return it as zero-padded HH:MM"""
+    return datetime.strptime(value.strip(), "%H:%M").strftime("%H:%M")
+
+
+class ReminderService:
+    """Service for habit reminder operations"""
+
+    def __init__(self):
+        self._callbacks = []
+
+    def get_reminders(self, habit_id) -> List[HabitReminder]:
+        """Get the reminders of one habit, earliest first"""
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT * FROM habit_reminders WHERE habit_id = ? ORDER BY reminder_time",
+                (habit_id,),
+            )
+            rows = cursor.fetchall()
+            conn.close()
+            return [HabitReminder.from_db_row(row) for row in rows]
+        except Exception as e:
+            logger.error(f"❌ Error fetching reminders: {e}")
+            return []
+
+    def get_all_reminders(self) -> List[HabitReminder]:
+        """Get every habit reminder"""
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM habit_reminders")
+            rows = cursor.fetchall()
+            conn.close()
+            return [HabitReminder.from_db_row(row) for row in rows]
+        except Exception as e:
+            logger.error(f"❌ Error fetching reminders: {e}")
+            return []
+
+    def set_reminders(self, habit_id, times):
+        """
+        Replace a habit's reminder times with times (HH:MM strings).
+        Raises ValueError for an invalid time, before anything is changed.
+        """
+        wanted = {normalize_reminder_time(t) for t in times}
+        current = {r.reminder_time for r in self.get_reminders(habit_id)}
+        if wanted == current:
+            return
+
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            "DELETE FROM habit_reminders WHERE habit_id = ? AND reminder_time = ?",
+            [(habit_id, t) for t in current - wanted],
+        )
+        cursor.executemany(
+            "INSERT INTO habit_reminders (habit_id, reminder_time) VALUES (?, ?)",
+            [(habit_id, t) for t in wanted - current],
+        )
+        conn.commit()
+        conn.close()
+
+        self._notify_callbacks()
+
+    def lookup_reminders(self, reminder_ids, day=None):
+        """
+        Fetch reminders with their habit and whether it is completed on day
+        (default: today), in one query. Reminders deleted since they were
+        scheduled are left out.
+        """
+        if not reminder_ids:
+            return []
+        day = day or datetime.now().strftime("%Y-%m-%d")
+
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            placeholders = ", ".join("?" * len(reminder_ids))
+            cursor.execute(
+                f"""
+                SELECT r.id, r.habit_id, r.reminder_time,
+                       h.name, h.description, h.category, h.frequency, h.created_at,
+                       EXISTS (
+                           SELECT 1 FROM habit_logs l
+                           WHERE l.habit_id = r.habit_id AND l.completed_date = ?
+                       ) AS completed
+                FROM habit_reminders r
+                JOIN habits h ON h.id = r.habit_id
+                WHERE r.id IN ({placeholders})
+            """,
+                (day, *reminder_ids),
+            )
+            rows = cursor.fetchall()
+            conn.close()
+
+            return [
+                {
+                    "reminder": HabitReminder.from_db_row(row),
+                    "habit": Habit(
+                        id=row["habit_id"],
+                        name=row["name"],
+                        description=row["description"] or "",
+                        category=row["category"] or "General",
+                        frequency=row["frequency"],
+                        created_at=row["created_at"],
+                    ),
+                    "completed": bool(row["completed"]),
+                }
+                for row in rows
+            ]
+        except Exception as e:
+            logger.error(f"❌ Error looking up reminders: {e}")
+            return []
+
+    def register_callback(self, callback):
+        """Call callback() whenever reminder times change"""
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def unregister_callback(self, callback):
+        """Remove a reminder change callback"""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def _notify_callbacks(self):
+        for callback in self._callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in reminder callback {callback.__name__}: {e}")
+
+
+# Global service instance
+_reminder_service_instance = None
+
+
+def get_reminder_service() -> ReminderService:
+    """Get global reminder service instance"""
+    global _reminder_service_instance
+    if _reminder_service_instance is None:
+        _reminder_service_instance = ReminderService()
+    return _reminder_service_instance
@@ -0,0 +1,113 @@
+"""
+Schedule service - answers "is this habit due?" from compiled recurrence masks
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import List, NamedTuple
+import numpy as np
+from app.models.recurrence import RecurrenceRule, compile_year_mask, day_of_year_index
+from app.utils.dates import parse_date, get_today
+
+
+class ScheduleService:
+    """Service for habit due-day calculations"""
+
+    def get_rule(self, habit) -> RecurrenceRule:
+        """Get the recurrence rule for a habit"""
+        return RecurrenceRule.from_frequency(habit.frequency, self._anchor(habit))
+
+    def get_year_mask(self, habit, year: int) -> int:
+        """Get the due-day bitmask of a habit for one year"""
+        rule = self.get_rule(habit)
+        # The anchor only matters for every-N rules; normalising it lets
+        # habits with the same pattern share one compiled mask.
+        anchor = self._anchor(habit) if rule.interval_days > 1 else date(1970, 1, 1)
+        return compile_year_mask(rule, year, anchor)
+
+    def get_window_mask(self, habit, start: date, end: date) -> int:
+        """
+        Get a bitmask of due days between start and end (inclusive).
+        Bit i is set when start + i days is due; days before the habit
+        was created are never due.
+        """
+        first = max(start, parse_date(habit.created_at))
+        if end < first:
+            return 0
+
+        mask = 0
+        shift = (first - start).days
+        cursor = first
+        while cursor <= end:
+            year_end = min(end, date(cursor.year, 12, 31))
+            length = (year_end - cursor).days + 1
+            year_bits = self.get_year_mask(habit, cursor.year) >> day_of_year_index(cursor)
+            mask |= (year_bits & ((1 << length) - 1)) << shift
+            shift += length
+            cursor = year_end + timedelta(days=1)
+
+        return mask
+
+    def get_window_array(self, habit, start: date, end: date) -> np.ndarray:
+        """Same as get_window_mask, unpacked into a boolean array per day"""
+        length = max((end - start).days + 1, 0)
+        return mask_to_array(self.get_window_mask(habit, start, end), length)
+
+    def is_due(self, habit, day: date = None) -> bool:
+        """Check whether a habit is due on a day (default: today)"""
+        day = day or get_today()
+        if day < parse_date(habit.created_at):
+            return False
+        return bool(self.get_year_mask(habit, day.year) >> day_of_year_index(day) & 1)
+
+    def get_due_habits(self, habits, day: date = None) -> List:
+        """Filter habits down to those due on a day (default: today)"""
+        day = day or get_today()
+        return [habit for habit in habits if self.is_due(habit, day)]
+
+    def count_due_days(self, habit, start: date, end: date) -> int:
+        """Count due days between start and end (inclusive)"""
+        return bin(self.get_window_mask(habit, start, end)).count("1")
+
+    def expected_completions(self, habit, days: int, end: date = None) -> int:
+        """Number of completions expected over the last N days"""
+        end = end or get_today()
+        return self.count_due_days(habit, end - timedelta(days=days - 1), end)
+
+    def _anchor(self, habit) -> date:
+        return parse_date(habit.created_at)
+
+
+class _Schedule(NamedTuple):
+    frequency: str
+    created_at: str
+
+
+@lru_cache(maxsize=65536)
+def sql_habit_is_due(frequency, created_at, day) -> int:
+    """
+    SQL form of ScheduleService.is_due, registered on every connection as
+    habit_is_due(frequency, created_at, day) for the daily_summary triggers
+    """
+    if not day:
+        return 0
+    return int(get_schedule_service().is_due(_Schedule(frequency, created_at), parse_date(day)))
+
+
+def mask_to_array(mask: int, length: int) -> np.ndarray:
+    """Unpack a day bitmask (bit 0 = first day) into a boolean array"""
+    raw = mask.to_bytes((length + 7) // 8, "little")
+    bits = np.unpackbits(np.frombuffer(raw, dtype=np.uint8), bitorder="little")
+    return bits[:length].astype(bool)
+
+
+# Global service instance
+_schedule_service_instance = None
+
+
+def get_schedule_service() -> ScheduleService:
+    """Get global schedule service instance"""
+    global _schedule_service_instance
+    if _schedule_service_instance is None:
+        _schedule_service_instance = ScheduleService()
+    return _schedule_service_instance
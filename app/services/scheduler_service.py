@@ -1,50 +1,270 @@
 """
-Scheduler service for daily reminders - COMPLETELY FIXED
+Scheduler service for daily reminders and goal deadline sweeps
 """
 
 from PySide6.QtCore import QTimer
-from datetime import datetime
+from datetime import datetime, time as dtime, timedelta
+import heapq
+import logging
+import math
+import time
 from app.services.notification_service import get_notification_service
+from app.services.reminder_service import get_reminder_service
+from app.services.schedule_service import get_schedule_service
 from app.services.settings_service import get_settings_service
 
+logger = logging.getLogger(__name__)
+
+# Goals due within this many days are included in the deadline summary
+GOAL_DUE_SOON_DAYS = 3
+
+# The timer never sleeps longer than this, so a resume from suspend or a
+# wall-clock change is noticed within a minute, without touching the database
+MAX_SLEEP_SECONDS = 60
+
+# Wall time and monotonic time disagreeing by more than this is a clock jump
+CLOCK_JUMP_SECONDS = 5
+
+# A failed goal sweep is retried after this long
+GOAL_SWEEP_RETRY_SECONDS = 60
+
+# Settings the reminder schedule depends on
+REMINDER_SETTINGS = ("notifications_enabled", "notification_time")
+
 
 class SchedulerService:
-    """Service for scheduling daily tasks"""
+    """
+    Service for scheduling daily tasks
+
+    Computes the next daily reminder and the next goal sweep from the
+    settings, keeps per-habit reminders in a min-heap of (fire time,
+    reminder id, time of day), and arms one single-shot timer for whichever
+    is due first. Settings and reminders are cached and reloaded only when
+    they change.
+    """
 
     def __init__(self):
         self.notification_service = get_notification_service()
         self.settings_service = get_settings_service()
+        self.reminder_service = get_reminder_service()
         self.timer = QTimer()
-        self.timer.timeout.connect(self.check_daily_reminder)
-        self.last_notification_minute = None
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._on_timer)
+
+        self.next_reminder = None
+        self.next_goal_sweep = None
+        self.reminder_heap = []
+        self._goal_sweep_retry_at = None
+        self._armed_wall = None
+        self._armed_mono = None
+
+        self.reload_settings()
+        self.settings_service.register_callback(self._on_setting_changed)
+        self.reminder_service.register_callback(self._on_reminders_changed)
+
+    def reload_settings(self):
+        """Re-read the schedule from settings, catching up anything missed today"""
+        self.reminder_enabled = self.settings_service.is_notifications_enabled()
+        self.reminder_time = self._parse_time(self.settings_service.get_notification_time())
+        self.last_reminder = self.settings_service.get_setting("last_daily_reminder")
+        self.last_goal_sweep_day = self.settings_service.get_setting("last_goal_sweep")
+        self._build_reminder_heap()
+        self.reschedule(catch_up=True)
+
+    def reschedule(self, catch_up=False):
+        """
+        Recompute the next fire times from the wall clock and re-arm.
+        With catch_up, a reminder whose time already passed today without
+        being sent is due immediately; otherwise it moves to tomorrow.
+        """
+        self._plan(catch_up)
+        self._arm()
+
+    def _plan(self, catch_up):
+        now = datetime.now()
+
+        self.next_reminder = None
+        if self.reminder_enabled and self.reminder_time is not None:
+            slot = datetime.combine(now.date(), self.reminder_time)
+            if slot <= now and not (catch_up and self.last_reminder != _slot_key(slot)):
+                slot += timedelta(days=1)
+            self.next_reminder = slot
+
+        if self.last_goal_sweep_day != now.strftime("%Y-%m-%d"):
+            self.next_goal_sweep = max(now, self._goal_sweep_retry_at or now)
+        else:
+            self.next_goal_sweep = datetime.combine(now.date() + timedelta(days=1), dtime())
+
+    def _arm(self):
+        now = datetime.now()
+        due = [t for t in (self.next_reminder, self.next_goal_sweep) if t is not None]
+        if self.reminder_heap:
+            due.append(self.reminder_heap[0][0])
+        delay = min((t - now).total_seconds() for t in due) if due else MAX_SLEEP_SECONDS
+        delay = max(0.0, min(delay, MAX_SLEEP_SECONDS))
+
+        self._armed_wall = time.time()
+        self._armed_mono = time.monotonic()
+        self.timer.start(math.ceil(delay * 1000))
+
+    def _on_timer(self):
+        # The timer is single-shot, so it must be re-armed whatever happens
+        try:
+            # Monotonic time stops during suspend and ignores clock changes, so
+            # a gap between the two clocks means the wall-clock schedule is stale
+            drift = (time.time() - self._armed_wall) - (time.monotonic() - self._armed_mono)
+            jumped = abs(drift) > CLOCK_JUMP_SECONDS
+            if jumped:
+                logger.info(f"Clock jumped {drift:+.0f}s (resume or time change), rescheduling")
+                self._plan(catch_up=True)
+
+            now = datetime.now()
+            if self.next_reminder is not None and now >= self.next_reminder:
+                self.send_daily_reminder(self.next_reminder)
+            if self.next_goal_sweep is not None and now >= self.next_goal_sweep:
+                self.check_goal_deadlines()
+            self.send_habit_reminders(now)
+
+            # Habit reminders missed by a forward jump fired once above; after
+            # a backward jump the heap times are too late, so rebuild from now
+            if jumped:
+                self._build_reminder_heap()
+        except Exception as e:
+            logger.error(f"Error running scheduled tasks: {e}")
+        finally:
+            self.reschedule()
 
-        # Check every 30 seconds
-        self.timer.start(30000)
+    def _on_setting_changed(self, key, value):
+        if key not in REMINDER_SETTINGS:
+            return
+        self.reminder_enabled = self.settings_service.is_notifications_enabled()
+        self.reminder_time = self._parse_time(self.settings_service.get_notification_time())
+        self._build_reminder_heap()
+        self.reschedule()
+
+    def _on_reminders_changed(self):
+        self._build_reminder_heap()
+        self._arm()
 
-    def check_daily_reminder(self):
-        """Check if it's time to send daily reminder"""
-        if not self.settings_service.is_notifications_enabled():
+    def _build_reminder_heap(self):
+        if not self.reminder_enabled:
+            self.reminder_heap = []
             return
 
         now = datetime.now()
-        current_minute_key = f"{now.year}-{now.month}-{now.day}-{now.hour}-{now.minute}"
+        heap = []
+        for reminder in self.reminder_service.get_all_reminders():
+            try:
+                at = reminder.get_time()
+            except ValueError as e:
+                logger.error(f"Invalid reminder time {reminder.reminder_time!r}: {e}")
+                continue
+            heap.append((_next_occurrence(at, now), reminder.id, at))
+        heapq.heapify(heap)
+        self.reminder_heap = heap
+
+    def send_habit_reminders(self, now):
+        """
+        Pop every habit reminder due by now, push each back for its next day,
+        and remind about the habits still due and not yet completed today
+        """
+        due = []
+        while self.reminder_heap and self.reminder_heap[0][0] <= now:
+            due.append(heapq.heappop(self.reminder_heap))
+        if not due:
+            return
+
+        rows = self.reminder_service.lookup_reminders(
+            [reminder_id for _, reminder_id, _ in due], now.strftime("%Y-%m-%d")
+        )
+
+        # Reminders deleted since they were scheduled drop out of the heap here
+        found = {row["reminder"].id for row in rows}
+        for _, reminder_id, at in due:
+            if reminder_id in found:
+                heapq.heappush(self.reminder_heap, (_next_occurrence(at, now), reminder_id, at))
+
+        schedule_service = get_schedule_service()
+        pending = {}
+        for row in rows:
+            habit = row["habit"]
+            if row["completed"] or habit.id in pending:
+                continue
+            if schedule_service.is_due(habit, now.date()):
+                pending[habit.id] = habit
+
+        if pending:
+            self.notification_service.send_habit_reminders(list(pending.values()))
+
+    def send_daily_reminder(self, slot):
+        """Send the reminder for slot, at most once even if several were missed"""
+        key = _slot_key(slot)
+        if self.last_reminder == key:
+            return
+
+        self.notification_service.send_daily_reminder()
+        self.last_reminder = key
+        self.settings_service.set_setting("last_daily_reminder", key)
 
-        # Only send once per minute
-        if self.last_notification_minute == current_minute_key:
+    def check_goal_deadlines(self):
+        """
+        Expire overdue goals and summarize deadlines once per day, and
+        apply notification retention
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        if self.last_goal_sweep_day == today:
             return
 
-        # Get notification time from settings
-        time_str = self.settings_service.get_notification_time()
-        hour, minute = map(int, time_str.split(":"))
+        # Should this attempt fail, don't try again on the very next wake
+        self._goal_sweep_retry_at = datetime.now() + timedelta(seconds=GOAL_SWEEP_RETRY_SECONDS)
 
-        # Check if current time matches
-        if now.hour == hour and now.minute == minute:
-            self.notification_service.send_daily_reminder()
-            self.last_notification_minute = current_minute_key
+        from app.services.goal_service import get_goal_service
+
+        result = get_goal_service().sweep_deadlines(GOAL_DUE_SOON_DAYS)
+        if result is None:
+            # Failed; leave the day unswept so the next wake retries
+            return
+
+        self.last_goal_sweep_day = today
+        self.settings_service.set_setting("last_goal_sweep", today)
+
+        # Saving notifications prunes too, but days without any would not
+        self.notification_service.prune_notifications()
+
+        if result["expired"] or result["due_soon"]:
+            logger.info(
+                f"Goal sweep: {len(result['expired'])} expired, "
+                f"{len(result['due_soon'])} due soon"
+            )
+            self.notification_service.send_goal_deadlines(
+                result["expired"], result["due_soon"]
+            )
+
+    def _parse_time(self, time_str):
+        try:
+            hour, minute = map(int, time_str.split(":"))
+            return dtime(hour, minute)
+        except (AttributeError, ValueError) as e:
+            logger.error(f"Invalid notification time {time_str!r}: {e}")
+            return None
 
     def stop(self):
         """Stop the scheduler"""
         self.timer.stop()
+        self.settings_service.unregister_callback(self._on_setting_changed)
+        self.reminder_service.unregister_callback(self._on_reminders_changed)
+
+
+def _slot_key(slot):
+    return slot.strftime("%Y-%m-%d %H:%M")
+
+
+def _next_occurrence(at, after):
+    """The first datetime at time of day at, strictly after after"""
+    slot = datetime.combine(after.date(), at)
+    if slot <= after:
+        slot += timedelta(days=1)
+    return slot
 
 
 # Global service instance
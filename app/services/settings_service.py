@@ -4,12 +4,16 @@ Service for managing application settings - FIXED
 
 from app.db.database import get_db_connection
 from app.utils.constants import THEME_DARK, THEME_LIGHT
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class SettingsService:
     """Service for settings operations"""
 
     def __init__(self):
+        self._callbacks = []
         self._ensure_defaults()
 
     def _ensure_defaults(self):
@@ -63,6 +67,22 @@ class SettingsService:
         conn.commit()
         conn.close()
 
+        for callback in self._callbacks:
+            try:
+                callback(key, str(value))
+            except Exception as e:
+                logger.error(f"Error in settings callback {callback.__name__}: {e}")
+
+    def register_callback(self, callback):
+        """Call callback(key, value) whenever a setting is written"""
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def unregister_callback(self, callback):
+        """Remove a settings change callback"""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
     def get_theme(self):
         """Get current theme"""
         return self.get_setting("theme", THEME_DARK)
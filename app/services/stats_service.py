@@ -2,10 +2,38 @@
 Stats service - generates statistics and analytics
 """
 
+from dataclasses import dataclass
 from typing import Dict, List
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+import numpy as np
+from app.db.database import get_db_connection
+from app.db.schema import (
+    rebuild_daily_summary,
+    rebuild_goal_progress,
+    refresh_rollup_periods,
+    clear_rollups,
+)
+from app.services.cache_service import get_cache_service
 from app.services.habit_service import get_habit_service
-from app.utils.dates import parse_date, get_today
+from app.services.schedule_service import get_schedule_service
+from app.utils.dates import parse_date, get_today, format_date
+
+
+# Longest ranges drawn with one point per day / per week
+TREND_DAILY_MAX_DAYS = 92
+TREND_WEEKLY_MAX_DAYS = 731
+
+
+@dataclass
+class _PrefixSums:
+    """Cumulative due/completed day counts for one habit"""
+
+    start: date
+    end: date
+    frequency: str
+    version: int
+    due: np.ndarray
+    done: np.ndarray
 
 
 class StatsService:
@@ -13,39 +41,79 @@ class StatsService:
 
     def __init__(self):
         self.habit_service = get_habit_service()
+        self.schedule_service = get_schedule_service()
+        self._prefix_cache = {}
 
     def get_completion_rate(self, habit_id: int, days: int = 30) -> float:
         """
         Calculate completion rate for last N days.
+        Only days the habit is due count towards the rate.
         Returns percentage (0-100).
         """
+        return self.get_completion_rates(habit_id, [days]).get(days, 0.0)
+
+    def get_completion_rates(
+        self, habit_id: int, windows=(7, 30, 90, 365)
+    ) -> Dict[int, float]:
+        """
+        Calculate completion rates for several trailing windows at once.
+        Each window is two lookups into the habit's cached prefix sums.
+        Returns {days: percentage (0-100)}.
+        """
         habit = self.habit_service.get_habit_by_id(habit_id)
         if not habit:
-            return 0.0
+            return {days: 0.0 for days in windows}
+
+        sums = self._get_prefix_sums(habit)
+        end = len(sums.due) - 1
 
-        created_date = parse_date(habit.created_at)
+        rates = {}
+        for days in windows:
+            start = max(end - days, 0)
+            expected = sums.due[end] - sums.due[start]
+            completed = sums.done[end] - sums.done[start]
+            rates[days] = float(completed / expected * 100) if expected > 0 else 0.0
+        return rates
+
+    def _get_prefix_sums(self, habit) -> "_PrefixSums":
+        """
+        Get cumulative due/completed counts from creation through today.
+        Cached per habit and extended in place when the day rolls over.
+        """
         today = parse_date(get_today())
+        version = get_cache_service().habit_version(habit.id)
+        sums = self._prefix_cache.get(habit.id)
 
-        # Calculate actual days to consider
-        days_since_creation = (today - created_date).days + 1
-        days_to_check = min(days, days_since_creation)
+        if sums is None or sums.version != version or sums.frequency != habit.frequency:
+            start = parse_date(habit.created_at)
+            sums = _PrefixSums(
+                start=start,
+                end=start - timedelta(days=1),
+                frequency=habit.frequency,
+                version=version,
+                due=np.zeros(1, dtype=np.int64),
+                done=np.zeros(1, dtype=np.int64),
+            )
+            self._prefix_cache[habit.id] = sums
 
-        if days_to_check <= 0:
-            return 0.0
+        if sums.end < today:
+            first = sums.end + timedelta(days=1)
+            length = (today - first).days + 1
 
-        # Get completions
-        completions = self.habit_service.get_habit_completions(habit_id)
-        completion_dates = set(completions)
+            due = self.schedule_service.get_window_array(habit, first, today)
+            completed = np.zeros(length, dtype=bool)
+            for completed_date in self.habit_service.get_habit_completions(habit.id):
+                offset = (parse_date(completed_date) - first).days
+                if 0 <= offset < length:
+                    completed[offset] = True
 
-        # Count completions in the period
-        completed_count = 0
-        for i in range(days_to_check):
-            check_date = today - timedelta(days=i)
-            if check_date >= created_date:
-                if check_date.strftime("%Y-%m-%d") in completion_dates:
-                    completed_count += 1
+            sums.due = np.concatenate((sums.due, sums.due[-1] + np.cumsum(due)))
+            sums.done = np.concatenate(
+                (sums.done, sums.done[-1] + np.cumsum(due & completed))
+            )
+            sums.end = today
 
-        return (completed_count / days_to_check) * 100
+        return sums
 
     def get_total_completions(self, habit_id: int) -> int:
         """Get total number of completions for a habit"""
@@ -63,6 +131,7 @@ class StatsService:
         streak_service = get_streak_service()
 
         streak_info = streak_service.get_streak_info(habit_id)
+        rates = self.get_completion_rates(habit_id, (7, 30))
 
         return {
             "habit_id": habit_id,
@@ -70,16 +139,91 @@ class StatsService:
             "current_streak": streak_info["current_streak"],
             "longest_streak": streak_info["longest_streak"],
             "total_completions": streak_info["total_completions"],
-            "completion_rate_7d": round(self.get_completion_rate(habit_id, 7), 1),
-            "completion_rate_30d": round(self.get_completion_rate(habit_id, 30), 1),
+            "completion_rate_7d": round(rates[7], 1),
+            "completion_rate_30d": round(rates[30], 1),
             "created_at": habit.created_at,
             "is_completed_today": self.habit_service.is_habit_completed_today(habit_id),
         }
 
     def get_all_habits_stats(self) -> List[Dict]:
-        """Get statistics for all active habits"""
+        """
+        Get statistics for all active habits.
+        Loads habits and logs in two queries and computes every field of
+        get_habit_stats for all habits in one pass.
+        """
         habits = self.habit_service.get_all_habits()
-        return [self.get_habit_stats(habit.id) for habit in habits]
+        if not habits:
+            return []
+
+        today = parse_date(get_today())
+        index, days = load_completion_log(habits)
+        n = len(habits)
+
+        totals = np.bincount(index, minlength=n)
+        current, longest = streak_lengths(index, days, n, today)
+
+        completed = completion_matrix(index, days, n, today, 30)
+        due = np.stack(
+            [
+                self.schedule_service.get_window_array(
+                    habit, today - timedelta(days=29), today
+                )
+                for habit in habits
+            ]
+        )
+        hits = np.cumsum((due & completed)[:, ::-1], axis=1)
+        expected = np.cumsum(due[:, ::-1], axis=1)
+
+        def rate(row, days):
+            if expected[row, days - 1] == 0:
+                return 0.0
+            return float(hits[row, days - 1] / expected[row, days - 1] * 100)
+
+        return [
+            {
+                "habit_id": habit.id,
+                "habit_name": habit.name,
+                "current_streak": int(current[i]),
+                "longest_streak": int(longest[i]),
+                "total_completions": int(totals[i]),
+                "completion_rate_7d": round(rate(i, 7), 1),
+                "completion_rate_30d": round(rate(i, 30), 1),
+                "created_at": habit.created_at,
+                "is_completed_today": bool(completed[i, -1]),
+            }
+            for i, habit in enumerate(habits)
+        ]
+
+    def get_overview(self) -> Dict:
+        """
+        Get the headline aggregates shared by the dashboard, analytics,
+        profile and achievements. Cached until the data changes.
+        """
+        today = format_date(parse_date(get_today()))
+        return get_cache_service().get_or_compute(
+            ("overview", today), self._compute_overview
+        )
+
+    def _compute_overview(self) -> Dict:
+        stats = self.get_all_habits_stats()
+        summary = self.get_daily_summary(30)
+        # Off-schedule completions don't count towards consistency
+        completed_30d = sum(day["due_completed_count"] for day in summary)
+        possible_30d = sum(day["active_habit_count"] for day in summary)
+
+        return {
+            "total_habits": len(stats),
+            "total_completions": sum(s["total_completions"] for s in stats),
+            "max_total_completions": max(
+                (s["total_completions"] for s in stats), default=0
+            ),
+            "max_current_streak": max((s["current_streak"] for s in stats), default=0),
+            "best_streak": max((s["longest_streak"] for s in stats), default=0),
+            "completed_today": summary[-1]["completed_count"],
+            "completed_30d": completed_30d,
+            "possible_30d": possible_30d,
+            "consistency_30d": completed_30d / possible_30d if possible_30d else 0.0,
+        }
 
     def get_weekly_completion_count(self, habit_id: int) -> Dict[str, int]:
         """Get completion count for each day of the current week"""
@@ -110,6 +254,331 @@ class StatsService:
 
         return weekly_data
 
+    def get_weekday_breakdown(self, window: int = 365) -> List[Dict]:
+        """
+        Get completion totals and rates per weekday over the last N days,
+        Monday first. Cached until the data changes.
+        """
+        today = format_date(parse_date(get_today()))
+        return get_cache_service().get_or_compute(
+            ("weekday_breakdown", window, today),
+            lambda: self._compute_weekday_breakdown(window),
+        )
+
+    def _compute_weekday_breakdown(self, window: int) -> List[Dict]:
+        # Completions of due habits only, so a rate can't pass 100%
+        completed = [0] * 7
+        possible = [0] * 7
+        for day in self.get_daily_summary(window):
+            weekday = parse_date(day["day"]).weekday()
+            completed[weekday] += day["due_completed_count"]
+            possible[weekday] += day["active_habit_count"]
+
+        names = [
+            "Monday",
+            "Tuesday",
+            "Wednesday",
+            "Thursday",
+            "Friday",
+            "Saturday",
+            "Sunday",
+        ]
+        return [
+            {
+                "weekday": i,
+                "name": names[i],
+                "completed": completed[i],
+                "possible": possible[i],
+                "rate": completed[i] / possible[i] * 100 if possible[i] else 0.0,
+            }
+            for i in range(7)
+        ]
+
+    def get_daily_summary(self, days: int, end=None) -> List[Dict]:
+        """
+        Get per-day completion totals for the last N days, oldest first.
+        active_habit_count is the number of habits due that day and
+        due_completed_count how many of those were completed.
+        Reads the trigger-maintained daily_summary table; days without any
+        completion have no row and are filled in here from schedule masks.
+        """
+        end = parse_date(end) if end else parse_date(get_today())
+        start = end - timedelta(days=days - 1)
+
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT * FROM daily_summary
+            WHERE day BETWEEN ? AND ?
+        """,
+            (format_date(start), format_date(end)),
+        )
+        rows = {row["day"]: row for row in cursor.fetchall()}
+
+        conn.close()
+
+        due_counts = None
+        if len(rows) < days:
+            due_counts = np.zeros(days, dtype=np.int64)
+            for habit in self.habit_service.get_all_habits():
+                due_counts += self.schedule_service.get_window_array(habit, start, end)
+
+        summary = []
+        for i in range(days):
+            day = format_date(start + timedelta(days=i))
+            row = rows.get(day)
+            if row:
+                summary.append(
+                    {
+                        "day": day,
+                        "completed_count": row["completed_count"],
+                        "active_habit_count": row["active_habit_count"],
+                        "due_completed_count": row["due_completed_count"],
+                        "perfect_day": bool(row["perfect_day"]),
+                    }
+                )
+            else:
+                summary.append(
+                    {
+                        "day": day,
+                        "completed_count": 0,
+                        "active_habit_count": int(due_counts[i]),
+                        "due_completed_count": 0,
+                        "perfect_day": False,
+                    }
+                )
+
+        return summary
+
+    def get_trend_granularity(self, days: int) -> str:
+        """Pick 'day', 'week' or 'month' points for a range of N days"""
+        if days <= TREND_DAILY_MAX_DAYS:
+            return "day"
+        if days <= TREND_WEEKLY_MAX_DAYS:
+            return "week"
+        return "month"
+
+    def get_trend(self, days: int, end=None) -> List[Dict]:
+        """
+        Get completion totals over the last N days, oldest first, at a
+        granularity suited to the range. Each point has period_start,
+        completed_count, possible_count and perfect_days.
+        """
+        end = parse_date(end) if end else parse_date(get_today())
+        granularity = self.get_trend_granularity(days)
+
+        if granularity == "day":
+            return [
+                {
+                    "period_start": entry["day"],
+                    "completed_count": entry["completed_count"],
+                    "possible_count": entry["active_habit_count"],
+                    "perfect_days": int(entry["perfect_day"]),
+                }
+                for entry in self.get_daily_summary(days, end)
+            ]
+
+        periods = self._trend_periods(granularity, days, end)
+        rows = self._read_rollup("period_rollup", granularity, periods, end)
+
+        return [
+            {
+                "period_start": start,
+                "completed_count": rows[start]["completed_count"] if start in rows else 0,
+                "possible_count": rows[start]["possible_count"] if start in rows else 0,
+                "perfect_days": rows[start]["perfect_days"] if start in rows else 0,
+            }
+            for start, _ in periods
+        ]
+
+    def get_category_trend(self, days: int, end=None) -> Dict[str, List[Dict]]:
+        """
+        Get per-category completion totals over the last N days as weekly
+        or monthly points: {category: [{period_start, completed_count,
+        possible_count}, ...]}.
+        """
+        end = parse_date(end) if end else parse_date(get_today())
+        granularity = self.get_trend_granularity(days)
+        if granularity == "day":
+            granularity = "week"
+
+        periods = self._trend_periods(granularity, days, end)
+        rows = self._read_rollup("category_rollup", granularity, periods, end)
+
+        trend = {}
+        for row in rows:
+            trend.setdefault(row["category"], []).append(
+                {
+                    "period_start": row["period_start"],
+                    "completed_count": row["completed_count"],
+                    "possible_count": row["possible_count"],
+                }
+            )
+        return trend
+
+    def _trend_periods(self, granularity: str, days: int, end: date):
+        """(period_start, period_end) pairs covering the last N days"""
+        first = end - timedelta(days=days - 1)
+        if granularity == "week":
+            cursor = first - timedelta(days=first.weekday())
+        else:
+            cursor = first.replace(day=1)
+
+        periods = []
+        while cursor <= end:
+            if granularity == "week":
+                following = cursor + timedelta(days=7)
+            else:
+                following = (cursor + timedelta(days=32)).replace(day=1)
+            periods.append((format_date(cursor), format_date(following - timedelta(days=1))))
+            cursor = following
+        return periods
+
+    def _read_rollup(self, table: str, granularity: str, periods, end: date):
+        """
+        Read rollup rows for the given periods, first computing any that
+        are missing or still in progress.
+        """
+        today = parse_date(get_today())
+        first, last = periods[0][0], periods[-1][0]
+
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        # category_rollup is always refreshed together with period_rollup
+        cursor.execute(
+            """
+            SELECT period_start, computed_through FROM period_rollup
+            WHERE granularity = ? AND period_start BETWEEN ? AND ?
+        """,
+            (granularity, first, last),
+        )
+        stored = {row["period_start"]: row["computed_through"] for row in cursor.fetchall()}
+
+        # Missing rows and rows computed before their period was over
+        stale = []
+        for start, period_end in periods:
+            through = min(period_end, format_date(today))
+            if start <= through and stored.get(start) != through:
+                stale.append((start, through))
+        if stale:
+            refresh_rollup_periods(cursor, granularity, stale)
+            conn.commit()
+
+        if table == "period_rollup":
+            cursor.execute(
+                """
+                SELECT * FROM period_rollup
+                WHERE granularity = ? AND period_start BETWEEN ? AND ?
+            """,
+                (granularity, first, last),
+            )
+            rows = {row["period_start"]: row for row in cursor.fetchall()}
+        else:
+            cursor.execute(
+                """
+                SELECT * FROM category_rollup
+                WHERE granularity = ? AND period_start BETWEEN ? AND ?
+                ORDER BY category, period_start
+            """,
+                (granularity, first, last),
+            )
+            rows = cursor.fetchall()
+
+        conn.close()
+        return rows
+
+    def rebuild_daily_summary(self):
+        """Recompute daily_summary and goal counters from scratch and reset rollups"""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        rebuild_daily_summary(cursor)
+        rebuild_goal_progress(cursor)
+        clear_rollups(cursor)
+
+        conn.commit()
+        conn.close()
+
+        get_cache_service().bump_version()
+
+
+def load_completion_log(habits):
+    """
+    Load the completion logs of the given habits in one query.
+    Returns (habit index, day ordinal) arrays sorted by habit then day,
+    where habit index is the position in `habits`.
+    """
+    positions = {habit.id: i for i, habit in enumerate(habits)}
+    if not positions:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    placeholders = ", ".join("?" for _ in positions)
+    cursor.execute(
+        f"""
+        SELECT habit_id, completed_date FROM habit_logs
+        WHERE habit_id IN ({placeholders})
+    """,
+        list(positions),
+    )
+    rows = [
+        (positions[row["habit_id"]], parse_date(row["completed_date"]).toordinal())
+        for row in cursor.fetchall()
+    ]
+    conn.close()
+
+    index = np.array([r[0] for r in rows], dtype=np.int64)
+    days = np.array([r[1] for r in rows], dtype=np.int64)
+    order = np.lexsort((days, index))
+    return index[order], days[order]
+
+
+def streak_lengths(index, days, n_habits: int, today: date):
+    """
+    Current and longest streak per habit from a sorted completion log
+    (as returned by load_completion_log). A current streak counts only
+    if it reaches today or yesterday.
+    """
+    current = np.zeros(n_habits, dtype=np.int64)
+    longest = np.zeros(n_habits, dtype=np.int64)
+    if len(days) == 0:
+        return current, longest
+
+    # Runs of consecutive days: a new run starts at each habit's first
+    # log and wherever the gap to the previous log is not one day.
+    run_start = np.ones(len(days), dtype=bool)
+    run_start[1:] = (np.diff(days) != 1) | (np.diff(index) != 0)
+    run_id = np.cumsum(run_start) - 1
+    run_length = np.bincount(run_id)
+    run_habit = index[run_start]
+
+    np.maximum.at(longest, run_habit, run_length)
+
+    # Logs are sorted per habit, so each habit's last run ends at its
+    # latest completion; it only counts if that is today or yesterday.
+    last_run = np.full(n_habits, -1)
+    np.maximum.at(last_run, run_habit, np.arange(len(run_length)))
+    last_day = np.full(n_habits, -1)
+    np.maximum.at(last_day, index, days)
+    live = (last_day == today.toordinal()) | (
+        last_day == today.toordinal() - 1
+    )
+    current[live] = run_length[last_run[live]]
+    return current, longest
+
+
+def completion_matrix(index, days, n_habits: int, end: date, length: int) -> np.ndarray:
+    """Boolean habits x days matrix of completions for the `length` days ending on `end`"""
+    offset = days - (end.toordinal() - length + 1)
+    inside = (offset >= 0) & (offset < length)
+    matrix = np.zeros((n_habits, length), dtype=bool)
+    matrix[index[inside], offset[inside]] = True
+    return matrix
+
 
 # Global service instance
 _stats_service_instance = None
@@ -20,7 +20,10 @@ class StreakService:
         Streak continues if completed today OR yesterday (grace period).
         """
         completions = self.habit_service.get_habit_completions(habit_id)
+        return self.current_streak_from_completions(completions)
 
+    def current_streak_from_completions(self, completions) -> int:
+        """Current streak from an already loaded list of completion dates"""
         if not completions:
             return 0
 
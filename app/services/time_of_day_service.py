@@ -0,0 +1,168 @@
+"""
+Time of day service - when completions happen, from habit_logs.created_at
+"""
+
+from typing import Dict, List, Optional
+from app.db.database import get_db_connection
+from app.services.cache_service import get_cache_service
+
+# (name, icon, first hour, last hour exclusive) - Night wraps past midnight
+TIME_PERIODS = [
+    ("Morning", "🌅", 5, 12),
+    ("Afternoon", "☀️", 12, 17),
+    ("Evening", "🌆", 17, 22),
+    ("Night", "🌙", 22, 5),
+]
+
+# Minimum same-day completions before a habit gets a best-hour hint
+MIN_SAMPLES_FOR_HINT = 5
+
+# Only completions logged on the day they count for say when the habit
+# was done; back-filled days would skew towards the time of catching up.
+# created_at is stored in UTC, so hours are converted to local time.
+_SAME_DAY_LOGS = """
+    FROM habit_logs
+    WHERE created_at IS NOT NULL
+      AND date(created_at, 'localtime') = completed_date
+"""
+
+
+class TimeOfDayService:
+    """Service for hour-of-day completion analytics"""
+
+    def get_hour_histogram(self, habit_id: int = None) -> List[int]:
+        """Completions per local hour (index 0-23), optionally for one habit"""
+        return get_cache_service().get_or_compute(
+            ("hour_histogram", habit_id),
+            lambda: self._query_hour_histogram(habit_id),
+        )
+
+    def get_hour_weekday_histogram(self) -> List[List[int]]:
+        """Completions per weekday (Monday = 0) x local hour"""
+        return get_cache_service().get_or_compute(
+            ("hour_weekday_histogram",), self._query_hour_weekday_histogram
+        )
+
+    def get_period_breakdown(self) -> List[Dict]:
+        """Share of completions in each time period, as a percentage"""
+        hours = self.get_hour_histogram()
+        total = sum(hours)
+
+        periods = []
+        for name, icon, first, last in TIME_PERIODS:
+            span = (
+                range(first, last)
+                if first < last
+                else list(range(first, 24)) + list(range(0, last))
+            )
+            count = sum(hours[h] for h in span)
+            periods.append(
+                {
+                    "name": name,
+                    "icon": icon,
+                    "time": f"{format_hour(first)} - {format_hour(last)}",
+                    "count": count,
+                    "rate": int(round(count / total * 100)) if total else 0,
+                }
+            )
+        return periods
+
+    def get_best_hours(self) -> Dict[int, int]:
+        """Most common local completion hour per habit, for habits with enough data"""
+        return get_cache_service().get_or_compute(
+            ("best_hours",), self._query_best_hours
+        )
+
+    def get_best_hour(self, habit_id: int) -> Optional[int]:
+        """Most common local completion hour for a habit, or None"""
+        return self.get_best_hours().get(habit_id)
+
+    def _query_hour_histogram(self, habit_id: int = None) -> List[int]:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        query = f"""
+            SELECT CAST(strftime('%H', created_at, 'localtime') AS INTEGER) AS hour,
+                   COUNT(*) AS count
+            {_SAME_DAY_LOGS}
+        """
+        params = ()
+        if habit_id is not None:
+            query += " AND habit_id = ?"
+            params = (habit_id,)
+        cursor.execute(query + " GROUP BY hour", params)
+
+        hours = [0] * 24
+        for row in cursor.fetchall():
+            if row["hour"] is not None:
+                hours[row["hour"]] = row["count"]
+
+        conn.close()
+        return hours
+
+    def _query_hour_weekday_histogram(self) -> List[List[int]]:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        # %w counts from Sunday = 0; shift so Monday = 0 like date.weekday()
+        cursor.execute(f"""
+            SELECT (CAST(strftime('%w', completed_date) AS INTEGER) + 6) % 7 AS weekday,
+                   CAST(strftime('%H', created_at, 'localtime') AS INTEGER) AS hour,
+                   COUNT(*) AS count
+            {_SAME_DAY_LOGS}
+            GROUP BY weekday, hour
+        """)
+
+        grid = [[0] * 24 for _ in range(7)]
+        for row in cursor.fetchall():
+            if row["weekday"] is not None and row["hour"] is not None:
+                grid[row["weekday"]][row["hour"]] = row["count"]
+
+        conn.close()
+        return grid
+
+    def _query_best_hours(self) -> Dict[int, int]:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(f"""
+            SELECT habit_id,
+                   CAST(strftime('%H', created_at, 'localtime') AS INTEGER) AS hour,
+                   COUNT(*) AS count
+            {_SAME_DAY_LOGS}
+            GROUP BY habit_id, hour
+        """)
+
+        totals = {}
+        best = {}
+        for row in cursor.fetchall():
+            habit_id = row["habit_id"]
+            totals[habit_id] = totals.get(habit_id, 0) + row["count"]
+            if habit_id not in best or row["count"] > best[habit_id][1]:
+                best[habit_id] = (row["hour"], row["count"])
+
+        conn.close()
+
+        return {
+            habit_id: hour
+            for habit_id, (hour, _) in best.items()
+            if totals[habit_id] >= MIN_SAMPLES_FOR_HINT
+        }
+
+
+def format_hour(hour: int) -> str:
+    """Format an hour as '6 AM' / '12 PM'"""
+    suffix = "AM" if hour % 24 < 12 else "PM"
+    return f"{(hour % 12) or 12} {suffix}"
+
+
+# Global service instance
+_time_of_day_service_instance = None
+
+
+def get_time_of_day_service() -> TimeOfDayService:
+    """Get global time of day service instance"""
+    global _time_of_day_service_instance
+    if _time_of_day_service_instance is None:
+        _time_of_day_service_instance = TimeOfDayService()
+    return _time_of_day_service_instance
@@ -13,6 +13,8 @@ DISPLAY_DATE_FORMAT = "%B %d, %Y"
 # Habit frequencies
 FREQUENCY_DAILY = "daily"
 FREQUENCY_WEEKLY = "weekly"
+FREQUENCY_WEEKDAYS = "days:0,1,2,3,4"
+FREQUENCY_WEEKENDS = "days:5,6"
 
 # Habit categories
 CATEGORIES = [
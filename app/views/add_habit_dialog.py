@@ -15,8 +15,14 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 from app.services.habit_service import get_habit_service
+from app.services.reminder_service import get_reminder_service, normalize_reminder_time
 from app.utils.constants import CATEGORIES
 from app.themes import get_theme_manager
+from app.utils.dates import get_today
+from app.widgets.schedule_picker import SchedulePicker
+
+# Height of the dialog with the schedule presets; the custom editor adds to it
+DIALOG_HEIGHT = 680
 
 
 class AddHabitDialog(QDialog):
@@ -25,6 +31,7 @@ class AddHabitDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.habit_service = get_habit_service()
+        self.reminder_service = get_reminder_service()
         self.theme_manager = get_theme_manager()
         self.setup_ui()
 
@@ -41,7 +48,7 @@ class AddHabitDialog(QDialog):
 
         self.setWindowTitle("Add New Habit")
         self.setModal(True)
-        self.setFixedSize(540, 520) # Made shorter since fields were removed
+        self.setFixedSize(540, DIALOG_HEIGHT)
         self.setStyleSheet(f"""
             QDialog {{
                 background-color: {bg_color};
@@ -74,14 +81,14 @@ class AddHabitDialog(QDialog):
 
         # Helper for common field styles
         input_style = f"""
-            QLineEdit, QComboBox {{
+            QLineEdit, QComboBox, QSpinBox {{
                 background-color: {input_bg};
                 border: 2px solid {border_color};
                 border-radius: 12px;
                 padding: 10px 16px;
                 color: {text_primary};
             }}
-            QLineEdit:focus, QComboBox:hover {{
+            QLineEdit:focus, QComboBox:hover, QSpinBox:focus {{
                 border: 2px solid {colors.PURPLE_500};
             }}
             QComboBox::drop-down {{
@@ -126,6 +133,21 @@ class AddHabitDialog(QDialog):
         self.category_combo.setStyleSheet(input_style)
         layout.addWidget(self.category_combo)
 
+        # Schedule; a new habit's weekly day and every-N count start today
+        self.schedule_picker = SchedulePicker(
+            get_today(), input_style=input_style, colors=colors
+        )
+        self.schedule_picker.layout_changed.connect(self._fit_height)
+        layout.addWidget(self.schedule_picker)
+
+        # Reminder times, comma separated
+        self.reminders_input = QLineEdit()
+        self.reminders_input.setPlaceholderText("⏰ Reminder times, e.g. 08:00, 20:30")
+        self.reminders_input.setFont(QFont("SF Pro Text", 14))
+        self.reminders_input.setFixedHeight(52)
+        self.reminders_input.setStyleSheet(input_style)
+        layout.addWidget(self.reminders_input)
+
         layout.addStretch()
 
         # Action Buttons
@@ -171,13 +193,14 @@ class AddHabitDialog(QDialog):
         button_layout.addWidget(save_btn)
 
         layout.addLayout(button_layout)
+        self._fit_height()
 
     def save_habit(self):
         """Validate and save the habit"""
         name = self.name_input.text().strip()
         description = "" # Default empty description
         category = self.category_combo.currentData()
-        frequency = "daily" # Default to daily frequency
+        reminder_times = [t for t in self.reminders_input.text().split(",") if t.strip()]
 
         if not name:
             self.show_error("Validation Error", "Please enter a habit name")
@@ -192,11 +215,36 @@ class AddHabitDialog(QDialog):
             return
 
         try:
-            self.habit_service.create_habit(name, description, category, frequency)
+            frequency = self.schedule_picker.get_frequency()
+        except ValueError:
+            self.show_error(
+                "Validation Error", "Skip dates must be YYYY-MM-DD, separated by commas"
+            )
+            self.schedule_picker.exclusions_input.setFocus()
+            return
+
+        try:
+            reminder_times = [normalize_reminder_time(t) for t in reminder_times]
+        except ValueError:
+            self.show_error(
+                "Validation Error", "Reminder times must be HH:MM, separated by commas"
+            )
+            self.reminders_input.setFocus()
+            return
+
+        try:
+            habit_id = self.habit_service.create_habit(
+                name, description, frequency=frequency, category=category
+            )
+            self.reminder_service.set_reminders(habit_id, reminder_times)
             self.accept()
         except Exception as e:
             self.show_error("Error", f"Failed to create habit:\n{str(e)}")
 
+    def _fit_height(self):
+        """Grow the dialog while the custom schedule editor is shown"""
+        self.setFixedSize(540, max(DIALOG_HEIGHT, self.sizeHint().height()))
+
     def show_error(self, title, message):
         """Show error message with theme support"""
         colors = self.theme_manager.get_theme()
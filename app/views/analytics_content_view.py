@@ -15,13 +15,21 @@ from PySide6.QtWidgets import (
     QButtonGroup,
     QRadioButton,
     QSizePolicy,
+    QProgressBar,
 )
 from PySide6.QtCore import Qt, QRect, QPropertyAnimation, QEasingCurve, QPoint
 from PySide6.QtGui import QFont, QColor, QPainter, QPen, QLinearGradient, QPainterPath
-from datetime import datetime, timedelta
+from datetime import datetime
 from app.services.habit_service import get_habit_service
 from app.services.streak_service import get_streak_service
+from app.services.stats_service import get_stats_service
+from app.services.time_of_day_service import get_time_of_day_service, format_hour
+from app.services.heatmap_service import get_heatmap_service
+from app.services.forecast_service import get_forecast_service
+from app.services.correlation_service import get_correlation_service
 from app.themes import get_theme_manager
+from app.widgets.calendar_heatmap import CalendarHeatmap
+from app.widgets.correlation_matrix import CorrelationMatrix
 
 
 class LineChart(QWidget):
@@ -482,8 +490,15 @@ class AnalyticsContentView(QWidget):
         self.main_window = parent
         self.habit_service = get_habit_service()
         self.streak_service = get_streak_service()
+        self.stats_service = get_stats_service()
+        self.time_of_day_service = get_time_of_day_service()
+        self.heatmap_service = get_heatmap_service()
+        self.forecast_service = get_forecast_service()
+        self.correlation_service = get_correlation_service()
         self.theme_manager = get_theme_manager()
         self.current_chart_period = "7 days"  # Default
+        # Kept across reloads so its rendered years stay cached
+        self.heatmap = CalendarHeatmap()
         self.setup_ui()
         self.load_analytics()
 
@@ -609,6 +624,8 @@ class AnalyticsContentView(QWidget):
 
     def load_analytics(self):
         """Load analytics data"""
+        # Detach the heatmap so it survives its card being deleted
+        self.heatmap.setParent(None)
         while self.content_layout.count():
             item = self.content_layout.takeAt(0)
             if item.widget():
@@ -693,19 +710,8 @@ class AnalyticsContentView(QWidget):
 
         # Calculate stats
         total_habits = len(habits)
-        completed_today = sum(
-            1 for h in habits if self.habit_service.is_habit_completed_today(h.id)
-        )
-
-        # Calculate 30-day completion rate
-        total_completions = 0
-        total_possible = 0
-        for i in range(30):
-            date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-            for habit in habits:
-                total_possible += 1
-                if self.habit_service.is_habit_completed_on_date(habit.id, date):
-                    total_completions += 1
+        overview = self.stats_service.get_overview()
+        completed_today = overview["completed_today"]
 
         # SECTION 1: HERO STATS
 
@@ -720,13 +726,7 @@ class AnalyticsContentView(QWidget):
         hero_layout.setSpacing(20)
         hero_layout.setContentsMargins(20, 24, 20, 24)
 
-        # Helper function for consistency score
-        def calculate_consistency():
-            if total_possible == 0:
-                return 0
-            return round((total_completions / total_possible) * 10, 1)
-
-        consistency_score = calculate_consistency()
+        consistency_score = round(overview["consistency_30d"] * 10, 1)
 
         # Card 1: Total Habits
         total_card = StatCard("🎯", "Total Habits", total_habits, "Active habits", None)
@@ -747,13 +747,7 @@ class AnalyticsContentView(QWidget):
         hero_layout.addWidget(today_card, 1)
 
         # Card 3: Current Streak
-        current_streak = max(
-            (
-                self.streak_service.get_streak_info(h.id).get("current_streak", 0)
-                for h in habits
-            ),
-            default=0,
-        )
+        current_streak = overview["max_current_streak"]
 
         streak_card = StatCard(
             "🔥", "Current Streak", f"{current_streak}", "days in a row", None
@@ -781,6 +775,9 @@ class AnalyticsContentView(QWidget):
         # GRAPHS SECTION
         self.add_graphs_section(habits)
 
+        # Calendar heatmap
+        self.add_heatmap_section(habits)
+
         # SECTION 3: Week Comparison (already added)
         self.content_layout.addSpacing(30)
         self.add_week_comparison_section()
@@ -794,6 +791,9 @@ class AnalyticsContentView(QWidget):
         # SECTION 6: Time of Day + Difficulty
         self.add_time_of_day_difficulty()
 
+        # SECTION 7: Habit Connections
+        self.add_habit_connections_section(habits)
+
     def _create_badge(self, icon, name, desc, is_unlocked):
         """Create a single badge widget"""
         badge = QFrame()
@@ -922,7 +922,16 @@ class AnalyticsContentView(QWidget):
 
         self.period_combo = QComboBox()
         self.period_combo.addItems(
-            ["7 days", "30 days", "3 months", "6 months", "9 months", "1 year"]
+            [
+                "7 days",
+                "30 days",
+                "3 months",
+                "6 months",
+                "9 months",
+                "1 year",
+                "2 years",
+                "5 years",
+            ]
         )
         self.period_combo.setCurrentText("7 days")
         self.period_combo.setFont(QFont("SF Pro Text", 13))
@@ -1036,6 +1045,115 @@ class AnalyticsContentView(QWidget):
         # Initial graph load
         self.update_graph()
 
+    def add_heatmap_section(self, habits):
+        """Calendar heatmap of a full year"""
+        is_dark = self.theme_manager.is_dark_mode()
+        container_bg = "#252732" if is_dark else "#FFFFFF"
+        border_color = "#333645" if is_dark else "#F3F4F6"
+        text_primary = "#F3F4F6" if is_dark else "#111827"
+        text_secondary = "#9CA3AF" if is_dark else "#6B7280"
+
+        heatmap_card = QFrame()
+        heatmap_card.setObjectName("heatmapCard")
+        heatmap_card.setStyleSheet(f"""
+            QFrame#heatmapCard {{
+                background-color: {container_bg};
+                border: 1px solid {border_color};
+                border-radius: 24px;
+            }}
+            QLabel {{
+                border: none;
+                background: transparent;
+            }}
+        """)
+
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(25)
+        shadow.setColor(QColor(0, 0, 0, 30))
+        shadow.setOffset(0, 6)
+        heatmap_card.setGraphicsEffect(shadow)
+
+        layout = QVBoxLayout(heatmap_card)
+        layout.setContentsMargins(32, 28, 32, 28)
+        layout.setSpacing(16)
+
+        header = QHBoxLayout()
+
+        title = QLabel("🗓️ Calendar Heatmap")
+        title.setFont(QFont("SF Pro Display", 22, QFont.Bold))
+        title.setStyleSheet(f"color: {text_primary};")
+        header.addWidget(title)
+        header.addStretch()
+
+        combo_style = f"""
+            QComboBox {{
+                background-color: {"#2C2F3A" if is_dark else "#F9FAFB"};
+                border: 2px solid {"#333645" if is_dark else "#E5E7EB"};
+                border-radius: 10px;
+                padding: 6px 16px;
+                min-width: 100px;
+                color: {text_primary};
+            }}
+            QComboBox:hover {{
+                border: 2px solid #6366F1;
+            }}
+            QComboBox::drop-down {{
+                border: none;
+                padding-right: 10px;
+            }}
+            QComboBox QAbstractItemView {{
+                background-color: {container_bg};
+                border: 2px solid {"#333645" if is_dark else "#E5E7EB"};
+                selection-background-color: #EEF2FF;
+                selection-color: #4F46E5;
+                color: {text_primary};
+            }}
+        """
+
+        self.heatmap_habit_combo = QComboBox()
+        self.heatmap_habit_combo.addItem("All habits", None)
+        for habit in habits:
+            self.heatmap_habit_combo.addItem(habit.name, habit.id)
+        self.heatmap_habit_combo.setFont(QFont("SF Pro Text", 13))
+        self.heatmap_habit_combo.setFixedHeight(40)
+        self.heatmap_habit_combo.setStyleSheet(combo_style)
+        header.addWidget(self.heatmap_habit_combo)
+
+        self.heatmap_year_combo = QComboBox()
+        for year in reversed(self.heatmap_service.get_available_years()):
+            self.heatmap_year_combo.addItem(str(year), year)
+        self.heatmap_year_combo.setFont(QFont("SF Pro Text", 13))
+        self.heatmap_year_combo.setFixedHeight(40)
+        self.heatmap_year_combo.setStyleSheet(combo_style)
+        header.addWidget(self.heatmap_year_combo)
+
+        layout.addLayout(header)
+
+        subtitle = QLabel("Darker days mean more of your habits were completed")
+        subtitle.setFont(QFont("SF Pro Text", 13))
+        subtitle.setStyleSheet(f"color: {text_secondary};")
+        layout.addWidget(subtitle)
+
+        layout.addWidget(self.heatmap, alignment=Qt.AlignHCenter)
+
+        self.heatmap_habit_combo.currentIndexChanged.connect(self.update_heatmap)
+        self.heatmap_year_combo.currentIndexChanged.connect(self.update_heatmap)
+        self.update_heatmap()
+
+        self.content_layout.addWidget(heatmap_card)
+
+    def update_heatmap(self):
+        """Show the selected year and habit in the heatmap"""
+        year = self.heatmap_year_combo.currentData()
+        habit_id = self.heatmap_habit_combo.currentData()
+        if year is None:
+            return
+
+        grid = self.heatmap_service.get_year_intensity(year, habit_id)
+        self.heatmap.set_data(
+            year, grid, habit_id=habit_id, is_dark=self.theme_manager.is_dark_mode()
+        )
+
     def add_week_comparison_section(self):
         """Premium Week Comparison Section"""
         comparison_card = QFrame()
@@ -1070,28 +1188,13 @@ class AnalyticsContentView(QWidget):
         layout.addWidget(title)
 
         # GET DATA
-        def get_week_completions(week_offset_days):
-            """Calculate total completions for a week"""
-            total = 0
-            habits = self.habit_service.get_all_habits()
-
-            for day in range(7):
-                date = datetime.now() - timedelta(days=week_offset_days + day)
-                date_str = date.strftime("%Y-%m-%d")
-
-                for habit in habits:
-                    if self.habit_service.is_habit_completed_on_date(
-                        habit.id, date_str
-                    ):
-                        total += 1
-
-            return total
+        summary = self.stats_service.get_daily_summary(14)
 
         # This week (days 0-6 ago)
-        this_week = get_week_completions(0)
+        this_week = sum(day["completed_count"] for day in summary[7:])
 
         # Last week (days 7-13 ago)
-        last_week = get_week_completions(7)
+        last_week = sum(day["completed_count"] for day in summary[:7])
 
         # NUMBERS ROW
         numbers_row = QHBoxLayout()
@@ -1223,13 +1326,29 @@ class AnalyticsContentView(QWidget):
 
     def add_day_of_week_analysis(self):
         """Day of Week Analysis Section"""
+        days_data = self.stats_service.get_weekday_breakdown(365)
+        if not any(day["possible"] for day in days_data):
+            return
+
+        is_dark = self.theme_manager.is_dark_mode()
+        container_bg = "#252732" if is_dark else "#FFFFFF"
+        border_color = "#333645" if is_dark else "#F1F5F9"
+        text_primary = "#F3F4F6" if is_dark else "#111827"
+        text_secondary = "#9CA3AF" if is_dark else "#6B7280"
+        track_color = "#2C2F3A" if is_dark else "#F3F4F6"
+
         dow_card = QFrame()
-        dow_card.setStyleSheet("""
-            QFrame {
-                background-color: #FFFFFF;
+        dow_card.setObjectName("dowCard")
+        dow_card.setStyleSheet(f"""
+            QFrame#dowCard {{
+                background-color: {container_bg};
                 border-radius: 20px;
-                border: 1px solid #F1F5F9;
-            }
+                border: 1px solid {border_color};
+            }}
+            QLabel {{
+                border: none;
+                background: transparent;
+            }}
         """)
 
         shadow = QGraphicsDropShadowEffect()
@@ -1240,210 +1359,230 @@ class AnalyticsContentView(QWidget):
 
         layout = QVBoxLayout(dow_card)
         layout.setContentsMargins(32, 28, 32, 28)
-        layout.setSpacing(20)
+        layout.setSpacing(12)
 
         # Title
-        # title = QLabel("📅 Weekly Pattern")
-        # title.setFont(QFont("SF Pro Display", 22, QFont.Bold))
-        # title.setStyleSheet("color: #111827;")
-        # layout.addWidget(title)
-
-        # subtitle = QLabel("See which days you're most consistent")
-        # subtitle.setFont(QFont("SF Pro Text", 13))
-        # subtitle.setStyleSheet("color: #6B7280;")
-        # layout.addWidget(subtitle)
-
-        # # Calculate data for each day
-        # habits = self.habit_service.get_all_habits()
-        # if not habits:
-        #     return
-
-        # day_stats = {i: {"total": 0, "completed": 0} for i in range(7)}
-
-        # # Look back 30 days
-        # for i in range(30):
-        #     date = datetime.now() - timedelta(days=i)
-        #     day_of_week = date.weekday()
-        #     date_str = date.strftime("%Y-%m-%d")
-
-        #     for habit in habits:
-        #         day_stats[day_of_week]["total"] += 1
-        #         if self.habit_service.is_habit_completed_on_date(habit.id, date_str):
-        #             day_stats[day_of_week]["completed"] += 1
-
-        # # Calculate percentages
-        # days_data = []
-        # day_names = [
-        #     "Monday",
-        #     "Tuesday",
-        #     "Wednesday",
-        #     "Thursday",
-        #     "Friday",
-        #     "Saturday",
-        #     "Sunday",
-        # ]
-        # day_emojis = ["💼", "📊", "🎯", "🚀", "🎉", "🏖️", "☀️"]
-
-        # for i in range(7):
-        #     total = day_stats[i]["total"]
-        #     completed = day_stats[i]["completed"]
-        #     percentage = int((completed / total) * 100) if total > 0 else 0
-        #     days_data.append(
-        #         {
-        #             "name": day_names[i],
-        #             "emoji": day_emojis[i],
-        #             "percentage": percentage,
-        #             "completed": completed,
-        #             "total": total,
-        #         }
-        #     )
-
-        # # Find best and worst days
-        # best_day = max(days_data, key=lambda x: x["percentage"])
-        # worst_day = min(days_data, key=lambda x: x["percentage"])
-
-        # # Day bars
-        # for day_data in days_data:
-        #     day_container = QFrame()
-        #     day_container.setFixedHeight(68)
-
-        #     # Color based on percentage
-        #     if day_data["percentage"] >= 80:
-        #         color = "#10B981"
-        #         bg_color = "#ECFDF5"
-        #         text_color = "#065F46"
-        #         badge = "⭐"
-        #     elif day_data["percentage"] >= 60:
-        #         color = "#F59E0B"
-        #         bg_color = "#FEF3C7"
-        #         text_color = "#92400E"
-        #         badge = "👍"
-        #     else:
-        #         color = "#EF4444"
-        #         bg_color = "#FEE2E2"
-        #         text_color = "#991B1B"
-        #         badge = "⚠️"
-
-        #     day_container.setStyleSheet(f"""
-        #         QFrame {{
-        #             background-color: {bg_color};
-        #             border-left: 4px solid {color};
-        #             border-radius: 12px;
-        #         }}
-        #     """)
-
-        #     day_layout = QHBoxLayout(day_container)
-        #     day_layout.setContentsMargins(20, 12, 20, 12)
-        #     day_layout.setSpacing(16)
-
-        #     # Left: Day name
-        #     left_layout = QVBoxLayout()
-        #     left_layout.setSpacing(2)
-
-        #     name_label = QLabel(f"{day_data['emoji']} {day_data['name']}")
-        #     name_label.setFont(QFont("SF Pro Display", 15, QFont.Bold))
-        #     name_label.setStyleSheet(f"color: {text_color};")
-        #     left_layout.addWidget(name_label)
-
-        #     stats_label = QLabel(
-        #         f"{day_data['completed']}/{day_data['total']} completed"
-        #     )
-        #     stats_label.setFont(QFont("SF Pro Text", 11))
-        #     stats_label.setStyleSheet("color: #6B7280;")
-        #     left_layout.addWidget(stats_label)
-
-        #     day_layout.addLayout(left_layout)
-
-        #     # Progress bar
-        #     progress_container = QWidget()
-        #     progress_container.setFixedHeight(28)
-        #     progress_layout = QVBoxLayout(progress_container)
-        #     progress_layout.setContentsMargins(0, 0, 0, 0)
-
-        #     progress_bg = QFrame()
-        #     progress_bg.setFixedHeight(12)
-        #     progress_bg.setStyleSheet("""
-        #         QFrame {{
-        #             background-color: #F3F4F6;
-        #             border-radius: 6px;
-        #         }}
-        #     """)
-
-        #     progress_fill = QFrame(progress_bg)
-        #     fill_width = int(300 * (day_data["percentage"] / 100))
-        #     progress_fill.setGeometry(0, 0, fill_width, 12)
-        #     progress_fill.setStyleSheet(f"""
-        #         QFrame {{
-        #             background-color: {color};
-        #             border-radius: 6px;
-        #         }}
-        #     """)
-
-        #     progress_layout.addWidget(progress_bg)
-
-        #     day_layout.addWidget(progress_container, stretch=1)
-
-        #     # Right: Percentage + Badge
-        #     right_layout = QHBoxLayout()
-        #     right_layout.setSpacing(8)
-
-        #     percentage_label = QLabel(f"{day_data['percentage']}%")
-        #     percentage_label.setFont(QFont("SF Pro Display", 18, QFont.Bold))
-        #     percentage_label.setStyleSheet(f"color: {text_color};")
-        #     right_layout.addWidget(percentage_label)
-
-        #     # Add badge for best/worst
-        #     if day_data["name"] == best_day["name"] and best_day["percentage"] > 0:
-        #         badge_label = QLabel("🏆")
-        #         badge_label.setFont(QFont("SF Pro Display", 20))
-        #         badge_label.setToolTip("Your best day!")
-        #         right_layout.addWidget(badge_label)
-        #     elif (
-        #         day_data["name"] == worst_day["name"]
-        #         and worst_day["percentage"] < best_day["percentage"]
-        #     ):
-        #         badge_label = QLabel("💡")
-        #         badge_label.setFont(QFont("SF Pro Display", 20))
-        #         badge_label.setToolTip("Room for improvement")
-        #         right_layout.addWidget(badge_label)
-
-        #     day_layout.addLayout(right_layout)
-
-        #     layout.addWidget(day_container)
-
-        # # Insights
-        # insight_box = QFrame()
-        # insight_box.setStyleSheet("""
-        #     QFrame {
-        #         background-color: #EEF2FF;
-        #         border-left: 4px solid #6366F1;
-        #         border-radius: 12px;
-        #         padding: 16px;
-        #     }
-        # """)
-
-        # insight_layout = QVBoxLayout(insight_box)
-        # insight_layout.setContentsMargins(16, 12, 16, 12)
-        # insight_layout.setSpacing(6)
-
-        # insight_title = QLabel("💡 Insights")
-        # insight_title.setFont(QFont("SF Pro Text", 13, QFont.Bold))
-        # insight_title.setStyleSheet("color: #4F46E5;")
-        # insight_layout.addWidget(insight_title)
-
-        # insight_text = QLabel(
-        #     f"• Your best day is {best_day['name']} ({best_day['percentage']}%)\n"
-        #     f"• {worst_day['name']} needs attention ({worst_day['percentage']}%)\n"
-        #     f"• Try scheduling important habits on {best_day['name']}"
-        # )
-        # insight_text.setFont(QFont("SF Pro Text", 12))
-        # insight_text.setStyleSheet("color: #1E40AF;")
-        # insight_text.setWordWrap(True)
-        # insight_layout.addWidget(insight_text)
-
-        # layout.addWidget(insight_box)
-
-        # self.content_layout.addWidget(dow_card)
+        title = QLabel("📅 Weekly Pattern")
+        title.setFont(QFont("SF Pro Display", 22, QFont.Bold))
+        title.setStyleSheet(f"color: {text_primary};")
+        layout.addWidget(title)
+
+        subtitle = QLabel("See which days you're most consistent (last 12 months)")
+        subtitle.setFont(QFont("SF Pro Text", 13))
+        subtitle.setStyleSheet(f"color: {text_secondary};")
+        layout.addWidget(subtitle)
+
+        day_emojis = ["💼", "📊", "🎯", "🚀", "🎉", "🏖️", "☀️"]
+
+        # Find best and worst days
+        best_day = max(days_data, key=lambda x: x["rate"])
+        worst_day = min(days_data, key=lambda x: x["rate"])
+
+        # Day bars
+        for day_data in days_data:
+            percentage = int(day_data["rate"])
+
+            # Color based on percentage
+            if percentage >= 80:
+                color = "#10B981"
+            elif percentage >= 60:
+                color = "#F59E0B"
+            else:
+                color = "#EF4444"
+
+            day_container = QFrame()
+            day_container.setFixedHeight(56)
+            day_layout = QHBoxLayout(day_container)
+            day_layout.setContentsMargins(0, 4, 0, 4)
+            day_layout.setSpacing(16)
+
+            # Left: Day name
+            left_layout = QVBoxLayout()
+            left_layout.setSpacing(2)
+
+            name_label = QLabel(f"{day_emojis[day_data['weekday']]} {day_data['name']}")
+            name_label.setFont(QFont("SF Pro Display", 15, QFont.Bold))
+            name_label.setStyleSheet(f"color: {text_primary};")
+            left_layout.addWidget(name_label)
+
+            stats_label = QLabel(
+                f"{day_data['completed']}/{day_data['possible']} completed"
+            )
+            stats_label.setFont(QFont("SF Pro Text", 11))
+            stats_label.setStyleSheet(f"color: {text_secondary};")
+            left_layout.addWidget(stats_label)
+
+            left_widget = QWidget()
+            left_widget.setLayout(left_layout)
+            left_widget.setFixedWidth(170)
+            day_layout.addWidget(left_widget)
+
+            # Progress bar
+            bar = QProgressBar()
+            bar.setRange(0, 100)
+            bar.setValue(percentage)
+            bar.setTextVisible(False)
+            bar.setFixedHeight(12)
+            bar.setStyleSheet(f"""
+                QProgressBar {{
+                    background-color: {track_color};
+                    border: none;
+                    border-radius: 6px;
+                }}
+                QProgressBar::chunk {{
+                    background-color: {color};
+                    border-radius: 6px;
+                }}
+            """)
+            day_layout.addWidget(bar, stretch=1)
+
+            # Right: Percentage + Badge
+            percentage_label = QLabel(f"{percentage}%")
+            percentage_label.setFont(QFont("SF Pro Display", 18, QFont.Bold))
+            percentage_label.setStyleSheet(f"color: {color};")
+            percentage_label.setFixedWidth(60)
+            percentage_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            day_layout.addWidget(percentage_label)
+
+            badge_label = QLabel("")
+            badge_label.setFont(QFont("SF Pro Display", 20))
+            badge_label.setFixedWidth(32)
+            if day_data is best_day and best_day["rate"] > 0:
+                badge_label.setText("🏆")
+                badge_label.setToolTip("Your best day!")
+            elif day_data is worst_day and worst_day["rate"] < best_day["rate"]:
+                badge_label.setText("💡")
+                badge_label.setToolTip("Room for improvement")
+            day_layout.addWidget(badge_label)
+
+            layout.addWidget(day_container)
+
+        # Insights
+        insight_box = QFrame()
+        insight_box.setObjectName("insightBox")
+        insight_bg = "#1E1B4B" if is_dark else "#EEF2FF"
+        insight_box.setStyleSheet(f"""
+            QFrame#insightBox {{
+                background-color: {insight_bg};
+                border-left: 4px solid #6366F1;
+                border-radius: 12px;
+            }}
+        """)
+
+        insight_layout = QVBoxLayout(insight_box)
+        insight_layout.setContentsMargins(16, 12, 16, 12)
+        insight_layout.setSpacing(6)
+
+        insight_title = QLabel("💡 Insights")
+        insight_title.setFont(QFont("SF Pro Text", 13, QFont.Bold))
+        insight_title.setStyleSheet("color: #818CF8;" if is_dark else "color: #4F46E5;")
+        insight_layout.addWidget(insight_title)
+
+        insight_text = QLabel(
+            f"• Your best day is {best_day['name']} ({int(best_day['rate'])}%)\n"
+            f"• {worst_day['name']} needs attention ({int(worst_day['rate'])}%)\n"
+            f"• Try scheduling important habits on {best_day['name']}"
+        )
+        insight_text.setFont(QFont("SF Pro Text", 12))
+        insight_text.setStyleSheet("color: #C7D2FE;" if is_dark else "color: #1E40AF;")
+        insight_text.setWordWrap(True)
+        insight_layout.addWidget(insight_text)
+
+        layout.addWidget(insight_box)
+
+        self.content_layout.addWidget(dow_card)
+
+    def add_habit_connections_section(self, habits):
+        """Which habits get completed together (or crowd each other out)"""
+        if len(habits) < 2:
+            return
+
+        result = self.correlation_service.get_co_completion(365)
+        top_pairs = self.correlation_service.get_top_pairs(365)
+
+        is_dark = self.theme_manager.is_dark_mode()
+        container_bg = "#252732" if is_dark else "#FFFFFF"
+        border_color = "#333645" if is_dark else "#F1F5F9"
+        text_primary = "#F3F4F6" if is_dark else "#111827"
+        text_secondary = "#9CA3AF" if is_dark else "#6B7280"
+
+        card = QFrame()
+        card.setObjectName("connectionsCard")
+        card.setStyleSheet(f"""
+            QFrame#connectionsCard {{
+                background-color: {container_bg};
+                border-radius: 20px;
+                border: 1px solid {border_color};
+            }}
+            QLabel {{
+                border: none;
+                background: transparent;
+            }}
+        """)
+
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(25)
+        shadow.setColor(QColor(0, 0, 0, 20))
+        shadow.setOffset(0, 6)
+        card.setGraphicsEffect(shadow)
+
+        layout = QVBoxLayout(card)
+        layout.setContentsMargins(28, 24, 28, 24)
+        layout.setSpacing(16)
+
+        title = QLabel("🔗 Habit Connections")
+        title.setFont(QFont("SF Pro Display", 20, QFont.Bold))
+        title.setStyleSheet(f"color: {text_primary};")
+        layout.addWidget(title)
+
+        subtitle = QLabel(
+            "Teal: usually done on the same days • Red: one tends to crowd out the other"
+        )
+        subtitle.setFont(QFont("SF Pro Text", 12))
+        subtitle.setStyleSheet(f"color: {text_secondary};")
+        layout.addWidget(subtitle)
+
+        body = QHBoxLayout()
+        body.setSpacing(24)
+
+        matrix = CorrelationMatrix()
+        matrix.set_data(
+            [habit.name for habit in result["habits"]], result["phi"], is_dark=is_dark
+        )
+        body.addWidget(matrix, alignment=Qt.AlignTop)
+
+        # Strongest pairs in words
+        pairs_layout = QVBoxLayout()
+        pairs_layout.setSpacing(8)
+
+        lines = []
+        for pair in top_pairs["together"]:
+            if pair["phi"] >= 0.2:
+                lines.append(
+                    f"🤝 {pair['first'].name} + {pair['second'].name} "
+                    f"({pair['together']} days together)"
+                )
+        for pair in top_pairs["apart"]:
+            if pair["phi"] <= -0.2:
+                lines.append(
+                    f"⚖️ {pair['first'].name} vs {pair['second'].name} "
+                    "rarely happen on the same day"
+                )
+        if not lines:
+            lines.append("💡 No strong connections yet - your habits are independent.")
+
+        for line in lines:
+            label = QLabel(line)
+            label.setFont(QFont("SF Pro Text", 12))
+            label.setStyleSheet(f"color: {text_primary};")
+            label.setWordWrap(True)
+            pairs_layout.addWidget(label)
+        pairs_layout.addStretch()
+
+        body.addLayout(pairs_layout, stretch=1)
+        layout.addLayout(body)
+
+        self.content_layout.addWidget(card)
 
     def add_best_worst_habits(self):
         """Best & Worst Performing Habits Section"""
@@ -1455,24 +1594,24 @@ class AnalyticsContentView(QWidget):
         if not habits:
             return
 
-        # Calculate completion rates for last 30 days
+        # Rank by the recency-weighted completion rate
+        forecasts = self.forecast_service.get_forecasts(habits)
+        streaks = {
+            stat["habit_id"]: stat["current_streak"]
+            for stat in self.stats_service.get_all_habits_stats()
+        }
+
         habit_stats = []
         for habit in habits:
-            completions = 0
-            for i in range(30):
-                date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-                if self.habit_service.is_habit_completed_on_date(habit.id, date):
-                    completions += 1
-
-            rate = int((completions / 30) * 100)
-            streak_info = self.streak_service.get_streak_info(habit.id)
-
+            forecast = forecasts[habit.id]
             habit_stats.append(
                 {
                     "habit": habit,
-                    "rate": rate,
-                    "completions": completions,
-                    "streak": streak_info.get("current_streak", 0),
+                    "rate": int(round(forecast["ewma_rate"])),
+                    "completions": forecast["completions_30d"],
+                    "expected": forecast["expected_30d"],
+                    "trend": forecast["trend_per_week"],
+                    "streak": streaks.get(habit.id, 0),
                 }
             )
 
@@ -1626,9 +1765,18 @@ class AnalyticsContentView(QWidget):
         name_label.setStyleSheet(f"color: {text_primary};")
         info_layout.addWidget(name_label)
 
-        stats_label = QLabel(
-            f"{stat['completions']}/30 days • {stat['streak']} day streak"
+        stats_text = (
+            f"{stat['completions']}/{stat['expected']} due days • "
+            f"{stat['streak']} day streak"
         )
+        if stat["trend"] >= 1:
+            stats_text += " • ↗ improving"
+        elif stat["trend"] <= -1:
+            stats_text += " • ↘ slipping"
+        best_hour = get_time_of_day_service().get_best_hour(stat["habit"].id)
+        if best_hour is not None:
+            stats_text += f" • usually ~{format_hour(best_hour)}"
+        stats_label = QLabel(stats_text)
         stats_label.setFont(QFont("SF Pro Text", 11))
         secondary_color = "#9CA3AF" if is_dark else "#6B7280"
         stats_label.setStyleSheet(f"color: {secondary_color};")
@@ -1686,31 +1834,17 @@ class AnalyticsContentView(QWidget):
         )
         time_layout.addWidget(time_title)
 
-        # Calculate time of day stats (mock data - you can enhance this)
-        # For real implementation, you'd need to track completion timestamps
-        time_periods = [
-            {
-                "icon": "🌅",
-                "name": "Morning",
-                "time": "6-12 AM",
-                "rate": 82,
-                "color": "#10B981",
-            },
-            {
-                "icon": "☀️",
-                "name": "Afternoon",
-                "time": "12-6 PM",
-                "rate": 68,
-                "color": "#F59E0B",
-            },
-            {
-                "icon": "🌙",
-                "name": "Evening",
-                "time": "6-12 PM",
-                "rate": 45,
-                "color": "#EF4444",
-            },
-        ]
+        # Share of same-day completions logged in each part of the day
+        period_colors = {
+            "Morning": "#10B981",
+            "Afternoon": "#F59E0B",
+            "Evening": "#8B5CF6",
+            "Night": "#6366F1",
+        }
+        time_periods = self.time_of_day_service.get_period_breakdown()
+        for period in time_periods:
+            period["color"] = period_colors[period["name"]]
+        has_time_data = any(period["count"] for period in time_periods)
 
         best_time = max(time_periods, key=lambda x: x["rate"])
 
@@ -1774,7 +1908,7 @@ class AnalyticsContentView(QWidget):
             rate_label.setStyleSheet(f"color: {period['color']};")
             period_layout.addWidget(rate_label)
 
-            if period["name"] == best_time["name"]:
+            if has_time_data and period["name"] == best_time["name"]:
                 star_label = QLabel("⭐")
                 star_label.setFont(QFont("SF Pro Display", 20))
                 period_layout.addWidget(star_label)
@@ -1795,9 +1929,14 @@ class AnalyticsContentView(QWidget):
         insight_layout = QVBoxLayout(insight_box)
         insight_layout.setContentsMargins(12, 10, 12, 10)
 
-        insight_label = QLabel(
-            f"💡 You're most productive in the {best_time['name'].lower()}. Schedule important habits early!"
-        )
+        if has_time_data:
+            insight_text = (
+                f"💡 You're most productive in the {best_time['name'].lower()}. "
+                "Schedule important habits then!"
+            )
+        else:
+            insight_text = "💡 Complete habits on the day to see when you're most productive."
+        insight_label = QLabel(insight_text)
         insight_label.setFont(QFont("SF Pro Text", 12))
         insight_label.setStyleSheet(
             f"color: {'#F3F4F6' if is_dark else '#4F46E5'}; background: transparent; border: none;"
@@ -1842,14 +1981,9 @@ class AnalyticsContentView(QWidget):
         medium_count = 0
         hard_count = 0
 
+        forecasts = self.forecast_service.get_forecasts(habits)
         for habit in habits:
-            completions = 0
-            for i in range(30):
-                date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-                if self.habit_service.is_habit_completed_on_date(habit.id, date):
-                    completions += 1
-
-            rate = (completions / 30) * 100
+            rate = forecasts[habit.id]["rate_30d"]
             if rate >= 80:
                 easy_count += 1
             elif rate >= 50:
@@ -1999,36 +2133,36 @@ class AnalyticsContentView(QWidget):
             "6 months": 180,
             "9 months": 270,
             "1 year": 365,
+            "2 years": 730,
+            "5 years": 1825,
         }
 
         days = period_map.get(period_text, 30)
 
-        # Get data
-        habits = self.habit_service.get_all_habits()
+        # Get data - one point per day, week or month depending on range
         data = []
         labels = []
 
-        for i in range(days):
-            date = datetime.now() - timedelta(days=days - 1 - i)
-            date_str = date.strftime("%Y-%m-%d")
-
-            completions = sum(
-                1
-                for h in habits
-                if self.habit_service.is_habit_completed_on_date(h.id, date_str)
-            )
-            data.append(completions)
+        granularity = self.stats_service.get_trend_granularity(days)
+        for i, entry in enumerate(self.stats_service.get_trend(days)):
+            date = datetime.strptime(entry["period_start"], "%Y-%m-%d")
+            data.append(entry["completed_count"])
 
             # Label formatting based on period
-            if days <= 30:
-                labels.append(date.strftime("%b %d"))
-            elif days <= 90:
-                if i % 3 == 0:  # Every 3 days
+            if granularity == "month":
+                if i % 6 == 0:  # Every 6 months
+                    labels.append(date.strftime("%b %Y"))
+                else:
+                    labels.append("")
+            elif granularity == "week":
+                if i % 4 == 0:  # Every 4 weeks
                     labels.append(date.strftime("%b %d"))
                 else:
                     labels.append("")
+            elif days <= 30:
+                labels.append(date.strftime("%b %d"))
             else:
-                if i % 7 == 0:  # Every week
+                if i % 3 == 0:  # Every 3 days
                     labels.append(date.strftime("%b %d"))
                 else:
                     labels.append("")
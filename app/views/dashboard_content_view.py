@@ -27,6 +27,8 @@ from app.services.settings_service import get_settings_service
 from app.themes import get_theme_manager
 from app.widgets.theme_toggle import AnimatedThemeToggle
 from app.services.streak_service import get_streak_service
+from app.services.schedule_service import get_schedule_service
+from app.services.stats_service import get_stats_service
 
 logger = logging.getLogger(__name__)
 
@@ -175,7 +177,8 @@ class HabitCard(QFrame):
         name_label.setFont(QFont("SF Pro Display", 15, QFont.DemiBold))
         name_label.setStyleSheet(f"color: {text_primary};")
 
-        subtitle = QLabel(f"{self.habit.category} • {self.habit.frequency}")
+        schedule = get_schedule_service().get_rule(self.habit).describe()
+        subtitle = QLabel(f"{self.habit.category} • {schedule}")
         subtitle.setFont(QFont("SF Pro Text", 12))
         subtitle.setStyleSheet(f"color: {text_secondary};")
 
@@ -679,6 +682,8 @@ class DashboardContentView(QWidget):
         self.main_window = parent
         self.habit_service = get_habit_service()
         self.streak_service = get_streak_service()
+        self.schedule_service = get_schedule_service()
+        self.stats_service = get_stats_service()
         self.profile_service = get_profile_service()
         self.settings_service = get_settings_service()
         self.theme_manager = get_theme_manager()
@@ -1370,17 +1375,20 @@ class DashboardContentView(QWidget):
             habit.id: self.habit_service.is_habit_completed_today(habit.id)
             for habit in habits
         }
+        due_ids = {habit.id for habit in self.schedule_service.get_due_habits(habits)}
 
-        # Calculate progress
-        completed = sum(1 for done in completion_map.values() if done)
-        total = len(habits)
+        # Calculate progress against habits due today
+        completed = sum(1 for habit_id in due_ids if completion_map[habit_id])
+        total = len(due_ids)
         percentage = int((completed / total) * 100) if total > 0 else 0
 
         self.circular_progress.set_percentage(percentage)
         self.habits_count.setText(str(total))
 
         left = total - completed
-        if left == 0:
+        if total == 0:
+            self.progress_text.setText("😌 Rest day!\nNo habits due today.")
+        elif left == 0:
             self.progress_text.setText("🎉 Perfect!\nAll habits completed!")
         else:
             self.progress_text.setText(
@@ -1390,12 +1398,15 @@ class DashboardContentView(QWidget):
         # Separate habits using cached results
         pending = []
         completed_habits = []
+        not_due = []
 
         for habit in habits:
             if completion_map[habit.id]:
                 completed_habits.append(habit)
-            else:
+            elif habit.id in due_ids:
                 pending.append(habit)
+            else:
+                not_due.append(habit)
 
         # Add pending first
         for habit in pending:
@@ -1407,14 +1418,15 @@ class DashboardContentView(QWidget):
             card = HabitCard(habit, True, self)
             self.habits_list.addWidget(card)
 
+        # Habits with a rest day today go last
+        for habit in not_due:
+            card = HabitCard(habit, False, self)
+            self.habits_list.addWidget(card)
+
         self.habits_list.addStretch()
 
-        # Calculate max streak
-        max_streak = 0
-        for habit in habits:
-            streak_info = self.streak_service.get_streak_info(habit.id)
-            current = streak_info.get("current_streak", 0)
-            max_streak = max(max_streak, current)
+        overview = self.stats_service.get_overview()
+        max_streak = overview["max_current_streak"]
 
         self.streak_label.setText(str(max_streak))
 
@@ -1428,14 +1440,7 @@ class DashboardContentView(QWidget):
             "day in a row" if max_streak == 1 else "days in a row"
         )
 
-        # Calculate best (longest) streak across all habits
-        best_streak = 0
-        for habit in habits:
-            streak_info = self.streak_service.get_streak_info(habit.id)
-            longest = streak_info.get(
-                "longest_streak", streak_info.get("current_streak", 0)
-            )
-            best_streak = max(best_streak, longest)
+        best_streak = overview["best_streak"]
 
         self.best_streak_label.setText(
             f"{best_streak} day{'' if best_streak == 1 else 's'}"
@@ -1526,25 +1531,15 @@ class DashboardContentView(QWidget):
             if item.widget():
                 item.widget().deleteLater()
 
-        habits = self.habit_service.get_all_habits()
-        today = datetime.now()
         days = ["MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"]
 
-        for i in range(7):
-            date = today - timedelta(days=6 - i)
-            date_str = date.strftime("%Y-%m-%d")
+        for entry in self.stats_service.get_daily_summary(7):
+            date = datetime.strptime(entry["day"], "%Y-%m-%d")
             day_name = days[date.weekday()]
 
-            completed_count = 0
-            if habits:
-                for habit in habits:
-                    if self.habit_service.is_habit_completed_on_date(
-                        habit.id, date_str
-                    ):
-                        completed_count += 1
-
+            active = entry["active_habit_count"]
             percentage = (
-                int((completed_count / len(habits)) * 100) if len(habits) > 0 else 0
+                int((entry["due_completed_count"] / active) * 100) if active > 0 else 0
             )
 
             day_card = WeekDayCard(day_name, percentage, date.day)
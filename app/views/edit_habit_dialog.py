@@ -16,8 +16,14 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 from app.services.habit_service import get_habit_service
-from app.utils.constants import FREQUENCY_DAILY, FREQUENCY_WEEKLY, CATEGORIES
+from app.services.reminder_service import get_reminder_service, normalize_reminder_time
+from app.utils.constants import CATEGORIES
+from app.utils.dates import parse_date
 from app.themes import get_theme_manager
+from app.widgets.schedule_picker import SchedulePicker
+
+# Height of the dialog with the schedule presets; the custom editor adds to it
+DIALOG_HEIGHT = 800
 
 
 class EditHabitDialog(QDialog):
@@ -27,6 +33,7 @@ class EditHabitDialog(QDialog):
         super().__init__(parent)
         self.habit = habit
         self.habit_service = get_habit_service()
+        self.reminder_service = get_reminder_service()
         self.theme_manager = get_theme_manager()
         self.setup_ui()
 
@@ -43,7 +50,7 @@ class EditHabitDialog(QDialog):
 
         self.setWindowTitle("Edit Habit")
         self.setModal(True)
-        self.setFixedSize(540, 720)
+        self.setFixedSize(540, DIALOG_HEIGHT)
         self.setStyleSheet(f"""
             QDialog {{
                 background-color: {bg_color};
@@ -76,14 +83,14 @@ class EditHabitDialog(QDialog):
 
         # Helper for common field styles
         input_style = f"""
-            QLineEdit, QTextEdit, QComboBox {{
+            QLineEdit, QTextEdit, QComboBox, QSpinBox {{
                 background-color: {input_bg};
                 border: 2px solid {border_color};
                 border-radius: 12px;
                 padding: 10px 16px;
                 color: {text_primary};
             }}
-            QLineEdit:focus, QTextEdit:focus, QComboBox:hover {{
+            QLineEdit:focus, QTextEdit:focus, QComboBox:hover, QSpinBox:focus {{
                 border: 2px solid {colors.PURPLE_500};
             }}
             QComboBox::drop-down {{
@@ -141,20 +148,23 @@ class EditHabitDialog(QDialog):
         layout.addWidget(self.desc_input)
 
         # Frequency - Label removed as requested
-        self.frequency_combo = QComboBox()
-        self.frequency_combo.addItem("📅 Daily", FREQUENCY_DAILY)
-        self.frequency_combo.addItem("📆 Weekly", FREQUENCY_WEEKLY)
-
-        if self.habit.frequency == FREQUENCY_WEEKLY:
-            self.frequency_combo.setCurrentIndex(1)
-        else:
-            self.frequency_combo.setCurrentIndex(0)
+        self.schedule_picker = SchedulePicker(
+            parse_date(self.habit.created_at), input_style=input_style, colors=colors
+        )
+        self.schedule_picker.set_frequency(self.habit.frequency)
+        self.schedule_picker.layout_changed.connect(self._fit_height)
+        layout.addWidget(self.schedule_picker)
 
-        self.frequency_combo.setFont(QFont("SF Pro Text", 14))
-        self.frequency_combo.setFixedHeight(52)
-        self.frequency_combo.setCursor(Qt.PointingHandCursor)
-        self.frequency_combo.setStyleSheet(input_style)
-        layout.addWidget(self.frequency_combo)
+        # Reminder times, comma separated
+        self.reminders_input = QLineEdit()
+        self.reminders_input.setText(
+            ", ".join(r.reminder_time for r in self.reminder_service.get_reminders(self.habit.id))
+        )
+        self.reminders_input.setPlaceholderText("⏰ Reminder times, e.g. 08:00, 20:30")
+        self.reminders_input.setFont(QFont("SF Pro Text", 14))
+        self.reminders_input.setFixedHeight(52)
+        self.reminders_input.setStyleSheet(input_style)
+        layout.addWidget(self.reminders_input)
 
         layout.addStretch()
 
@@ -201,13 +211,14 @@ class EditHabitDialog(QDialog):
         button_layout.addWidget(save_btn)
 
         layout.addLayout(button_layout)
+        self._fit_height()
 
     def save_habit(self):
         """Validate and save the habit changes"""
         name = self.name_input.text().strip()
         description = self.desc_input.toPlainText().strip()
         category = self.category_combo.currentData()
-        frequency = self.frequency_combo.currentData()
+        reminder_times = [t for t in self.reminders_input.text().split(",") if t.strip()]
 
         if not name:
             self.show_error("Validation Error", "Please enter a habit name")
@@ -221,6 +232,24 @@ class EditHabitDialog(QDialog):
             self.name_input.setFocus()
             return
 
+        try:
+            frequency = self.schedule_picker.get_frequency()
+        except ValueError:
+            self.show_error(
+                "Validation Error", "Skip dates must be YYYY-MM-DD, separated by commas"
+            )
+            self.schedule_picker.exclusions_input.setFocus()
+            return
+
+        try:
+            reminder_times = [normalize_reminder_time(t) for t in reminder_times]
+        except ValueError:
+            self.show_error(
+                "Validation Error", "Reminder times must be HH:MM, separated by commas"
+            )
+            self.reminders_input.setFocus()
+            return
+
         try:
             self.habit_service.update_habit(
                 self.habit.id,
@@ -229,10 +258,15 @@ class EditHabitDialog(QDialog):
                 category=category,
                 frequency=frequency,
             )
+            self.reminder_service.set_reminders(self.habit.id, reminder_times)
             self.accept()
         except Exception as e:
             self.show_error("Error", f"Failed to update habit:\n{str(e)}")
 
+    def _fit_height(self):
+        """Grow the dialog while the custom schedule editor is shown"""
+        self.setFixedSize(540, max(DIALOG_HEIGHT, self.sizeHint().height()))
+
     def show_error(self, title, message):
         """Show error message with theme support"""
         colors = self.theme_manager.get_theme()
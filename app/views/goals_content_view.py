@@ -7,6 +7,7 @@ logger = logging.getLogger(__name__)
 
 
 from PySide6.QtWidgets import (
+    QApplication,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
@@ -21,9 +22,10 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QPoint
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QPoint, QThread, Signal
 from PySide6.QtGui import QFont, QColor, QPainter, QPen, QLinearGradient
 from datetime import datetime, timedelta
+from app.services.forecast_service import get_forecast_service
 from app.services.goal_service import get_goal_service
 from app.services.habit_service import get_habit_service
 from app.themes import get_theme_manager
@@ -125,10 +127,11 @@ class CircularProgressGoal(QWidget):
 class GoalCard(QFrame):
     """Premium goal card with animations"""
 
-    def __init__(self, goal, habit, parent=None):
+    def __init__(self, goal, habit, parent=None, days_left=None):
         super().__init__(parent)
         self.goal = goal
         self.habit = habit
+        self.days_left = days_left
         self.parent_view = parent
         self.goal_service = get_goal_service()
         self.setup_ui()
@@ -145,19 +148,18 @@ class GoalCard(QFrame):
 
         # Calculate progress
         current_value = self.goal.current_value
-
-        progress_percent = (
-            current_value / self.goal.target_value * 100
-            if self.goal.target_value > 0
-            else 0
-        )
+        progress_percent = self.goal.get_progress_percentage()
 
         progress_text = QLabel(
             f"{current_value} / {self.goal.target_value} {self._get_unit()}"
         )
 
         # Status-based styling (Senior UX Refresh)
-        days_left = self._calculate_days_left()
+        days_left = (
+            self._calculate_days_left()
+            if self.days_left is None
+            else max(0, self.days_left)
+        )
         theme_manager = get_theme_manager()
         colors = theme_manager.get_theme()
         is_dark = theme_manager.is_dark_mode()
@@ -166,6 +168,10 @@ class GoalCard(QFrame):
             bg_gradient = f"qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 {colors.GREEN_50}, stop:1 {colors.BG_CARD})" if is_dark else "qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #ECFDF5, stop:1 #D1FAE5)"
             border_color = colors.GREEN_500
             status_color = colors.GREEN_500
+        elif self.goal.is_expired:
+            bg_gradient = colors.BG_CARD if is_dark else "#F9FAFB"
+            border_color = colors.BORDER_LIGHT if is_dark else "rgba(0,0,0,0.1)"
+            status_color = colors.TEXT_TERTIARY
         elif days_left <= 3 and progress_percent < 80:
             bg_gradient = f"qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 {colors.RED_50}, stop:1 {colors.BG_CARD})" if is_dark else "qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #FEF2F2, stop:1 #FEE2E2)"
             border_color = colors.RED_500
@@ -232,6 +238,14 @@ class GoalCard(QFrame):
         progress_text_color = colors.PURPLE_600 if is_dark else status_color
         progress_text.setStyleSheet(f"color: {progress_text_color};")
         info_layout.addWidget(progress_text)
+
+        # Forecast, filled in once the background simulation finishes
+        self.forecast_label = None
+        if not self.goal.is_completed and not self.goal.is_expired:
+            self.forecast_label = QLabel("🔮 Forecasting…")
+            self.forecast_label.setFont(QFont("SF Pro Text", 12))
+            self.forecast_label.setStyleSheet(f"color: {colors.TEXT_SECONDARY};")
+            info_layout.addWidget(self.forecast_label)
         top_row.addLayout(info_layout, 1)
 
         # Right: Actions
@@ -343,6 +357,16 @@ class GoalCard(QFrame):
                     padding: 0px 16px;
                 }}
             """)
+        elif self.goal.is_expired:
+            status_badge.setText("⌛ Expired")
+            status_badge.setStyleSheet(f"""
+                QLabel {{
+                    background-color: {colors.TEXT_TERTIARY if is_dark else "#9CA3AF"};
+                    color: white;
+                    border-radius: 12px;
+                    padding: 0px 16px;
+                }}
+            """)
         elif days_left <= 0:
             status_badge.setText("⏰ Overdue")
             status_badge.setStyleSheet(f"""
@@ -399,7 +423,7 @@ class GoalCard(QFrame):
         started_label.setStyleSheet(f"color: {colors.TEXT_TERTIARY};")
         date_layout.addWidget(started_label)
 
-        if not self.goal.is_completed:
+        if not self.goal.is_completed and not self.goal.is_expired:
             remaining_label = QLabel(f"{days_left} days remaining")
             remaining_label.setFont(QFont("SF Pro Text", 11, QFont.Bold))
             remaining_color = colors.PURPLE_400 if is_dark else status_color
@@ -412,16 +436,27 @@ class GoalCard(QFrame):
 
     def _calculate_days_left(self):
         """Calculate days left for goal"""
-        # Assuming 30 days for streak goals
-        if hasattr(self.goal, "created_at"):
-            try:
-                created = datetime.strptime(self.goal.created_at.split()[0], "%Y-%m-%d")
-                target_date = created + timedelta(days=30)
-                days_left = (target_date - datetime.now()).days
-                return max(0, days_left)
-            except Exception:
-                return 30
-        return 30
+        try:
+            return max(0, (self.goal.get_deadline() - datetime.now().date()).days)
+        except Exception:
+            return 30
+
+    def set_forecast(self, forecast):
+        """Show the simulated ETA and chance of finishing by the deadline"""
+        if self.forecast_label is None:
+            return
+        if not forecast:
+            self.forecast_label.setText("🔮 No forecast available")
+            return
+
+        chance = f"{forecast['probability'] * 100:.0f}% chance by deadline"
+        if forecast["eta"] is None:
+            self.forecast_label.setText(f"🔮 Unlikely within a year • {chance}")
+        elif forecast["eta_days"] == 0:
+            self.forecast_label.setText(f"🔮 ETA today • {chance}")
+        else:
+            eta = datetime.strptime(forecast["eta"], "%Y-%m-%d").strftime("%b %d")
+            self.forecast_label.setText(f"🔮 ETA {eta} • {chance}")
 
     def _get_unit(self):
         """Get unit for goal type"""
@@ -700,6 +735,24 @@ class AddGoalDialog(QDialog):
         }
 
 
+class GoalForecastWorker(QThread):
+    """Runs goal forecasts off the UI thread"""
+
+    forecasts_ready = Signal(object)
+
+    def __init__(self, goals, parent=None):
+        super().__init__(parent)
+        self.goals = goals
+
+    def run(self):
+        try:
+            forecasts = get_forecast_service().get_goal_forecasts(self.goals)
+        except Exception as e:
+            logger.error(f"Error forecasting goals: {e}")
+            forecasts = {}
+        self.forecasts_ready.emit(forecasts)
+
+
 class GoalsContentView(QWidget):
     """Premium Goals & Milestones View"""
 
@@ -708,7 +761,12 @@ class GoalsContentView(QWidget):
         self.main_window = parent
         self.goal_service = get_goal_service()
         self.habit_service = get_habit_service()
+        self.forecast_service = get_forecast_service()
         self.theme_manager = get_theme_manager()
+        self.goal_cards = {}
+        self._forecast_workers = []
+        self._queued_forecast_goals = None
+        QApplication.instance().aboutToQuit.connect(self._wait_for_forecasts)
         self.setup_ui()
         self.load_goals()
 
@@ -882,10 +940,11 @@ class GoalsContentView(QWidget):
             item = self.content_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
+        self.goal_cards = {}
 
-        goals = self.goal_service.get_all_goals(include_completed=True)
+        entries = self.goal_service.get_goals_with_habits(include_completed=True)
 
-        if not goals:
+        if not entries:
             # Modern Empty State
             is_dark = self.theme_manager.is_dark_mode()
             colors = self.theme_manager.get_theme()
@@ -976,9 +1035,12 @@ class GoalsContentView(QWidget):
             self.content_layout.addStretch()
             return
 
-        # Separate active and completed
-        active_goals = [g for g in goals if not g.is_completed]
-        completed_goals = [g for g in goals if g.is_completed]
+        # Separate active, completed and expired
+        active_goals = [
+            e for e in entries if not e["goal"].is_completed and not e["goal"].is_expired
+        ]
+        completed_goals = [e for e in entries if e["goal"].is_completed]
+        expired_goals = [e for e in entries if e["goal"].is_expired]
 
         # Active goals section
         if active_goals:
@@ -989,11 +1051,12 @@ class GoalsContentView(QWidget):
             active_header.setStyleSheet(f"color: {colors.TEXT_PRIMARY}; margin-top: 10px;")
             self.content_layout.addWidget(active_header)
 
-            for goal in active_goals:
-                habit = self.habit_service.get_habit_by_id(goal.habit_id)
-                if habit:
-                    card = GoalCard(goal, habit, self)
-                    self.content_layout.addWidget(card)
+            for entry in active_goals:
+                card = GoalCard(entry["goal"], entry["habit"], self, entry["days_left"])
+                self.content_layout.addWidget(card)
+                self.goal_cards[entry["goal"].id] = card
+
+            self._start_goal_forecasts([entry["goal"] for entry in active_goals])
 
         # Completed goals section
         if completed_goals:
@@ -1005,14 +1068,67 @@ class GoalsContentView(QWidget):
             completed_header.setStyleSheet(f"color: {colors.GREEN_500};")
             self.content_layout.addWidget(completed_header)
 
-            for goal in completed_goals:
-                habit = self.habit_service.get_habit_by_id(goal.habit_id)
-                if habit:
-                    card = GoalCard(goal, habit, self)
-                    self.content_layout.addWidget(card)
+            for entry in completed_goals:
+                card = GoalCard(entry["goal"], entry["habit"], self, entry["days_left"])
+                self.content_layout.addWidget(card)
+
+        # Expired goals section
+        if expired_goals:
+            self.content_layout.addSpacing(32)
+            colors = self.theme_manager.get_theme()
+
+            expired_header = QLabel(f"⌛ Expired Goals ({len(expired_goals)})")
+            expired_header.setFont(QFont("SF Pro Display", 22, QFont.Bold))
+            expired_header.setStyleSheet(f"color: {colors.TEXT_SECONDARY};")
+            self.content_layout.addWidget(expired_header)
+
+            for entry in expired_goals:
+                card = GoalCard(entry["goal"], entry["habit"], self, entry["days_left"])
+                self.content_layout.addWidget(card)
 
         self.content_layout.addStretch()
 
+    def _start_goal_forecasts(self, goals):
+        """Show cached goal forecasts and simulate the rest in the background"""
+        # Only goals that can still be reached get a forecast
+        goals = [goal for goal in goals if not goal.is_completed and not goal.is_expired]
+        cached = self.forecast_service.get_cached_goal_forecasts(goals)
+        self._apply_goal_forecasts(cached)
+
+        missing = [goal for goal in goals if goal.id not in cached]
+        if not missing:
+            return
+
+        # One simulation at a time; the latest request runs when it's done
+        if any(worker.isRunning() for worker in self._forecast_workers):
+            self._queued_forecast_goals = goals
+            return
+
+        worker = GoalForecastWorker(missing)
+        worker.forecasts_ready.connect(self._apply_goal_forecasts)
+        worker.finished.connect(lambda: self._on_forecast_worker_finished(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._forecast_workers.append(worker)
+        worker.start()
+
+    def _on_forecast_worker_finished(self, worker):
+        self._forecast_workers.remove(worker)
+        goals, self._queued_forecast_goals = self._queued_forecast_goals, None
+        if goals is not None:
+            self._start_goal_forecasts(goals)
+
+    def _wait_for_forecasts(self):
+        """Let running forecast workers finish before the app exits"""
+        for worker in list(self._forecast_workers):
+            worker.wait()
+
+    def _apply_goal_forecasts(self, forecasts):
+        """Fill forecasts into the cards currently shown"""
+        for goal_id, forecast in forecasts.items():
+            card = self.goal_cards.get(goal_id)
+            if card is not None:
+                card.set_forecast(forecast)
+
     def show_add_goal_dialog(self):
         """Show dialog to add new goal - WITH DEBUG LOGGING"""
         logger.info("\n" + "=" * 50)
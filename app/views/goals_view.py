@@ -27,9 +27,11 @@ from app.services.habit_service import get_habit_service
 class GoalCard(QFrame):
     """Card displaying a single goal"""
 
-    def __init__(self, goal, parent=None):
+    def __init__(self, goal, parent=None, habit=None, days_left=None):
         super().__init__(parent)
         self.goal = goal
+        self.habit = habit
+        self.days_left = days_left
         self.parent_view = parent
         self.habit_service = get_habit_service()
         self.setup_ui()
@@ -43,6 +45,9 @@ class GoalCard(QFrame):
         if self.goal.is_completed:
             border_color = "#10B981"
             bg_color = "#D1FAE5"
+        elif self.goal.is_expired:
+            border_color = "#6B7280"
+            bg_color = "#F9FAFB"
         elif progress >= 75:
             border_color = "#F59E0B"
             bg_color = "#FEF3C7"
@@ -85,7 +90,7 @@ class GoalCard(QFrame):
         desc_layout.addWidget(desc_text)
 
         if self.goal.habit_id:
-            habit = self.habit_service.get_habit_by_id(self.goal.habit_id)
+            habit = self.habit or self.habit_service.get_habit_by_id(self.goal.habit_id)
             if habit:
                 habit_label = QLabel(f"Habit: {habit.name}")
                 habit_label.setFont(QFont("Inter", 11))
@@ -152,9 +157,11 @@ class GoalCard(QFrame):
         start_label.setStyleSheet("color: #6B7280; background: transparent;")
         footer_layout.addWidget(start_label)
 
-        if self.goal.deadline:
-            deadline_date = datetime.strptime(self.goal.deadline, "%Y-%m-%d")
-            days_left = (deadline_date - datetime.now()).days
+        if self.goal.deadline and not self.goal.is_expired:
+            days_left = self.days_left
+            if days_left is None:
+                deadline_date = datetime.strptime(self.goal.deadline, "%Y-%m-%d")
+                days_left = (deadline_date - datetime.now()).days
 
             if days_left > 0:
                 deadline_label = QLabel(f"⏰ {days_left} days left")
@@ -181,6 +188,18 @@ class GoalCard(QFrame):
                 }
             """)
             footer_layout.addWidget(completed_label)
+        elif self.goal.is_expired:
+            expired_label = QLabel("⌛ Expired")
+            expired_label.setFont(QFont("Inter", 11, QFont.Bold))
+            expired_label.setStyleSheet("""
+                QLabel {
+                    color: #4B5563;
+                    background-color: #E5E7EB;
+                    padding: 4px 12px;
+                    border-radius: 8px;
+                }
+            """)
+            footer_layout.addWidget(expired_label)
 
         layout.addLayout(footer_layout)
 
@@ -535,9 +554,9 @@ class GoalsView(QDialog):
 
         self.goal_service.update_all_goals_progress()
 
-        all_goals = self.goal_service.get_all_goals(include_completed=True)
+        entries = self.goal_service.get_goals_with_habits(include_completed=True)
 
-        if not all_goals:
+        if not entries:
             empty = QLabel(
                 "No goals yet!\nClick '+ New Goal' to create your first goal."
             )
@@ -547,8 +566,11 @@ class GoalsView(QDialog):
             self.content_layout.addWidget(empty)
             return
 
-        active_goals = [g for g in all_goals if not g.is_completed]
-        completed_goals = [g for g in all_goals if g.is_completed]
+        active_goals = [
+            e for e in entries if not e["goal"].is_completed and not e["goal"].is_expired
+        ]
+        completed_goals = [e for e in entries if e["goal"].is_completed]
+        expired_goals = [e for e in entries if e["goal"].is_expired]
 
         if active_goals:
             active_label = QLabel(f"🎯 Active Goals ({len(active_goals)})")
@@ -556,8 +578,10 @@ class GoalsView(QDialog):
             active_label.setStyleSheet("color: #111827; background: transparent;")
             self.content_layout.addWidget(active_label)
 
-            for goal in active_goals:
-                goal_card = GoalCard(goal, self)
+            for entry in active_goals:
+                goal_card = GoalCard(
+                    entry["goal"], self, entry["habit"], entry["days_left"]
+                )
                 self.content_layout.addWidget(goal_card)
 
         if completed_goals:
@@ -568,8 +592,24 @@ class GoalsView(QDialog):
             )
             self.content_layout.addWidget(completed_label)
 
-            for goal in completed_goals:
-                goal_card = GoalCard(goal, self)
+            for entry in completed_goals:
+                goal_card = GoalCard(
+                    entry["goal"], self, entry["habit"], entry["days_left"]
+                )
+                self.content_layout.addWidget(goal_card)
+
+        if expired_goals:
+            expired_label = QLabel(f"⌛ Expired Goals ({len(expired_goals)})")
+            expired_label.setFont(QFont("Inter", 18, QFont.Bold))
+            expired_label.setStyleSheet(
+                "color: #6B7280; background: transparent; margin-top: 16px;"
+            )
+            self.content_layout.addWidget(expired_label)
+
+            for entry in expired_goals:
+                goal_card = GoalCard(
+                    entry["goal"], self, entry["habit"], entry["days_left"]
+                )
                 self.content_layout.addWidget(goal_card)
 
         self.content_layout.addStretch()
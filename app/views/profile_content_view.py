@@ -22,6 +22,7 @@ from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont, QColor
 from app.services.habit_service import get_habit_service
 from app.services.streak_service import get_streak_service
+from app.services.stats_service import get_stats_service
 from app.services.profile_service import get_profile_service
 from app.views.crop_dialog import CropDialog
 from app.utils.image_utils import get_circular_pixmap
@@ -132,6 +133,7 @@ class ProfileContentView(QWidget):
         self.main_window = parent
         self.habit_service = get_habit_service()
         self.streak_service = get_streak_service()
+        self.stats_service = get_stats_service()
         self.profile_service = get_profile_service()
         self.theme_manager = get_theme_manager()
         self.setup_ui()
@@ -505,16 +507,11 @@ class ProfileContentView(QWidget):
                     self.main_window.sidebar.update_profile_avatar(cropped_path)
 
     def _refresh_stats(self):
-        habits = self.habit_service.get_all_habits()
+        overview = self.stats_service.get_overview()
 
-        total_habits = len(habits)
-        total_xp = sum(
-            len(self.habit_service.get_habit_completions(h.id)) for h in habits
-        )
-        best_streak = max(
-            [self.streak_service.get_streak_info(h.id)["current_streak"]
-             for h in habits] + [0]
-        )
+        total_habits = overview["total_habits"]
+        total_xp = overview["total_completions"]
+        best_streak = overview["max_current_streak"]
 
         # Clear previous cards
         while self.stats_row.count():
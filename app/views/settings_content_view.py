@@ -22,7 +22,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QTime, QPropertyAnimation, QEasingCurve, Property
 from PySide6.QtGui import QFont, QColor, QPainter, QLinearGradient
-from datetime import datetime
+from datetime import datetime, timedelta
 from app.services.settings_service import get_settings_service
 
 
@@ -469,6 +469,23 @@ class SettingsContentView(QWidget):
         )
         self.content_layout.addWidget(import_card)
 
+        # Rebuild statistics
+        rebuild_btn = QPushButton("🔄 Rebuild Stats")
+        rebuild_btn.setFont(QFont("SF Pro Text", 14, QFont.Bold))
+        rebuild_btn.setFixedHeight(48)
+        rebuild_btn.setFixedWidth(200)
+        rebuild_btn.setCursor(Qt.PointingHandCursor)
+        rebuild_btn.setStyleSheet(primary_btn_style)
+        rebuild_btn.clicked.connect(self.rebuild_statistics)
+
+        rebuild_card = SettingCard(
+            "📊",
+            "Rebuild Statistics",
+            "Recompute the cached daily summaries from your completion history",
+            rebuild_btn,
+        )
+        self.content_layout.addWidget(rebuild_card)
+
         # SECTION: Danger Zone
         self.content_layout.addSpacing(12)
         self.add_section_header(
@@ -789,6 +806,11 @@ class SettingsContentView(QWidget):
                             "current_value": goal.current_value,
                             "is_completed": goal.is_completed,
                             "created_at": goal.created_at,
+                            "description": goal.description,
+                            "start_date": goal.start_date,
+                            "deadline": goal.deadline,
+                            "completed_date": goal.completed_date,
+                            "expired_at": goal.expired_at,
                         }
                     )
             except Exception:
@@ -854,6 +876,8 @@ class SettingsContentView(QWidget):
 
             import json
             from app.db.database import get_db_connection
+            from app.db.schema import rebuild_goal_progress
+            from app.models.goal import DEFAULT_GOAL_DAYS
 
             with open(file_path, "r") as f:
                 data = json.load(f)
@@ -900,10 +924,18 @@ class SettingsContentView(QWidget):
                 )
 
             for goal in data.get("goals", []):
+                # Older exports lack these; goals count from their creation day
+                created_day = (goal.get("created_at") or datetime.now().strftime("%Y-%m-%d"))[:10]
+                start_date = goal.get("start_date") or created_day
+                deadline = goal.get("deadline") or (
+                    datetime.strptime(start_date[:10], "%Y-%m-%d")
+                    + timedelta(days=DEFAULT_GOAL_DAYS)
+                ).strftime("%Y-%m-%d")
                 cursor.execute(
                     """
-                    INSERT INTO goals (id, habit_id, goal_type, target_value, current_value, is_completed, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    INSERT INTO goals (id, habit_id, goal_type, target_value, current_value, is_completed,
+                                       created_at, description, start_date, deadline, completed_date, expired_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                     (
                         goal["id"],
@@ -913,9 +945,18 @@ class SettingsContentView(QWidget):
                         goal["current_value"],
                         goal["is_completed"],
                         goal["created_at"],
+                        goal.get("description") or goal["goal_type"].replace("_", " ").title(),
+                        start_date,
+                        deadline,
+                        goal.get("completed_date"),
+                        goal.get("expired_at"),
                     ),
                 )
 
+            # Logs went in before the goals, so the trigger-kept counters
+            # start from the file's values; recount them
+            rebuild_goal_progress(cursor)
+
             for setting in data.get("settings", []):
                 cursor.execute(
                     """
@@ -928,6 +969,15 @@ class SettingsContentView(QWidget):
             conn.commit()
             conn.close()
 
+            from app.services.cache_service import get_cache_service
+
+            get_cache_service().bump_version()
+
+            # Imported settings bypass SettingsService, so re-read the schedule
+            from app.services.scheduler_service import get_scheduler_service
+
+            get_scheduler_service().reload_settings()
+
             msg = QMessageBox(self)
             msg.setWindowTitle("Import Successful")
             msg.setText("✅ Data imported successfully!\n\nPlease restart the app to see changes.")
@@ -945,6 +995,30 @@ class SettingsContentView(QWidget):
             self._style_msgbox(err_msg)
             err_msg.exec()
 
+    def rebuild_statistics(self):
+        """Rebuild cached statistics tables"""
+        try:
+            from app.services.stats_service import get_stats_service
+
+            get_stats_service().rebuild_daily_summary()
+
+            msg = QMessageBox(self)
+            msg.setWindowTitle("Statistics Rebuilt")
+            msg.setText("✅ Statistics rebuilt successfully!")
+            msg.setIcon(QMessageBox.Information)
+            msg.setStandardButtons(QMessageBox.Ok)
+            self._style_msgbox(msg)
+            msg.exec()
+
+        except Exception as e:
+            err_msg = QMessageBox(self)
+            err_msg.setWindowTitle("Error")
+            err_msg.setText(f"Failed to rebuild statistics: {str(e)}")
+            err_msg.setIcon(QMessageBox.Critical)
+            err_msg.setStandardButtons(QMessageBox.Ok)
+            self._style_msgbox(err_msg)
+            err_msg.exec()
+
     def view_trash(self):
         """View deleted habits in trash"""
         try:
@@ -1028,6 +1102,10 @@ class SettingsContentView(QWidget):
             conn.commit()
             conn.close()
 
+            from app.services.cache_service import get_cache_service
+
+            get_cache_service().bump_version()
+
             msg3 = QMessageBox(self)
             msg3.setWindowTitle("Data Cleared")
             msg3.setText("✅ All data has been cleared!\n\nThe app will restart with fresh data.")
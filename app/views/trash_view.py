@@ -18,6 +18,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QColor
 from app.services.habit_service import get_habit_service
+from app.models.recurrence import RecurrenceRule
+from app.utils.dates import parse_date
 
 
 class TrashDialog(QDialog):
@@ -247,7 +249,10 @@ class TrashDialog(QDialog):
         if habit["category"]:
             details_parts.append(f"📂 {habit['category']}")
         if habit["frequency"]:
-            details_parts.append(f"🔄 {habit['frequency']}")
+            rule = RecurrenceRule.from_frequency(
+                habit["frequency"], parse_date(habit["created_at"])
+            )
+            details_parts.append(f"🔄 {rule.describe()}")
         details_parts.append(f"✅ {habit['completion_count']} completions")
 
         details_label = QLabel(" • ".join(details_parts))
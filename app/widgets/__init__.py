@@ -1,3 +1,6 @@
 """Widgets module"""
 from .theme_toggle import ThemeToggleButton
-__all__ = ['ThemeToggleButton']
+from .calendar_heatmap import CalendarHeatmap
+from .correlation_matrix import CorrelationMatrix
+from .schedule_picker import SchedulePicker
+__all__ = ['ThemeToggleButton', 'CalendarHeatmap', 'CorrelationMatrix', 'SchedulePicker']
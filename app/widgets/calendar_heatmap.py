@@ -0,0 +1,176 @@
+"""
+Calendar Heatmap
+GitHub-style year grid of daily completion intensity
+"""
+from collections import OrderedDict
+from datetime import date, timedelta
+import math
+
+import numpy as np
+from PySide6.QtWidgets import QWidget, QToolTip
+from PySide6.QtCore import Qt, QEvent, QRectF, QSize
+from PySide6.QtGui import QColor, QFont, QImage, QPainter
+
+CELL = 13
+GAP = 3
+STEP = CELL + GAP
+LEFT = 32
+TOP = 20
+MAX_WEEKS = 54
+
+LIGHT_LEVELS = ["#EBEDF0", "#B2F2E8", "#6EE7D8", "#2DB8A9", "#0F766E"]
+DARK_LEVELS = ["#2C2F3A", "#134E4A", "#0F766E", "#14B8A6", "#5EEAD4"]
+
+
+class CalendarHeatmap(QWidget):
+    """
+    Year heatmap painted from a cached QImage
+
+    Each (year, habit, theme) image is kept and reused until the data
+    passed for it changes, so switching years is a single blit.
+
+    Usage:
+        heatmap = CalendarHeatmap()
+        heatmap.set_data(2026, intensity_array)               # all habits
+        heatmap.set_data(2026, intensity_array, habit_id=3)   # one habit
+    """
+
+    def __init__(self, parent=None, max_cached_images=12):
+        super().__init__(parent)
+        self.year = None
+        self.grid = None
+        self.habit_id = None
+        self.is_dark = False
+        self.max_cached_images = max_cached_images
+        self._images = OrderedDict()
+        self.setFixedSize(self.sizeHint())
+        self.setMouseTracking(True)
+
+    def sizeHint(self):
+        return QSize(LEFT + MAX_WEEKS * STEP, TOP + 7 * STEP)
+
+    def set_data(self, year: int, grid: np.ndarray, habit_id=None, is_dark=False):
+        """Show a year's intensity array (one value per day, NaN = untracked)"""
+        self.year = year
+        self.grid = grid
+        self.habit_id = habit_id
+        self.is_dark = is_dark
+        self.update()
+
+    def clear_cache(self):
+        """Drop all rendered images"""
+        self._images.clear()
+
+    def paintEvent(self, event):
+        if self.grid is None:
+            return
+
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self._get_image())
+        painter.end()
+
+    def event(self, event):
+        if event.type() == QEvent.ToolTip:
+            text = self._tooltip_at(event.pos())
+            if text:
+                QToolTip.showText(event.globalPos(), text, self)
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().event(event)
+
+    def _get_image(self) -> QImage:
+        key = (self.year, self.habit_id, self.is_dark)
+        ratio = self.devicePixelRatioF()
+        cached = self._images.get(key)
+
+        if (
+            cached is not None
+            and cached[1].devicePixelRatio() == ratio
+            and np.array_equal(cached[0], self.grid, equal_nan=True)
+        ):
+            self._images.move_to_end(key)
+            return cached[1]
+
+        image = self._render(ratio)
+        self._images[key] = (self.grid.copy(), image)
+        self._images.move_to_end(key)
+        while len(self._images) > self.max_cached_images:
+            self._images.popitem(last=False)
+        return image
+
+    def _render(self, ratio: float) -> QImage:
+        size = self.sizeHint()
+        image = QImage(
+            int(size.width() * ratio),
+            int(size.height() * ratio),
+            QImage.Format_ARGB32_Premultiplied,
+        )
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.transparent)
+
+        levels = [QColor(c) for c in (DARK_LEVELS if self.is_dark else LIGHT_LEVELS)]
+        untracked = QColor(levels[0])
+        untracked.setAlpha(90)
+        label_color = QColor("#9CA3AF" if self.is_dark else "#6B7280")
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+
+        offset = date(self.year, 1, 1).weekday()
+        for index, value in enumerate(self.grid):
+            week, weekday = divmod(index + offset, 7)
+            if math.isnan(value):
+                color = untracked
+            elif value <= 0:
+                color = levels[0]
+            else:
+                color = levels[min(int(math.ceil(value * 4)), 4)]
+            painter.setBrush(color)
+            painter.drawRoundedRect(
+                QRectF(LEFT + week * STEP, TOP + weekday * STEP, CELL, CELL), 3, 3
+            )
+
+        painter.setPen(label_color)
+        painter.setFont(QFont("SF Pro Text", 8))
+        for weekday, name in ((0, "Mon"), (2, "Wed"), (4, "Fri")):
+            painter.drawText(
+                QRectF(0, TOP + weekday * STEP, LEFT - 6, CELL),
+                Qt.AlignRight | Qt.AlignVCenter,
+                name,
+            )
+        for month in range(1, 13):
+            first = date(self.year, month, 1)
+            week = ((first - date(self.year, 1, 1)).days + offset) // 7
+            painter.drawText(
+                QRectF(LEFT + week * STEP, 0, 4 * STEP, TOP - 4),
+                Qt.AlignLeft | Qt.AlignBottom,
+                first.strftime("%b"),
+            )
+
+        painter.end()
+        return image
+
+    def _tooltip_at(self, pos):
+        if self.grid is None:
+            return None
+
+        week = int((pos.x() - LEFT) // STEP)
+        weekday = int((pos.y() - TOP) // STEP)
+        if pos.x() < LEFT or pos.y() < TOP or not 0 <= weekday < 7:
+            return None
+
+        index = week * 7 + weekday - date(self.year, 1, 1).weekday()
+        if not 0 <= index < len(self.grid):
+            return None
+
+        day = date(self.year, 1, 1) + timedelta(days=index)
+        value = self.grid[index]
+        label = day.strftime("%a, %b %d %Y")
+        if math.isnan(value):
+            return f"{label} • not tracked"
+        if self.habit_id is not None:
+            return f"{label} • {'Completed ✅' if value > 0 else 'Missed'}"
+        return f"{label} • {int(round(value * 100))}% of habits"
@@ -0,0 +1,149 @@
+"""
+Correlation Matrix
+Painted habits x habits grid of co-completion correlation
+"""
+import numpy as np
+from PySide6.QtWidgets import QWidget, QToolTip
+from PySide6.QtCore import Qt, QEvent, QRectF, QSize
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QImage, QPainter
+
+LABEL_WIDTH = 140
+MAX_CELL = 32
+MIN_CELL = 2
+MAX_GRID = 480
+
+POSITIVE = QColor("#14B8A6")
+NEGATIVE = QColor("#F43F5E")
+
+
+class CorrelationMatrix(QWidget):
+    """
+    Diverging colour grid of phi coefficients, painted from a cached QImage
+
+    Teal cells mean two habits tend to be completed on the same days,
+    red cells mean one tends to be skipped when the other is done.
+
+    Usage:
+        matrix = CorrelationMatrix()
+        matrix.set_data(names, phi, is_dark=False)
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.names = []
+        self.phi = np.zeros((0, 0))
+        self.is_dark = False
+        self._image = None
+        self.setMouseTracking(True)
+
+    def set_data(self, names, phi: np.ndarray, is_dark=False):
+        """Show a square matrix of correlations (-1..1) for the named habits"""
+        self.names = list(names)
+        self.phi = phi
+        self.is_dark = is_dark
+        self._image = None
+        self.setFixedSize(self.sizeHint())
+        self.update()
+
+    def cell_size(self) -> int:
+        if not self.names:
+            return MAX_CELL
+        return max(MIN_CELL, min(MAX_CELL, MAX_GRID // len(self.names)))
+
+    def sizeHint(self):
+        side = self.cell_size() * len(self.names)
+        return QSize(LABEL_WIDTH + side + 1, side + 1)
+
+    def paintEvent(self, event):
+        if not self.names:
+            return
+
+        ratio = self.devicePixelRatioF()
+        if self._image is None or self._image.devicePixelRatio() != ratio:
+            self._image = self._render(ratio)
+
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self._image)
+        painter.end()
+
+    def event(self, event):
+        if event.type() == QEvent.ToolTip:
+            text = self._tooltip_at(event.pos())
+            if text:
+                QToolTip.showText(event.globalPos(), text, self)
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().event(event)
+
+    def _render(self, ratio: float) -> QImage:
+        size = self.sizeHint()
+        image = QImage(
+            int(size.width() * ratio),
+            int(size.height() * ratio),
+            QImage.Format_ARGB32_Premultiplied,
+        )
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.transparent)
+
+        cell = self.cell_size()
+        base = QColor("#2C2F3A" if self.is_dark else "#F3F4F6")
+
+        # Blend from the neutral base towards teal/red by |phi|, as one
+        # RGB pixel per pair, then scale that up to the cell size
+        n = len(self.names)
+        strength = np.clip(np.abs(self.phi), 0, 1)
+        np.fill_diagonal(strength, 0)
+        base_rgb = np.array([base.red(), base.green(), base.blue()], dtype=np.float64)
+        target = np.where(
+            (self.phi >= 0)[..., None],
+            np.array([POSITIVE.red(), POSITIVE.green(), POSITIVE.blue()]),
+            np.array([NEGATIVE.red(), NEGATIVE.green(), NEGATIVE.blue()]),
+        )
+        rgb = base_rgb + (target - base_rgb) * strength[..., None]
+        pixels = np.empty((n, n, 4), dtype=np.uint8)
+        pixels[..., :3] = rgb[..., ::-1].round()  # QImage ARGB32 is BGRA in memory
+        pixels[..., 3] = 255
+        grid = QImage(pixels.data, n, n, 4 * n, QImage.Format_ARGB32)
+
+        painter = QPainter(image)
+        painter.drawImage(QRectF(LABEL_WIDTH, 0, n * cell, n * cell), grid)
+
+        # Thin gaps between cells when they are large enough to show them
+        if cell > 6:
+            painter.setCompositionMode(QPainter.CompositionMode_Clear)
+            side = n * cell
+            for k in range(1, n + 1):
+                edge = k * cell - 1
+                painter.fillRect(QRectF(LABEL_WIDTH + edge, 0, 1, side), Qt.transparent)
+                painter.fillRect(QRectF(LABEL_WIDTH, edge, side, 1), Qt.transparent)
+            painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+
+        # Row labels, skipped when rows are too thin to read
+        if cell >= 10:
+            painter.setPen(QColor("#9CA3AF" if self.is_dark else "#6B7280"))
+            font = QFont("SF Pro Text", min(11, cell - 3))
+            painter.setFont(font)
+            metrics = QFontMetrics(font)
+            for i, name in enumerate(self.names):
+                painter.drawText(
+                    QRectF(0, i * cell, LABEL_WIDTH - 8, cell),
+                    Qt.AlignRight | Qt.AlignVCenter,
+                    metrics.elidedText(name, Qt.ElideRight, LABEL_WIDTH - 8),
+                )
+
+        painter.end()
+        return image
+
+    def _tooltip_at(self, pos):
+        if not self.names or pos.x() < LABEL_WIDTH:
+            return None
+
+        cell = self.cell_size()
+        i = int(pos.y() // cell)
+        j = int((pos.x() - LABEL_WIDTH) // cell)
+        if not (0 <= i < len(self.names) and 0 <= j < len(self.names)) or i == j:
+            return None
+
+        return f"{self.names[i]} × {self.names[j]}: {self.phi[i, j]:+.2f}"
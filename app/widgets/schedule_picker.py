@@ -0,0 +1,195 @@
+"""
+Schedule Picker
+Frequency presets plus a custom recurrence editor for the habit dialogs
+"""
+from datetime import date, datetime
+
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QComboBox,
+    QPushButton,
+    QSpinBox,
+    QLineEdit,
+    QLabel,
+)
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QFont
+
+from app.models.recurrence import ALL_WEEKDAYS, WEEKDAY_NAMES, RecurrenceRule
+from app.utils.constants import (
+    FREQUENCY_DAILY,
+    FREQUENCY_WEEKLY,
+    FREQUENCY_WEEKDAYS,
+    FREQUENCY_WEEKENDS,
+)
+
+CUSTOM = "custom"
+
+
+class SchedulePicker(QWidget):
+    """
+    Picks a habit frequency string
+
+    The combo offers the common presets; "Custom" reveals weekday toggles,
+    an every-N-days interval, a day of the month and dates to skip, which
+    are combined into a RecurrenceRule.
+
+    Usage:
+        picker = SchedulePicker(anchor=created, input_style=style, colors=colors)
+        picker.set_frequency(habit.frequency)
+        frequency = picker.get_frequency()   # ValueError on bad skip dates
+    """
+
+    layout_changed = Signal()
+
+    def __init__(self, anchor: date, input_style="", colors=None, parent=None):
+        super().__init__(parent)
+        self.anchor = anchor
+        self.colors = colors
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(12)
+
+        # Weekly habits are due on the weekday they were created
+        weekly = RecurrenceRule.from_frequency(FREQUENCY_WEEKLY, anchor)
+        self.combo = QComboBox()
+        self.combo.addItem("📅 Daily", FREQUENCY_DAILY)
+        self.combo.addItem(f"📆 {weekly.describe()}", FREQUENCY_WEEKLY)
+        self.combo.addItem("💼 Weekdays", FREQUENCY_WEEKDAYS)
+        self.combo.addItem("🏖️ Weekends", FREQUENCY_WEEKENDS)
+        self.combo.addItem("🗓️ Custom…", CUSTOM)
+        self.combo.setFont(QFont("SF Pro Text", 14))
+        self.combo.setFixedHeight(52)
+        self.combo.setCursor(Qt.PointingHandCursor)
+        self.combo.setStyleSheet(input_style)
+        layout.addWidget(self.combo)
+
+        self.custom_panel = QWidget()
+        custom_layout = QVBoxLayout(self.custom_panel)
+        custom_layout.setContentsMargins(0, 0, 0, 0)
+        custom_layout.setSpacing(10)
+
+        days_layout = QHBoxLayout()
+        days_layout.setSpacing(6)
+        self.day_buttons = []
+        for name in WEEKDAY_NAMES:
+            button = QPushButton(name)
+            button.setCheckable(True)
+            button.setChecked(True)
+            button.setFont(QFont("SF Pro Text", 12, QFont.Bold))
+            button.setFixedHeight(36)
+            button.setCursor(Qt.PointingHandCursor)
+            button.setStyleSheet(self._day_button_style())
+            days_layout.addWidget(button)
+            self.day_buttons.append(button)
+        custom_layout.addLayout(days_layout)
+
+        numbers_layout = QHBoxLayout()
+        numbers_layout.setSpacing(10)
+
+        self.interval_spin = QSpinBox()
+        self.interval_spin.setRange(1, 365)
+        self.interval_spin.setPrefix("Every ")
+        self.interval_spin.setSuffix(" day(s)")
+        self.interval_spin.setFont(QFont("SF Pro Text", 13))
+        self.interval_spin.setFixedHeight(44)
+        self.interval_spin.setStyleSheet(input_style)
+        numbers_layout.addWidget(self.interval_spin, 1)
+
+        self.month_day_spin = QSpinBox()
+        self.month_day_spin.setRange(0, 31)
+        self.month_day_spin.setPrefix("Day ")
+        self.month_day_spin.setSpecialValueText("Any day of month")
+        self.month_day_spin.setFont(QFont("SF Pro Text", 13))
+        self.month_day_spin.setFixedHeight(44)
+        self.month_day_spin.setStyleSheet(input_style)
+        numbers_layout.addWidget(self.month_day_spin, 1)
+        custom_layout.addLayout(numbers_layout)
+
+        self.exclusions_input = QLineEdit()
+        self.exclusions_input.setPlaceholderText("Skip dates, e.g. 2026-12-25, 2027-01-01")
+        self.exclusions_input.setFont(QFont("SF Pro Text", 13))
+        self.exclusions_input.setFixedHeight(44)
+        self.exclusions_input.setStyleSheet(input_style)
+        custom_layout.addWidget(self.exclusions_input)
+
+        self.hint_label = QLabel("Every-N-day counts start from the habit's creation date")
+        self.hint_label.setFont(QFont("SF Pro Text", 11))
+        if colors is not None:
+            self.hint_label.setStyleSheet(
+                f"color: {colors.TEXT_SECONDARY}; background: transparent;"
+            )
+        custom_layout.addWidget(self.hint_label)
+
+        layout.addWidget(self.custom_panel)
+        self.custom_panel.setVisible(False)
+
+        self.combo.currentIndexChanged.connect(self._on_preset_changed)
+
+    def set_frequency(self, frequency):
+        """Show a stored frequency, as a preset when it is one"""
+        index = self.combo.findData(frequency or FREQUENCY_DAILY)
+        if index >= 0 and frequency != CUSTOM:
+            self.combo.setCurrentIndex(index)
+            return
+
+        rule = RecurrenceRule.from_frequency(frequency, self.anchor)
+        for i, button in enumerate(self.day_buttons):
+            button.setChecked(bool(rule.weekdays >> i & 1))
+        self.interval_spin.setValue(rule.interval_days)
+        self.month_day_spin.setValue(rule.month_day or 0)
+        self.exclusions_input.setText(", ".join(sorted(rule.exclusions)))
+        self.combo.setCurrentIndex(self.combo.findData(CUSTOM))
+
+    def get_frequency(self) -> str:
+        """
+        The chosen frequency string.
+        Raises ValueError when a skip date isn't YYYY-MM-DD.
+        """
+        preset = self.combo.currentData()
+        if preset != CUSTOM:
+            return preset
+
+        weekdays = 0
+        for i, button in enumerate(self.day_buttons):
+            if button.isChecked():
+                weekdays |= 1 << i
+
+        exclusions = set()
+        for value in self.exclusions_input.text().split(","):
+            if value.strip():
+                day = datetime.strptime(value.strip(), "%Y-%m-%d").date()
+                exclusions.add(day.strftime("%Y-%m-%d"))
+
+        rule = RecurrenceRule(
+            weekdays=weekdays or ALL_WEEKDAYS,
+            interval_days=self.interval_spin.value(),
+            month_day=self.month_day_spin.value() or None,
+            exclusions=frozenset(exclusions),
+        )
+        return rule.to_frequency()
+
+    def _on_preset_changed(self):
+        self.custom_panel.setVisible(self.combo.currentData() == CUSTOM)
+        self.layout_changed.emit()
+
+    def _day_button_style(self):
+        if self.colors is None:
+            return ""
+        return f"""
+            QPushButton {{
+                background-color: transparent;
+                color: {self.colors.TEXT_SECONDARY};
+                border: 2px solid {self.colors.BORDER_LIGHT};
+                border-radius: 10px;
+                padding: 0px 4px;
+            }}
+            QPushButton:checked {{
+                background-color: {self.colors.PURPLE_500};
+                color: white;
+                border: 2px solid {self.colors.PURPLE_500};
+            }}
+        """